@@ -428,6 +428,12 @@ CELERY_TASK_SERIALIZER = "json"
 CELERY_RESULT_SERIALIZER = "json"
 CELERY_TIMEZONE = TIME_ZONE
 
+# Outbound notification email gets its own queue so sends are not stuck behind
+# long-running tasks; workers consume it alongside the default queue
+CELERY_TASK_ROUTES = {
+    "risk.notifications.send_notification_email": {"queue": "risk-emails"},
+}
+
 # Celery Beat Schedule - Periodic Tasks
 CELERY_BEAT_SCHEDULE = {
     # Policy acknowledgment reminders - daily at 9:00 AM
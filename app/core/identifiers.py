@@ -4,14 +4,8 @@ from typing import Any, cast
 from django.db import IntegrityError, models, transaction
 
 
-def next_prefixed_identifier(
-    model: type[Any],
-    field_name: str,
-    prefix: str,
-    *,
-    width: int = 4,
-) -> str:
-    """Return the next identifier by incrementing the highest existing suffix."""
+def last_identifier_number(model: type[Any], field_name: str, prefix: str) -> int:
+    """Return the numeric suffix of the highest existing identifier with ``prefix``."""
     lookup = {f"{field_name}__startswith": f"{prefix}-"}
     last_identifier = (
         model.objects.filter(**lookup)
@@ -20,13 +14,23 @@ def next_prefixed_identifier(
         .first()
     )
 
-    next_number = 1
     if last_identifier:
         try:
-            next_number = int(str(last_identifier).rsplit("-", 1)[1]) + 1
+            return int(str(last_identifier).rsplit("-", 1)[1])
         except (IndexError, ValueError):
-            next_number = 1
+            return 0
+    return 0
+
 
+def next_prefixed_identifier(
+    model: type[Any],
+    field_name: str,
+    prefix: str,
+    *,
+    width: int = 4,
+) -> str:
+    """Return the next identifier by incrementing the highest existing suffix."""
+    next_number = last_identifier_number(model, field_name, prefix) + 1
     return f"{prefix}-{next_number:0{width}d}"
 
 
@@ -0,0 +1,33 @@
+"""Tests for the orjson-backed DRF renderer."""
+
+import datetime
+from decimal import Decimal
+
+from django.utils.translation import gettext_lazy
+from rest_framework.renderers import JSONRenderer
+
+from core.renderers import ORJSONRenderer
+
+
+def test_orjson_renderer_matches_drf_json_output():
+    data = {
+        "title": "Risk with\u2028separator",
+        "cost": Decimal("12.50"),
+        "label": gettext_lazy("High"),
+        "created_at": datetime.datetime(2026, 1, 2, 3, 4, 5, 678901, tzinfo=datetime.UTC),
+        "due_date": datetime.date(2026, 2, 1),
+        "risks": [{"id": 1, "score": None}],
+    }
+
+    assert ORJSONRenderer().render(data) == JSONRenderer().render(data)
+
+
+def test_orjson_renderer_defers_indented_output_to_drf():
+    data = {"risks": [1, 2]}
+    media_type = "application/json; indent=4"
+
+    assert ORJSONRenderer().render(data, media_type) == JSONRenderer().render(data, media_type)
+
+
+def test_orjson_renderer_renders_none_as_empty_body():
+    assert ORJSONRenderer().render(None) == b""
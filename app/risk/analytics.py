@@ -349,7 +349,7 @@ class RiskAnalyticsService:
             dict: Heat map data with risk counts by impact/likelihood combination
         """
         # Get the default risk matrix for reference
-        default_matrix = RiskMatrix.objects.filter(is_default=True).first()
+        default_matrix = RiskMatrix.get_default()
         if not default_matrix:
             # Create default 5x5 matrix data
             matrix_size = 5
@@ -364,9 +364,7 @@ class RiskAnalyticsService:
                 heat_map[impact][likelihood] = {"count": 0, "risk_level": "low", "risks": []}
 
         # Populate with actual risk data
-        risks = Risk.objects.select_related("category", "risk_owner").exclude(
-            status__in=["closed", "transferred"]
-        )
+        risks = Risk.objects.for_dashboard().exclude(status__in=["closed", "transferred"])
 
         for risk in risks:
             impact = min(max(1, risk.impact), matrix_size)
@@ -5,3 +5,7 @@ class RiskConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "risk"
     verbose_name = "Risk Management"
+
+    def ready(self):
+        """Import signals when app is ready."""
+        import risk.signals  # noqa
@@ -1,36 +1,182 @@
+import base64
+import binascii
+import json
+import re
+
 import django_filters
-from django.db.models import Q
+from django import forms
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.db.models import F, Q
 from django.utils import timezone
 from django.contrib.auth import get_user_model
-from .models import Risk, RiskCategory, RiskAction
+from rest_framework.exceptions import ValidationError as APIValidationError
+from .models import (
+    RISK_LEVEL_PKS_TIMEOUT,
+    Risk,
+    RiskAction,
+    RiskCategory,
+    risk_level_pks_key,
+)
 
 User = get_user_model()
 
+# Matches the functional index on Risk so score range filters can use it.
+RISK_SCORE = F("impact") * F("likelihood")
+
+# Full risk identifiers as generated by Risk._generate_risk_id, e.g. RISK-2025-0001.
+RISK_ID_RE = re.compile(r"^RISK-\d{4}-\d+$", re.IGNORECASE)
+
+
+def risk_pks_for_levels(levels):
+    """Return the PKs of risks at any of ``levels``, served from cache when possible."""
+    keys = {level: risk_level_pks_key(level) for level in levels}
+    cached = cache.get_many(keys.values())
+    pks = set()
+    missing = []
+    for level, key in keys.items():
+        if key in cached:
+            pks.update(cached[key])
+        else:
+            missing.append(level)
+
+    if missing:
+        by_level = {level: [] for level in missing}
+        for pk, level in Risk.objects.filter(risk_level__in=missing).values_list(
+            "pk", "risk_level"
+        ):
+            by_level[level].append(pk)
+        cache.set_many(
+            {keys[level]: level_pks for level, level_pks in by_level.items()},
+            RISK_LEVEL_PKS_TIMEOUT,
+        )
+        for level_pks in by_level.values():
+            pks.update(level_pks)
+    return pks
+
+
+def _choice_validator(choices):
+    """Build a validator that checks a single value against a frozenset of choices."""
+    allowed = frozenset(value for value, _label in choices)
+
+    def validate(value):
+        if value not in allowed:
+            raise ValidationError(
+                "Select a valid choice. %(value)s is not one of the available choices.",
+                code="invalid_choice",
+                params={"value": value},
+            )
+
+    return validate
+
+
+class ChoiceInFilter(django_filters.BaseInFilter, django_filters.CharFilter):
+    """
+    Comma-separated ``__in`` filter for choice fields.
+
+    Unlike MultipleChoiceFilter it does not build a MultipleChoiceField and
+    widget choices per request; each value is checked with a set lookup.
+    """
+
+    def __init__(self, *args, choices=(), **kwargs):
+        kwargs.setdefault("validators", [_choice_validator(choices)])
+        super().__init__(*args, **kwargs)
+
+
+class CursorField(forms.CharField):
+    """Decode an opaque keyset cursor into its ``{field: value}`` payload."""
+
+    def __init__(self, *args, keys=(), **kwargs):
+        self.keys = tuple(key.lstrip("-") for key in keys)
+        super().__init__(*args, **kwargs)
+
+    def to_python(self, value):
+        value = super().to_python(value)
+        if not value:
+            return None
+        try:
+            raw = base64.urlsafe_b64decode(value + "=" * (-len(value) % 4))
+            payload = json.loads(raw)
+        except (binascii.Error, ValueError):
+            raise ValidationError("Invalid cursor.", code="invalid_cursor")
+        if not isinstance(payload, dict) or not set(self.keys) <= payload.keys():
+            raise ValidationError("Invalid cursor.", code="invalid_cursor")
+        return payload
+
+
+class CursorFilter(django_filters.Filter):
+    field_class = CursorField
+
+
+class KeysetCursorMixin:
+    """
+    Keyset pagination for FilterSets.
+
+    ``KEYSET_ORDERING`` is the ordering cursors are encoded against and must end
+    with ``pk`` so positions are unique. A cursor page is a range seek on that
+    ordering instead of an OFFSET scan, so deep pages cost the same as the first.
+    """
 
-class RiskFilter(django_filters.FilterSet):
+    KEYSET_ORDERING: tuple[str, ...] = ()
+
+    @classmethod
+    def encode_cursor(cls, obj):
+        """Encode the keyset position of ``obj`` as an opaque URL-safe cursor."""
+        payload = {}
+        for ordering in cls.KEYSET_ORDERING:
+            field = ordering.lstrip("-")
+            value = getattr(obj, field)
+            payload[field] = value.isoformat() if hasattr(value, "isoformat") else value
+        raw = json.dumps(payload, separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    def filter_cursor(self, queryset, name, value):
+        """Return rows that sort after the cursor position."""
+        if not value:
+            return queryset
+        opts = queryset.model._meta
+        condition = Q()
+        equal = Q()
+        try:
+            for ordering in self.KEYSET_ORDERING:
+                field = ordering.lstrip("-")
+                model_field = opts.pk if field == "pk" else opts.get_field(field)
+                position = model_field.to_python(value[field])
+                lookup = "lt" if ordering.startswith("-") else "gt"
+                condition |= equal & Q(**{f"{field}__{lookup}": position})
+                equal &= Q(**{field: position})
+        except (ValidationError, TypeError, ValueError):
+            raise APIValidationError({name: ["Invalid cursor."]})
+        return queryset.filter(condition).order_by(*self.KEYSET_ORDERING)
+
+
+class RiskFilter(KeysetCursorMixin, django_filters.FilterSet):
     """
     Advanced filtering for Risk model with multiple criteria support.
     """
 
+    # Backed by the (risk_level, impact, likelihood, id) index, scanned backwards.
+    KEYSET_ORDERING = ("-risk_level", "-impact", "-likelihood", "-pk")
+
     # Risk level filtering (supports multiple values)
-    risk_level = django_filters.MultipleChoiceFilter(
+    risk_level = ChoiceInFilter(
         field_name="risk_level",
         choices=Risk.RISK_LEVELS,
-        help_text="Filter by risk level(s). Supports multiple values.",
+        help_text="Filter by risk level(s). Comma-separated for multiple values.",
     )
 
     # Status filtering (supports multiple values)
-    status = django_filters.MultipleChoiceFilter(
+    status = ChoiceInFilter(
         field_name="status",
         choices=Risk.STATUS_CHOICES,
-        help_text="Filter by risk status(es). Supports multiple values.",
+        help_text="Filter by risk status(es). Comma-separated for multiple values.",
     )
 
     # Treatment strategy filtering
-    treatment_strategy = django_filters.MultipleChoiceFilter(
+    treatment_strategy = ChoiceInFilter(
         field_name="treatment_strategy",
         choices=Risk.TREATMENT_STRATEGIES,
-        help_text="Filter by treatment strategy. Supports multiple values.",
+        help_text="Filter by treatment strategy. Comma-separated for multiple values.",
     )
 
     # Category filtering
@@ -145,6 +291,13 @@ class RiskFilter(django_filters.FilterSet):
         method="filter_search", help_text="Search across risk ID, title, and description."
     )
 
+    # Keyset pagination
+    cursor = CursorFilter(
+        method="filter_cursor",
+        keys=KEYSET_ORDERING,
+        help_text="Opaque cursor from the X-Next-Cursor header of the previous page.",
+    )
+
     class Meta:
         model = Risk
         fields = []  # We define custom fields above
@@ -152,24 +305,19 @@ class RiskFilter(django_filters.FilterSet):
     def filter_risk_score_min(self, queryset, name, value):
         """Filter by minimum risk score (impact * likelihood)."""
         if value is not None:
-            # Use raw SQL for calculated field
-            return queryset.extra(where=["impact * likelihood >= %s"], params=[value])
+            return queryset.alias(risk_score=RISK_SCORE).filter(risk_score__gte=value)
         return queryset
 
     def filter_risk_score_max(self, queryset, name, value):
         """Filter by maximum risk score (impact * likelihood)."""
         if value is not None:
-            # Use raw SQL for calculated field
-            return queryset.extra(where=["impact * likelihood <= %s"], params=[value])
+            return queryset.alias(risk_score=RISK_SCORE).filter(risk_score__lte=value)
         return queryset
 
     def filter_overdue_review(self, queryset, name, value):
         """Filter risks that are overdue for review."""
         if value:
-            today = timezone.now().date()
-            return queryset.filter(next_review_date__lt=today).exclude(
-                next_review_date__isnull=True
-            )
+            return queryset.overdue_for_review()
         elif value is False:
             today = timezone.now().date()
             return queryset.filter(
@@ -204,10 +352,11 @@ class RiskFilter(django_filters.FilterSet):
 
     def filter_has_treatment(self, queryset, name, value):
         """Filter risks with or without treatment strategies."""
+        # treatment_strategy is NOT NULL, so "no strategy" is only ever "".
         if value:
-            return queryset.exclude(treatment_strategy__isnull=True).exclude(treatment_strategy="")
+            return queryset.exclude(treatment_strategy="")
         elif value is False:
-            return queryset.filter(Q(treatment_strategy__isnull=True) | Q(treatment_strategy=""))
+            return queryset.filter(treatment_strategy="")
         return queryset
 
     def filter_my_risks(self, queryset, name, value):
@@ -218,7 +367,15 @@ class RiskFilter(django_filters.FilterSet):
 
     def filter_search(self, queryset, name, value):
         """Search across multiple text fields."""
+        term = value.strip()
+        if RISK_ID_RE.match(term):
+            # A pasted risk ID is a single probe on the unique index.
+            exact = queryset.filter(risk_id=term.upper())
+            if exact.exists():
+                return exact
         if value:
+            # Every column here has an UPPER() trigram index (migration 0004);
+            # keep the list in sync so the OR can still use a bitmap scan.
             return queryset.filter(
                 Q(risk_id__icontains=value)
                 | Q(title__icontains=value)
@@ -229,30 +386,32 @@ class RiskFilter(django_filters.FilterSet):
         return queryset
 
 
-class RiskActionFilter(django_filters.FilterSet):
+class RiskActionFilter(KeysetCursorMixin, django_filters.FilterSet):
     """
     Advanced filtering for RiskAction model with multiple criteria support.
     """
 
+    KEYSET_ORDERING = ("due_date", "pk")
+
     # Status filtering (supports multiple values)
-    status = django_filters.MultipleChoiceFilter(
+    status = ChoiceInFilter(
         field_name="status",
         choices=RiskAction.STATUS_CHOICES,
-        help_text="Filter by action status(es). Supports multiple values.",
+        help_text="Filter by action status(es). Comma-separated for multiple values.",
     )
 
     # Priority filtering (supports multiple values)
-    priority = django_filters.MultipleChoiceFilter(
+    priority = ChoiceInFilter(
         field_name="priority",
         choices=RiskAction.PRIORITY_CHOICES,
-        help_text="Filter by action priority. Supports multiple values.",
+        help_text="Filter by action priority. Comma-separated for multiple values.",
     )
 
     # Action type filtering
-    action_type = django_filters.MultipleChoiceFilter(
+    action_type = ChoiceInFilter(
         field_name="action_type",
         choices=RiskAction.ACTION_TYPES,
-        help_text="Filter by action type. Supports multiple values.",
+        help_text="Filter by action type. Comma-separated for multiple values.",
     )
 
     # Risk filtering
@@ -263,10 +422,10 @@ class RiskActionFilter(django_filters.FilterSet):
     )
 
     # Risk level filtering (based on related risk)
-    risk_level = django_filters.MultipleChoiceFilter(
-        field_name="risk__risk_level",
+    risk_level = ChoiceInFilter(
+        method="filter_risk_level",
         choices=Risk.RISK_LEVELS,
-        help_text="Filter by related risk level. Supports multiple values.",
+        help_text="Filter by related risk level. Comma-separated for multiple values.",
     )
 
     # Assigned user filtering
@@ -357,17 +516,25 @@ class RiskActionFilter(django_filters.FilterSet):
         method="filter_search", help_text="Search across action ID, title, and description."
     )
 
+    # Keyset pagination
+    cursor = CursorFilter(
+        method="filter_cursor",
+        keys=KEYSET_ORDERING,
+        help_text="Opaque cursor from the X-Next-Cursor header of the previous page.",
+    )
+
     class Meta:
         model = RiskAction
         fields = []  # We define custom fields above
 
+    def filter_risk_level(self, queryset, name, value):
+        """Filter by the level of the related risk without joining risk_risk."""
+        return queryset.filter(risk_id__in=risk_pks_for_levels(value))
+
     def filter_overdue(self, queryset, name, value):
         """Filter actions that are overdue."""
         if value:
-            today = timezone.now().date()
-            return queryset.filter(
-                due_date__lt=today, status__in=["pending", "in_progress", "deferred"]
-            )
+            return queryset.overdue()
         elif value is False:
             today = timezone.now().date()
             return queryset.filter(
@@ -378,13 +545,7 @@ class RiskActionFilter(django_filters.FilterSet):
     def filter_due_soon(self, queryset, name, value):
         """Filter actions due within the next 7 days."""
         if value:
-            today = timezone.now().date()
-            week_from_now = today + timezone.timedelta(days=7)
-            return queryset.filter(
-                due_date__gte=today,
-                due_date__lte=week_from_now,
-                status__in=["pending", "in_progress", "deferred"],
-            )
+            return queryset.due_soon()
         elif value is False:
             today = timezone.now().date()
             week_from_now = today + timezone.timedelta(days=7)
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.16 on 2026-10-17 20:40
+
+import django.db.models.expressions
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("risk", "0002_alter_riskactionevidence_evidence_date"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="risk",
+            index=models.Index(
+                django.db.models.expressions.CombinedExpression(
+                    models.F("impact"), "*", models.F("likelihood")
+                ),
+                name="risk_score_expr_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,65 @@
+# Trigram indexes backing RiskFilter.filter_search.
+#
+# Django compiles ``__icontains`` to ``UPPER(col::text) LIKE UPPER(%s)`` on
+# PostgreSQL, so each index is built over ``UPPER(col)`` to match. The search
+# ORs all five columns, and the planner can only use a BitmapOr when every
+# branch is indexed.
+#
+# risk is a tenant app, so these operations run once per tenant schema. The
+# extension is installed into ``public`` (always on the tenant search path)
+# so ``gin_trgm_ops`` resolves for every tenant, not just the first one.
+#
+# The indexes are purely an optimisation: on servers built without contrib
+# (pg_trgm unavailable) the migration is a no-op and search falls back to a
+# sequential scan.
+
+from django.db import migrations
+
+SEARCH_COLUMNS = (
+    "risk_id",
+    "title",
+    "description",
+    "potential_impact_description",
+    "current_controls",
+)
+
+
+def _index_name(column):
+    return f"risk_{column[:20]}_trgm_idx"
+
+
+def _trigram_available(schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return False
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+        return cursor.fetchone() is not None
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if not _trigram_available(schema_editor):
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm WITH SCHEMA public")
+    for column in SEARCH_COLUMNS:
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS {_index_name(column)} "
+            f"ON risk_risk USING gin (UPPER({column}) gin_trgm_ops)"
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for column in SEARCH_COLUMNS:
+        schema_editor.execute(f"DROP INDEX IF EXISTS {_index_name(column)}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("risk", "0003_risk_risk_score_expr_idx"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.16 on 2026-10-17 20:52
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("risk", "0004_risk_search_trigram_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="risk",
+            index=models.Index(
+                fields=["risk_level", "impact", "likelihood", "id"], name="risk_keyset_idx"
+            ),
+        ),
+    ]
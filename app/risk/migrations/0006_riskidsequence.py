@@ -0,0 +1,35 @@
+# Generated by Django 5.2.16 on 2026-10-17 21:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("risk", "0005_risk_keyset_idx"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RiskIdSequence",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                (
+                    "kind",
+                    models.CharField(
+                        choices=[("risk", "Risk"), ("action", "Risk Action")], max_length=20
+                    ),
+                ),
+                ("year", models.PositiveIntegerField()),
+                ("counter", models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                "unique_together": {("kind", "year")},
+            },
+        ),
+    ]
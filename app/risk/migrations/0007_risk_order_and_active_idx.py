@@ -0,0 +1,41 @@
+# Generated by Django 5.2.16 on 2026-10-17 21:44
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("risk", "0006_riskidsequence"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="risk",
+            index=models.Index(
+                fields=["-risk_level", "-impact", "-likelihood", "title"], name="risk_order_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="risk",
+            index=models.Index(
+                condition=models.Q(
+                    (
+                        "status__in",
+                        [
+                            "identified",
+                            "assessed",
+                            "treatment_planned",
+                            "treatment_in_progress",
+                            "mitigated",
+                            "accepted",
+                        ],
+                    )
+                ),
+                fields=["status", "risk_level"],
+                name="risk_active_idx",
+            ),
+        ),
+    ]
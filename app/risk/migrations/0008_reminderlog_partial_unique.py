@@ -0,0 +1,68 @@
+# Generated by Django 5.2.16 on 2026-10-17 21:59
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Min
+
+NODAYS_REMINDER_TYPES = ["advance_warning", "due_today", "overdue"]
+
+
+def delete_duplicate_reminder_logs(apps, schema_editor):
+    """
+    Delete rows the new constraints would reject, keeping the lowest pk of each
+    group. unique_together never applied to rows with a NULL days_before_due.
+    """
+    RiskActionReminderLog = apps.get_model("risk", "RiskActionReminderLog")
+    groups = (
+        (
+            RiskActionReminderLog.objects.filter(days_before_due__isnull=False),
+            ("action", "user", "reminder_type", "days_before_due"),
+        ),
+        (
+            RiskActionReminderLog.objects.filter(
+                days_before_due__isnull=True, reminder_type__in=NODAYS_REMINDER_TYPES
+            ),
+            ("action", "user", "reminder_type"),
+        ),
+    )
+    for logs, fields in groups:
+        kept = logs.values(*fields).annotate(kept_pk=Min("pk")).values("kept_pk")
+        logs.exclude(pk__in=kept).delete()
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("risk", "0007_risk_order_and_active_idx"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name="riskactionreminderlog",
+            unique_together=set(),
+        ),
+        migrations.AddIndex(
+            model_name="riskactionreminderlog",
+            index=models.Index(fields=["user", "sent_at"], name="rem_user_sent_idx"),
+        ),
+        migrations.RunPython(delete_duplicate_reminder_logs, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="riskactionreminderlog",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("days_before_due__isnull", False)),
+                fields=("action", "user", "reminder_type", "days_before_due"),
+                name="rem_uniq_days",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="riskactionreminderlog",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(
+                    ("days_before_due__isnull", True),
+                    ("reminder_type__in", NODAYS_REMINDER_TYPES),
+                ),
+                fields=("action", "user", "reminder_type"),
+                name="rem_uniq_nodays",
+            ),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.16 on 2026-10-18 00:00
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("risk", "0008_reminderlog_partial_unique"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="riskactionreminderlog",
+            index=models.Index(
+                condition=models.Q(("email_sent", True), ("reminder_type", "overdue")),
+                fields=["user", "action", "sent_at"],
+                name="rem_overdue_sent_idx",
+            ),
+        ),
+    ]
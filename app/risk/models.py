@@ -1,13 +1,83 @@
-from django.db import models
+from django.db import connection, models, transaction
+from django.db.models import Case, CharField, F, Func, IntegerField, Q, Value, When
+from django.db.models.functions import Coalesce
+from django.db.models.signals import post_save
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.utils import timezone
+from django.utils.functional import cached_property
+from bisect import bisect_left
+from functools import lru_cache
+from types import MappingProxyType
+import copy
 import uuid
 
-from core.identifiers import next_prefixed_identifier, save_with_generated_identifier
+from core.identifiers import last_identifier_number, save_with_generated_identifier
 
 User = get_user_model()
 
+# UI color codes, shared by the models and admin.
+DEFAULT_COLOR = "#6B7280"
+
+RISK_LEVEL_COLORS = MappingProxyType(
+    {
+        "low": "#10B981",  # Green
+        "medium": "#F59E0B",  # Yellow
+        "high": "#EF4444",  # Red
+        "critical": "#DC2626",  # Dark Red
+    }
+)
+
+RISK_STATUS_COLORS = MappingProxyType(
+    {
+        "identified": "#6B7280",  # Gray
+        "assessed": "#3B82F6",  # Blue
+        "treatment_planned": "#8B5CF6",  # Purple
+        "treatment_in_progress": "#F59E0B",  # Yellow
+        "mitigated": "#10B981",  # Green
+        "accepted": "#6B7280",  # Gray
+        "transferred": "#6B7280",  # Gray
+        "closed": "#374151",  # Dark Gray
+    }
+)
+
+# Action priorities share the risk level scale.
+PRIORITY_COLORS = RISK_LEVEL_COLORS
+
+ACTION_STATUS_COLORS = MappingProxyType(
+    {
+        "pending": "#6B7280",  # Gray
+        "in_progress": "#3B82F6",  # Blue
+        "completed": "#10B981",  # Green
+        "cancelled": "#EF4444",  # Red
+        "deferred": "#F59E0B",  # Yellow
+    }
+)
+
+# Window, in days, within which an open action counts as due soon.
+DUE_SOON_DAYS = 7
+
+# Risk levels as 2-bit codes for RiskMatrix's packed grid, in ascending severity.
+BITS_TO_LEVEL = ("low", "medium", "high", "critical")
+LEVEL_TO_BITS = MappingProxyType({level: bits for bits, level in enumerate(BITS_TO_LEVEL)})
+
+# Risk PKs per risk level, cached briefly so action lists filtered by the level
+# of their risk skip the join. Saves and deletes of Risk, and matrix
+# recalculations, clear the cache.
+RISK_LEVEL_PKS_TIMEOUT = 30
+
+
+def risk_level_pks_key(level):
+    # risk is a tenant app, so PKs are only meaningful within one schema.
+    schema = getattr(connection, "schema_name", "public")
+    return f"risk:pks_by_level:{schema}:{level}"
+
+
+def invalidate_risk_level_pks():
+    """Drop the cached risk PKs for every level in the current schema."""
+    cache.delete_many([risk_level_pks_key(level) for level, _label in Risk.RISK_LEVELS])
+
 
 class RiskCategory(models.Model):
     """
@@ -60,6 +130,14 @@ class RiskMatrix(models.Model):
         User, on_delete=models.SET_NULL, null=True, related_name="created_risk_matrices"
     )
 
+    GRADING_FIELDS = frozenset(
+        {"is_default", "impact_levels", "likelihood_levels", "matrix_config"}
+    )
+
+    # Per-process copy of each schema's default matrix as (version, matrix). The
+    # version token lives in the shared cache so every worker sees invalidations.
+    _default_cache: dict[str, tuple[str, "RiskMatrix | None"]] = {}
+
     class Meta:
         verbose_name_plural = "Risk Matrices"
         ordering = ["-is_default", "name"]
@@ -67,45 +145,376 @@ class RiskMatrix(models.Model):
     def __str__(self):
         return f"{self.name} ({self.impact_levels}x{self.likelihood_levels})"
 
+    @staticmethod
+    def _default_version_key():
+        schema = getattr(connection, "schema_name", "public")
+        return f"risk:default_matrix_version:{schema}"
+
+    @classmethod
+    def get_default(cls):
+        """Return the default matrix (or None), reloading only after matrices change."""
+        key = cls._default_version_key()
+        version = cache.get(key)
+        if version is None:
+            # A random token rather than a counter, so an evicted key can never
+            # come back with a version some process has already cached.
+            cache.add(key, uuid.uuid4().hex, None)
+            version = cache.get(key)
+
+        cached = cls._default_cache.get(key)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        matrix = cls.objects.filter(is_default=True).first()
+        cls._default_cache[key] = (version, matrix)
+        return matrix
+
+    @classmethod
+    def invalidate_default(cls):
+        """Make every process reload the default matrix on next use."""
+        cache.set(cls._default_version_key(), uuid.uuid4().hex, None)
+
     def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+
         # Ensure only one default matrix
         if self.is_default:
             RiskMatrix.objects.filter(is_default=True).exclude(pk=self.pk).update(is_default=False)
 
-        # Create default matrix configuration if not provided
-        if not self.matrix_config:
+        # Create default matrix configuration if not provided. Partial saves that
+        # leave matrix_config out neither write it nor need it generated.
+        if not self.matrix_config and (update_fields is None or "matrix_config" in update_fields):
             self.matrix_config = self._generate_default_matrix()
 
+        grading_changed = (
+            update_fields is None or not self.GRADING_FIELDS.isdisjoint(update_fields)
+        ) and self._grading() != getattr(self, "_loaded_grading", None)
         super().save(*args, **kwargs)
+        self._clear_grid_cache()
+        if grading_changed:
+            self.recalculate_risks()
+        self._remember_grading()
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._remember_grading()
+        return instance
+
+    def refresh_from_db(self, *args, **kwargs):
+        super().refresh_from_db(*args, **kwargs)
+        self._clear_grid_cache()
+        self._remember_grading()
+
+    def _grading(self):
+        """Everything that decides which risks this matrix grades, and how."""
+        return (
+            self.is_default,
+            self.impact_levels,
+            self.likelihood_levels,
+            self.matrix_config,
+        )
+
+    def _remember_grading(self):
+        # Deep copy: matrix_config is usually edited in place.
+        self._loaded_grading = copy.deepcopy(self._grading())
+
+    def recalculate_risks(self):
+        """
+        Recompute risk_level for every risk graded by this matrix in one UPDATE.
+
+        The default matrix also grades risks without a matrix of their own.
+        """
+        risks = Q(risk_matrix=self)
+        if self.is_default:
+            risks |= Q(risk_matrix__isnull=True)
+        # Cover every rating a risk can carry so clamping matches calculate_risk_level.
+        whens = [
+            When(
+                impact=impact,
+                likelihood=likelihood,
+                then=Value(self.calculate_risk_level(impact, likelihood)),
+            )
+            for impact in range(1, max(self.impact_levels, 5) + 1)
+            for likelihood in range(1, max(self.likelihood_levels, 5) + 1)
+        ]
+        updated = Risk.objects.filter(risks).update(
+            risk_level=Case(*whens, default=F("risk_level"), output_field=CharField())
+        )
+        # The UPDATE sends no signals, so clear the cached PKs here.
+        invalidate_risk_level_pks()
+        return updated
 
     def _generate_default_matrix(self):
         """Generate a default 5x5 risk matrix configuration."""
-        config: dict[str, dict[str, str]] = {}
-        for impact in range(1, self.impact_levels + 1):
-            config[str(impact)] = {}
-            for likelihood in range(1, self.likelihood_levels + 1):
-                # Simple calculation: sum of impact + likelihood
-                total = impact + likelihood
-                if total <= 3:
-                    level = "low"
-                elif total <= 5:
-                    level = "medium"
-                elif total <= 7:
-                    level = "high"
-                else:
-                    level = "critical"
-                config[str(impact)][str(likelihood)] = level
-        return config
+        grid = _default_matrix_grid(self.impact_levels, self.likelihood_levels)
+        return {
+            str(impact): {str(likelihood): level for likelihood, level in enumerate(row, start=1)}
+            for impact, row in enumerate(grid, start=1)
+        }
+
+    @cached_property
+    def _grid(self):
+        """matrix_config as a tuple grid indexed by [impact - 1][likelihood - 1]."""
+        return tuple(
+            tuple(
+                self.matrix_config.get(str(impact), {}).get(str(likelihood), "medium")
+                for likelihood in range(1, self.likelihood_levels + 1)
+            )
+            for impact in range(1, self.impact_levels + 1)
+        )
+
+    @cached_property
+    def _packed(self):
+        """
+        The grid as one int of 2-bit level codes, one likelihood_levels-wide row
+        per impact; None if the config uses labels outside the scale.
+        """
+        packed = 0
+        for i, row in enumerate(self._grid):
+            for j, level in enumerate(row):
+                bits = LEVEL_TO_BITS.get(level)
+                if bits is None:
+                    return None
+                packed |= bits << ((i * self.likelihood_levels + j) * 2)
+        return packed
+
+    def _clear_grid_cache(self):
+        self.__dict__.pop("_grid", None)
+        self.__dict__.pop("_packed", None)
 
     def calculate_risk_level(self, impact, likelihood):
         """Calculate risk level based on impact and likelihood."""
         if not self.matrix_config:
             return "medium"  # Default fallback
 
-        impact_str = str(min(max(1, impact), self.impact_levels))
-        likelihood_str = str(min(max(1, likelihood), self.likelihood_levels))
+        impact = min(max(1, impact), self.impact_levels)
+        likelihood = min(max(1, likelihood), self.likelihood_levels)
+
+        packed = self._packed
+        if packed is None:
+            return self._grid[impact - 1][likelihood - 1]
+        cell = (impact - 1) * self.likelihood_levels + likelihood - 1
+        return BITS_TO_LEVEL[(packed >> (cell * 2)) & 3]
+
+
+# Upper bounds on impact + likelihood for each level below critical.
+_DEFAULT_LEVEL_THRESHOLDS = (3, 5, 7)
+
+
+@lru_cache(maxsize=32)
+def _default_matrix_grid(impact_levels, likelihood_levels):
+    """Default risk levels as an immutable grid; shared, so never hand it out mutable."""
+    # Grade by impact + likelihood. Every cell on an anti-diagonal shares a
+    # total, so grade each total once and index rows out of that table.
+    by_total = tuple(
+        BITS_TO_LEVEL[bisect_left(_DEFAULT_LEVEL_THRESHOLDS, total)]
+        for total in range(impact_levels + likelihood_levels + 1)
+    )
+    return tuple(
+        by_total[impact + 1 : impact + 1 + likelihood_levels]
+        for impact in range(1, impact_levels + 1)
+    )
+
+
+class RiskIdSequence(models.Model):
+    """
+    Per-year counters for risk and risk action identifiers.
+
+    Handing out the next number locks and bumps a single row, so ID generation
+    costs the same however many risks exist and concurrent inserts never draw
+    the same number.
+    """
+
+    KIND_RISK = "risk"
+    KIND_ACTION = "action"
+    KINDS = [
+        (KIND_RISK, "Risk"),
+        (KIND_ACTION, "Risk Action"),
+    ]
+
+    kind = models.CharField(max_length=20, choices=KINDS)
+    year = models.PositiveIntegerField()
+    counter = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        unique_together = [("kind", "year")]
+
+    def __str__(self):
+        return f"{self.kind} {self.year}: {self.counter}"
+
+    @classmethod
+    def next_value(cls, kind, year, initial=0):
+        """
+        Return the next number for ``kind`` in ``year``.
+
+        ``initial`` (a value or callable) seeds a year's counter the first time
+        it is used, so numbering continues after identifiers that already exist.
+        """
+        return cls.next_values(kind, year, 1, initial)[0]
+
+    @classmethod
+    def next_values(cls, kind, year, count, initial=0):
+        """Reserve the next ``count`` numbers for ``kind`` in ``year`` with one row update."""
+        with transaction.atomic():
+            sequence, _created = cls.objects.select_for_update().get_or_create(
+                kind=kind, year=year, defaults={"counter": initial}
+            )
+            first = sequence.counter + 1
+            sequence.counter += count
+            sequence.save(update_fields=["counter"])
+        return range(first, sequence.counter + 1)
+
+
+def _days_until(field_name):
+    """Whole days from today until ``field_name`` (negative once past), computed in SQL."""
+    # date - date is an integer day count on PostgreSQL.
+    return Func(
+        F(field_name),
+        Value(timezone.now().date()),
+        template="(%(expressions)s)",
+        arg_joiner=" - ",
+        output_field=IntegerField(),
+    )
+
+
+def _related_label(instance, field_name, attr=None):
+    """
+    Describe a related object for __str__ without querying for it: the object
+    (or its ``attr``) when already loaded, otherwise ``#<pk>``.
+    """
+    field = instance._meta.get_field(field_name)
+    if field.is_cached(instance):
+        related = field.get_cached_value(instance)
+    else:
+        related_id = getattr(instance, field.attname)
+        if related_id is not None:
+            return f"#{related_id}"
+        related = None
+    if related is not None and attr:
+        return getattr(related, attr)
+    return str(related)
+
+
+class RiskQuerySet(models.QuerySet):
+    """Database-side counterparts of the Risk review-date properties."""
+
+    def overdue_for_review(self):
+        return self.filter(next_review_date__lt=timezone.now().date())
+
+    def with_days_until_review(self):
+        """Annotate the value Risk.days_until_review would compute."""
+        return self.annotate(_annotated_days_until_review=_days_until("next_review_date"))
+
+    def for_dashboard(self):
+        """Headline risk columns with category and owner names, in a single query."""
+        return self.select_related("category", "risk_owner").only(
+            "risk_id",
+            "title",
+            "status",
+            "risk_level",
+            "impact",
+            "likelihood",
+            "next_review_date",
+            "category__name",
+            "risk_owner__username",
+            "risk_owner__first_name",
+            "risk_owner__last_name",
+        )
+
+
+class RiskActionQuerySet(models.QuerySet):
+    """Database-side counterparts of the RiskAction due-date properties."""
+
+    OPEN_STATUSES = ["pending", "in_progress", "deferred"]
+
+    def overdue(self):
+        return self.filter(due_date__lt=timezone.now().date(), status__in=self.OPEN_STATUSES)
+
+    def due_soon(self, days=DUE_SOON_DAYS):
+        today = timezone.now().date()
+        return self.filter(
+            due_date__gte=today,
+            due_date__lte=today + timezone.timedelta(days=days),
+            status__in=self.OPEN_STATUSES,
+        )
+
+    def with_days_until_due(self):
+        """Annotate the value RiskAction.days_until_due would compute."""
+        return self.annotate(_annotated_days_until_due=_days_until("due_date"))
+
+    def reminder_candidates(self, reminder_days):
+        """
+        Actions that could get a reminder today, with days_until_due annotated.
+
+        That is those overdue, due today, or due one of ``reminder_days`` days
+        from now; any other action is out of every reminder's reach.
+        """
+        today = timezone.now().date()
+        advance_dates = [today + timezone.timedelta(days=days) for days in reminder_days]
+        return self.with_days_until_due().filter(
+            Q(due_date__lte=today) | Q(due_date__in=advance_dates)
+        )
+
+    def reminder_candidates_for_assignee(self):
+        """
+        Actions that could get a reminder today under their assignee's settings.
+
+        Assignees without a configuration get its defaults. Custom reminder days
+        live in a JSON list and are left for reminder_candidates() to match, so
+        this only narrows and may still over-select for custom schedules.
+        """
+        config_field = RiskActionReminderConfiguration._meta.get_field
+        return self.alias(
+            _days_until_due=_days_until("due_date"),
+            _reminder_frequency=Coalesce(
+                "assigned_to__risk_action_reminder_config__reminder_frequency",
+                Value(config_field("reminder_frequency").default),
+            ),
+            _advance_warning_days=Coalesce(
+                "assigned_to__risk_action_reminder_config__advance_warning_days",
+                Value(config_field("advance_warning_days").default),
+            ),
+        ).filter(
+            Q(_days_until_due__lte=0)
+            | Q(_reminder_frequency="custom")
+            | Q(_reminder_frequency="weekly", _days_until_due=7)
+            | Q(_reminder_frequency="daily", _days_until_due__lte=F("_advance_warning_days"))
+        )
+
+    # Long free-text risk fields that no notification email renders
+    NOTIFICATION_DEFERRED_RISK_FIELDS = (
+        "risk__description",
+        "risk__treatment_description",
+        "risk__potential_impact_description",
+        "risk__current_controls",
+    )
+
+    def for_notification(self):
+        """
+        Actions with every relation the notification emails render already
+        joined, leaving the risk's unrendered free text in the database.
+        """
+        return self.select_related("risk__risk_owner", "assigned_to").defer(
+            *self.NOTIFICATION_DEFERRED_RISK_FIELDS
+        )
 
-        return self.matrix_config.get(impact_str, {}).get(likelihood_str, "medium")
+    def for_dashboard(self):
+        """Headline action columns with their risk and assignee, in a single query."""
+        return self.select_related("risk", "assigned_to").only(
+            "action_id",
+            "title",
+            "status",
+            "priority",
+            "due_date",
+            "progress_percentage",
+            "risk__risk_id",
+            "risk__title",
+            "risk__risk_level",
+            "assigned_to__username",
+            "assigned_to__first_name",
+            "assigned_to__last_name",
+        )
 
 
 class Risk(models.Model):
@@ -198,6 +607,8 @@ class Risk(models.Model):
         User, on_delete=models.SET_NULL, null=True, related_name="created_risks"
     )
 
+    objects = RiskQuerySet.as_manager()
+
     class Meta:
         ordering = ["-risk_level", "-impact", "-likelihood", "title"]
         indexes = [
@@ -205,50 +616,145 @@ class Risk(models.Model):
             models.Index(fields=["risk_owner", "status"]),
             models.Index(fields=["next_review_date"]),
             models.Index(fields=["category", "risk_level"]),
+            models.Index(F("impact") * F("likelihood"), name="risk_score_expr_idx"),
+            models.Index(
+                fields=["risk_level", "impact", "likelihood", "id"], name="risk_keyset_idx"
+            ),
+            # Matches Meta.ordering (mixed directions) so default lists skip the sort.
+            models.Index(
+                fields=["-risk_level", "-impact", "-likelihood", "title"], name="risk_order_idx"
+            ),
+            # Same predicate as RiskFilter.active_only so the planner can prove a match.
+            models.Index(
+                fields=["status", "risk_level"],
+                condition=Q(
+                    status__in=[
+                        "identified",
+                        "assessed",
+                        "treatment_planned",
+                        "treatment_in_progress",
+                        "mitigated",
+                        "accepted",
+                    ]
+                ),
+                name="risk_active_idx",
+            ),
         ]
 
     def __str__(self):
         return f"{self.risk_id}: {self.title}"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._remember_assessment()
+        return instance
+
+    def _remember_assessment(self):
+        # Read __dict__ directly so deferred fields are not fetched just to compare.
+        self._loaded_assessment = (
+            self.__dict__.get("impact"),
+            self.__dict__.get("likelihood"),
+        )
+
+    def _assessment_changed(self):
+        """Return whether impact or likelihood differ from the stored row."""
+        loaded = getattr(self, "_loaded_assessment", (None, None))
+        if None in loaded:
+            # Not loaded from the database (or loaded deferred): ask the database.
+            loaded = Risk.objects.filter(pk=self.pk).values_list("impact", "likelihood").first()
+            if loaded is None:
+                return True
+        return loaded != (self.impact, self.likelihood)
+
     def save(self, *args, **kwargs):
+        derived = self._normalize()
+
+        # Partial saves also write whatever the normalizer derived from them.
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None:
+            kwargs["update_fields"] = {*update_fields, *derived}
+
+        save_with_generated_identifier(
+            self,
+            "risk_id",
+            self._generate_risk_id,
+            lambda: super(Risk, self).save(*args, **kwargs),
+        )
+        self._remember_assessment()
+
+    # Columns save() computes from the rest of the row.
+    DERIVED_FIELDS = ("risk_level", "last_assessed_date", "closed_date")
+
+    def _normalize(self):
+        """Bring derived fields in line with the rest of the row; return those changed."""
+        before = {field: getattr(self, field) for field in self.DERIVED_FIELDS}
+        today = timezone.now().date()
+
         # Calculate risk level based on impact and likelihood
         self.risk_level = self._calculate_risk_level()
 
         # Update last assessed date when impact or likelihood changes
-        if self.pk:
-            original = Risk.objects.get(pk=self.pk)
-            if original.impact != self.impact or original.likelihood != self.likelihood:
-                self.last_assessed_date = timezone.now().date()
-        else:
-            self.last_assessed_date = timezone.now().date()
+        if not self.pk or self._assessment_changed():
+            self.last_assessed_date = today
 
         # Auto-set closed date when status changes to closed
         if self.status == "closed" and not self.closed_date:
-            self.closed_date = timezone.now().date()
+            self.closed_date = today
         elif self.status != "closed" and self.closed_date:
             self.closed_date = None
 
-        save_with_generated_identifier(
-            self,
-            "risk_id",
-            self._generate_risk_id,
-            lambda: super(Risk, self).save(*args, **kwargs),
-        )
+        return {field for field, value in before.items() if getattr(self, field) != value}
 
     def _generate_risk_id(self):
         """Generate a unique risk ID."""
+        return self._reserve_risk_ids(1)[0]
+
+    @staticmethod
+    def _reserve_risk_ids(count):
+        """Reserve ``count`` consecutive risk IDs for the current year."""
         year = timezone.now().year
-        return next_prefixed_identifier(Risk, "risk_id", f"RISK-{year}")
+        prefix = f"RISK-{year}"
+        numbers = RiskIdSequence.next_values(
+            RiskIdSequence.KIND_RISK,
+            year,
+            count,
+            initial=lambda: last_identifier_number(Risk, "risk_id", prefix),
+        )
+        return [f"{prefix}-{number:04d}" for number in numbers]
+
+    @classmethod
+    def create_many(cls, risks, batch_size=100):
+        """
+        Insert unsaved risks with multi-row INSERTs, deriving fields as save() would.
+
+        Risk IDs are reserved as one block. ``post_save`` is sent for each risk
+        afterwards, since bulk_create() itself sends no signals.
+        """
+        for risk, risk_id in zip(risks, cls._reserve_risk_ids(len(risks)), strict=True):
+            risk._normalize()
+            risk.risk_id = risk_id
+        created = cls.objects.bulk_create(risks, batch_size=batch_size)
+        for risk in created:
+            risk._remember_assessment()
+            post_save.send(sender=cls, instance=risk, created=True, raw=False, using=risk._state.db)
+        return created
+
+    def _grading_matrix(self):
+        """The risk's own matrix, else the default; reuses the cached default if they match."""
+        if self.risk_matrix_id is None:
+            return RiskMatrix.get_default()
+        if not Risk.risk_matrix.is_cached(self):
+            default_matrix = RiskMatrix.get_default()
+            if default_matrix is not None and default_matrix.pk == self.risk_matrix_id:
+                return default_matrix
+        return self.risk_matrix
 
     def _calculate_risk_level(self):
         """Calculate risk level based on impact, likelihood, and risk matrix."""
-        if self.risk_matrix:
-            return self.risk_matrix.calculate_risk_level(self.impact, self.likelihood)
-
-        # Default calculation if no matrix is specified
-        default_matrix = RiskMatrix.objects.filter(is_default=True).first()
-        if default_matrix:
-            return default_matrix.calculate_risk_level(self.impact, self.likelihood)
+        matrix = self._grading_matrix()
+        if matrix:
+            return matrix.calculate_risk_level(self.impact, self.likelihood)
 
         # Fallback calculation
         total = self.impact + self.likelihood
@@ -276,6 +782,8 @@ class Risk(models.Model):
     @property
     def days_until_review(self):
         """Days until next review (negative if overdue)."""
+        if hasattr(self, "_annotated_days_until_review"):
+            return self._annotated_days_until_review
         if not self.next_review_date:
             return None
         delta = self.next_review_date - timezone.now().date()
@@ -288,27 +796,11 @@ class Risk(models.Model):
 
     def get_risk_level_color(self):
         """Get color code for risk level."""
-        colors = {
-            "low": "#10B981",  # Green
-            "medium": "#F59E0B",  # Yellow
-            "high": "#EF4444",  # Red
-            "critical": "#DC2626",  # Dark Red
-        }
-        return colors.get(self.risk_level, "#6B7280")
+        return RISK_LEVEL_COLORS.get(self.risk_level, DEFAULT_COLOR)
 
     def get_status_display_color(self):
         """Get color code for status."""
-        colors = {
-            "identified": "#6B7280",  # Gray
-            "assessed": "#3B82F6",  # Blue
-            "treatment_planned": "#8B5CF6",  # Purple
-            "treatment_in_progress": "#F59E0B",  # Yellow
-            "mitigated": "#10B981",  # Green
-            "accepted": "#6B7280",  # Gray
-            "transferred": "#6B7280",  # Gray
-            "closed": "#374151",  # Dark Gray
-        }
-        return colors.get(self.status, "#6B7280")
+        return RISK_STATUS_COLORS.get(self.status, DEFAULT_COLOR)
 
 
 class RiskNote(models.Model):
@@ -339,7 +831,8 @@ class RiskNote(models.Model):
         ordering = ["-created_at"]
 
     def __str__(self):
-        return f"Note for {self.risk.risk_id} by {self.created_by}"
+        risk = _related_label(self, "risk", "risk_id")
+        return f"Note for {risk} by {_related_label(self, 'created_by')}"
 
 
 class RiskAction(models.Model):
@@ -441,6 +934,8 @@ class RiskAction(models.Model):
         User, on_delete=models.SET_NULL, null=True, related_name="created_risk_actions"
     )
 
+    objects = RiskActionQuerySet.as_manager()
+
     class Meta:
         ordering = ["due_date", "-priority", "title"]
         indexes = [
@@ -455,12 +950,7 @@ class RiskAction(models.Model):
         return f"{self.action_id}: {self.title}"
 
     def save(self, *args, **kwargs):
-        # Auto-set completed date when status changes to completed
-        if self.status == "completed" and not self.completed_date:
-            self.completed_date = timezone.now().date()
-            self.progress_percentage = 100
-        elif self.status != "completed" and self.completed_date:
-            self.completed_date = None
+        self._normalize()
 
         save_with_generated_identifier(
             self,
@@ -469,10 +959,49 @@ class RiskAction(models.Model):
             lambda: super(RiskAction, self).save(*args, **kwargs),
         )
 
+    def _normalize(self):
+        """Keep the completion date and progress in line with the status."""
+        # Auto-set completed date when status changes to completed
+        if self.status == "completed" and not self.completed_date:
+            self.completed_date = timezone.now().date()
+            self.progress_percentage = 100
+        elif self.status != "completed" and self.completed_date:
+            self.completed_date = None
+
     def _generate_action_id(self):
         """Generate a unique risk action ID."""
+        return self._reserve_action_ids(1)[0]
+
+    @staticmethod
+    def _reserve_action_ids(count):
+        """Reserve ``count`` consecutive action IDs for the current year."""
         year = timezone.now().year
-        return next_prefixed_identifier(RiskAction, "action_id", f"RA-{year}")
+        prefix = f"RA-{year}"
+        numbers = RiskIdSequence.next_values(
+            RiskIdSequence.KIND_ACTION,
+            year,
+            count,
+            initial=lambda: last_identifier_number(RiskAction, "action_id", prefix),
+        )
+        return [f"{prefix}-{number:04d}" for number in numbers]
+
+    @classmethod
+    def create_many(cls, actions, batch_size=100):
+        """
+        Insert unsaved actions with multi-row INSERTs, deriving fields as save() would.
+
+        Action IDs are reserved as one block and ``post_save`` is sent for each
+        action afterwards, as for Risk.create_many().
+        """
+        for action, action_id in zip(actions, cls._reserve_action_ids(len(actions)), strict=True):
+            action._normalize()
+            action.action_id = action_id
+        created = cls.objects.bulk_create(actions, batch_size=batch_size)
+        for action in created:
+            post_save.send(
+                sender=cls, instance=action, created=True, raw=False, using=action._state.db
+            )
+        return created
 
     @property
     def is_overdue(self):
@@ -484,38 +1013,30 @@ class RiskAction(models.Model):
     @property
     def days_until_due(self):
         """Days until due date (negative if overdue)."""
+        if hasattr(self, "_annotated_days_until_due"):
+            return self._annotated_days_until_due
         if not self.due_date:
             return None
         delta = self.due_date - timezone.now().date()
         return delta.days
 
     @property
-    def is_due_soon(self, days_threshold=7):
-        """Check if action is due within the threshold."""
-        if not self.due_date:
-            return False
-        return 0 <= self.days_until_due <= days_threshold
+    def is_due_soon(self):
+        """Check if action is due within DUE_SOON_DAYS."""
+        return self.due_within(DUE_SOON_DAYS)
+
+    def due_within(self, days):
+        """Check if action is due today or within the next ``days`` days."""
+        days_until_due = self.days_until_due
+        return days_until_due is not None and 0 <= days_until_due <= days
 
     def get_priority_color(self):
         """Get color code for priority level."""
-        colors = {
-            "low": "#10B981",  # Green
-            "medium": "#F59E0B",  # Yellow
-            "high": "#EF4444",  # Red
-            "critical": "#DC2626",  # Dark Red
-        }
-        return colors.get(self.priority, "#6B7280")
+        return PRIORITY_COLORS.get(self.priority, DEFAULT_COLOR)
 
     def get_status_color(self):
         """Get color code for status."""
-        colors = {
-            "pending": "#6B7280",  # Gray
-            "in_progress": "#3B82F6",  # Blue
-            "completed": "#10B981",  # Green
-            "cancelled": "#EF4444",  # Red
-            "deferred": "#F59E0B",  # Yellow
-        }
-        return colors.get(self.status, "#6B7280")
+        return ACTION_STATUS_COLORS.get(self.status, DEFAULT_COLOR)
 
 
 class RiskActionNote(models.Model):
@@ -553,7 +1074,8 @@ class RiskActionNote(models.Model):
         ordering = ["-created_at"]
 
     def __str__(self):
-        return f"Note for {self.action.action_id} by {self.created_by}"
+        action = _related_label(self, "action", "action_id")
+        return f"Note for {action} by {_related_label(self, 'created_by')}"
 
 
 class RiskActionEvidence(models.Model):
@@ -609,7 +1131,19 @@ class RiskActionEvidence(models.Model):
         ]
 
     def __str__(self):
-        return f"{self.action.action_id} - {self.title}"
+        return f"{_related_label(self, 'action', 'action_id')} - {self.title}"
+
+    @classmethod
+    def bulk_validate(cls, queryset, validator_user, notes=None):
+        """Mark every evidence item in ``queryset`` as validated with a single UPDATE."""
+        values = {
+            "is_validated": True,
+            "validated_by": validator_user,
+            "validated_at": timezone.now(),
+        }
+        if notes is not None:
+            values["validation_notes"] = notes
+        return queryset.update(**values)
 
     def validate_evidence(self, validator_user, notes=""):
         """Mark evidence as validated."""
@@ -617,7 +1151,13 @@ class RiskActionEvidence(models.Model):
         self.validated_by = validator_user
         self.validated_at = timezone.now()
         self.validation_notes = notes
-        self.save()
+        # Only the validation columns change, so skip the full-row save().
+        type(self).objects.filter(pk=self.pk).update(
+            is_validated=True,
+            validated_by=validator_user,
+            validated_at=self.validated_at,
+            validation_notes=notes,
+        )
 
 
 class RiskActionReminderConfiguration(models.Model):
@@ -689,7 +1229,7 @@ class RiskActionReminderConfiguration(models.Model):
         verbose_name_plural = "Risk Action Reminder Configurations"
 
     def __str__(self):
-        return f"Risk Action Reminders for {self.user.username}"
+        return f"Risk Action Reminders for {_related_label(self, 'user', 'username')}"
 
     @classmethod
     def get_or_create_for_user(cls, user):
@@ -705,14 +1245,49 @@ class RiskActionReminderConfiguration(models.Model):
         )
         return config
 
+    @classmethod
+    def bulk_get_or_create(cls, user_ids):
+        """
+        Map each user ID to its configuration, creating missing ones with defaults.
+
+        Existing rows are loaded in one query and the rest inserted in one
+        batched INSERT; rows created concurrently are picked up by the re-select.
+        """
+        user_ids = set(user_ids)
+        configs = {config.user_id: config for config in cls.objects.filter(user_id__in=user_ids)}
+        missing = user_ids - configs.keys()
+        if missing:
+            cls.objects.bulk_create(
+                [cls(user_id=user_id) for user_id in missing], ignore_conflicts=True
+            )
+            configs.update(
+                (config.user_id, config) for config in cls.objects.filter(user_id__in=missing)
+            )
+        return configs
+
     def get_reminder_days(self):
-        """Get list of days when reminders should be sent before due date."""
-        if self.reminder_frequency == "custom" and self.custom_reminder_days:
-            return sorted(self.custom_reminder_days, reverse=True)
-        elif self.reminder_frequency == "weekly":
-            return [7]  # Weekly reminders 7 days before
-        else:  # daily
-            return list(range(1, self.advance_warning_days + 1))
+        """Get the days before the due date when reminders should be sent."""
+        return _reminder_days(
+            self.reminder_frequency,
+            self.advance_warning_days,
+            tuple(self.custom_reminder_days or ()),
+        )
+
+
+@lru_cache(maxsize=1024)
+def _reminder_days(frequency, advance_warning_days, custom_days):
+    """Reminder days as a shared tuple; memoised because few distinct settings exist."""
+    if frequency == "custom" and custom_days:
+        return tuple(sorted(custom_days, reverse=True))
+    elif frequency == "weekly":
+        return (7,)  # Weekly reminders 7 days before
+    else:  # daily
+        return tuple(range(1, advance_warning_days + 1))
+
+
+# Reminder types logged at most once per action and user even without a day
+# offset (the rem_uniq_nodays constraint)
+NODAYS_UNIQUE_REMINDER_TYPES = ["advance_warning", "due_today", "overdue"]
 
 
 class RiskActionReminderLog(models.Model):
@@ -750,10 +1325,65 @@ class RiskActionReminderLog(models.Model):
         indexes = [
             models.Index(fields=["action", "user", "reminder_type"]),
             models.Index(fields=["sent_at"]),
+            models.Index(fields=["user", "sent_at"], name="rem_user_sent_idx"),
+            # Covers the last-overdue-reminder lookup (user, action, MAX(sent_at))
+            # as an index-only scan over just the overdue reminders emailed.
+            models.Index(
+                fields=["user", "action", "sent_at"],
+                condition=Q(reminder_type="overdue", email_sent=True),
+                name="rem_overdue_sent_idx",
+            ),
         ]
-        unique_together = [
-            ("action", "user", "reminder_type", "days_before_due"),
+        constraints = [
+            models.UniqueConstraint(
+                fields=["action", "user", "reminder_type", "days_before_due"],
+                condition=Q(days_before_due__isnull=False),
+                name="rem_uniq_days",
+            ),
+            # NULL never collides in a plain unique index, so schedule-driven
+            # reminders logged without a day offset need their own constraint.
+            # Digests and assignment notices legitimately repeat.
+            models.UniqueConstraint(
+                fields=["action", "user", "reminder_type"],
+                condition=Q(
+                    days_before_due__isnull=True,
+                    reminder_type__in=NODAYS_UNIQUE_REMINDER_TYPES,
+                ),
+                name="rem_uniq_nodays",
+            ),
         ]
 
     def __str__(self):
-        return f"{self.reminder_type} for {self.action.action_id} to {self.user.username}"
+        action = _related_label(self, "action", "action_id")
+        return f"{self.reminder_type} for {action} to {_related_label(self, 'user', 'username')}"
+
+    @classmethod
+    def log_many(cls, entries):
+        """
+        Insert unsaved log entries in batched INSERTs.
+
+        An entry whose key is already logged under the unique constraints
+        replaces that log. Sweeps only skip keys logged today, so a key repeats
+        when an action's due date moves and the reminder is sent again; the log
+        of that send is kept rather than dropped. Collisions with a log written
+        concurrently are still dropped by the database rather than raising.
+        ``sent_at`` is filled from ``auto_now_add``; primary keys are not set on
+        the returned objects.
+        """
+        superseded = Q()
+        for entry in entries:
+            if (
+                entry.days_before_due is not None
+                or entry.reminder_type in NODAYS_UNIQUE_REMINDER_TYPES
+            ):
+                superseded |= Q(
+                    action_id=entry.action_id,
+                    user_id=entry.user_id,
+                    reminder_type=entry.reminder_type,
+                    days_before_due=entry.days_before_due,
+                )
+
+        with transaction.atomic():
+            if superseded:
+                cls.objects.filter(superseded).delete()
+            return cls.objects.bulk_create(entries, batch_size=1000, ignore_conflicts=True)
@@ -1,18 +1,179 @@
+from celery import shared_task
 from django.core.mail import send_mail, send_mass_mail
 from django.conf import settings
-from django.template.loader import render_to_string
+from django.template.loader import get_template
 from django.utils import timezone
-from django.utils.html import strip_tags
-from django.db.models import Q
+from django.db import connection, transaction
+from django.db.models import Max, Q, QuerySet
 from django.contrib.auth import get_user_model
 import logging
+from collections import defaultdict
+from contextlib import contextmanager
 from datetime import datetime, timedelta
+from functools import cache, partial
+from smtplib import SMTPException
 
-from .models import RiskAction, RiskActionReminderConfiguration, RiskActionReminderLog, Risk
+from django_tenants.utils import get_public_schema_name, schema_context, tenant_context
+
+from core.models import Tenant
+
+from .models import (
+    LEVEL_TO_BITS,
+    RiskAction,
+    RiskActionReminderConfiguration,
+    RiskActionReminderLog,
+    Risk,
+)
 
 User = get_user_model()
 logger = logging.getLogger(__name__)
 
+# Reminder subject formats by reminder type; advance warnings due tomorrow
+# use the "due_tomorrow" wording
+_SUBJECT_FORMATS = {
+    "overdue": "⚠️ OVERDUE: Risk Action {action_id} - {title}",
+    "due_today": "📅 DUE TODAY: Risk Action {action_id} - {title}",
+    "due_tomorrow": "⏰ Due Tomorrow: Risk Action {action_id} - {title}",
+    "advance_warning": "📋 Due in {days} days: Risk Action {action_id} - {title}",
+}
+_DEFAULT_SUBJECT_FORMAT = "Risk Action Reminder: {action_id} - {title}"
+_DUMMY_EMAIL_BACKEND = "django.core.mail.backends.dummy.EmailBackend"
+
+# Reminder urgency is the higher of what the action priority and the days left
+# imply. Days are bucketed at 0-1 (high), 2-3 (medium) and 4+ (no floor).
+_DAYS_URGENCY = ("high", "high", "medium", "medium", "low")
+_URGENCY_BY_DAYS = {
+    (priority, days): max(priority, floor, key=LEVEL_TO_BITS.__getitem__)
+    for priority in LEVEL_TO_BITS
+    for days, floor in enumerate(_DAYS_URGENCY)
+}
+
+
+def email_delivery_disabled():
+    """Whether outbound email is switched off, so notifications can skip all work."""
+    return not settings.DEFAULT_FROM_EMAIL or settings.EMAIL_BACKEND == _DUMMY_EMAIL_BACKEND
+
+
+def _site_domain():
+    return getattr(settings, "SITE_DOMAIN", "http://localhost:8000")
+
+
+def _action_urls(action):
+    """Link context shared by every action email; uses the FK id so the risk isn't loaded."""
+    site_domain = _site_domain()
+    return {
+        "site_domain": site_domain,
+        "action_url": f"{site_domain}/admin/risk/riskaction/{action.pk}/change/",
+        "risk_url": f"{site_domain}/admin/risk/risk/{action.risk_id}/change/",
+    }
+
+
+def _email_opted_out_user_ids(users):
+    """
+    IDs of ``users`` who turned email notifications off, in one read-only query.
+
+    Users without a configuration have the defaults, which send email.
+    """
+    return set(
+        RiskActionReminderConfiguration.objects.filter(
+            user__in=users, email_notifications=False
+        ).values_list("user_id", flat=True)
+    )
+
+
+@cache
+def _email_template(template_name):
+    """Compiled email template, resolved through the template loaders once per process."""
+    return get_template(template_name)
+
+
+def _render_email(name, context):
+    """Render the HTML and plain-text bodies of ``emails/<name>``."""
+    return (
+        _email_template(f"emails/{name}.html").render(context),
+        _email_template(f"emails/{name}.txt").render(context),
+    )
+
+
+@contextmanager
+def tenant_schema(schema_name):
+    """
+    Run the block in tenant ``schema_name``'s schema, as the request or task
+    that queued the work did. Without a tenant schema the connection is left
+    on the schema it is already using.
+    """
+    if not schema_name or schema_name == get_public_schema_name():
+        yield
+        return
+
+    with schema_context(get_public_schema_name()):
+        tenant = Tenant.objects.get(schema_name=schema_name)
+
+    with tenant_context(tenant):
+        yield
+
+
+def _queue_notification_email(subject, plain_message, html_message, recipient_list, log_id=None):
+    """
+    Queue send_notification_email once the current transaction commits, for
+    the current tenant's schema, so a rolled-back change sends nothing and the
+    worker always finds the committed reminder log.
+    """
+    transaction.on_commit(
+        partial(
+            send_notification_email.delay,
+            subject,
+            plain_message,
+            html_message,
+            recipient_list,
+            log_id=log_id,
+            schema_name=connection.schema_name,
+        )
+    )
+
+
+# SMTP failures worth retrying; anything else fails the task at once.
+_RETRYABLE_EMAIL_ERRORS = (SMTPException, ConnectionError, TimeoutError)
+
+
+@shared_task(
+    bind=True,
+    autoretry_for=_RETRYABLE_EMAIL_ERRORS,
+    retry_backoff=True,
+    max_retries=3,
+    acks_late=True,
+)
+def send_notification_email(
+    self, subject, plain_message, html_message, recipient_list, log_id=None, schema_name=None
+):
+    """
+    Deliver a rendered notification email from a worker, so the request that
+    triggered it does not wait on SMTP. Marks reminder log ``log_id``, in
+    tenant ``schema_name``, as sent once the message is accepted, or records
+    the error once the last retry fails.
+
+    Defined here rather than in tasks.py, which imports this module.
+    """
+    try:
+        email_sent = send_mail(
+            subject=subject,
+            message=plain_message,
+            from_email=settings.DEFAULT_FROM_EMAIL,
+            recipient_list=recipient_list,
+            html_message=html_message,
+            fail_silently=False,
+        )
+    except _RETRYABLE_EMAIL_ERRORS as e:
+        # autoretry gives up by re-raising, which would leave the log unmarked
+        if log_id is not None and self.request.retries >= self.max_retries:
+            with tenant_schema(schema_name):
+                RiskActionReminderLog.objects.filter(pk=log_id).update(error_message=str(e))
+        raise
+    if log_id is not None and email_sent:
+        with tenant_schema(schema_name):
+            RiskActionReminderLog.objects.filter(pk=log_id).update(email_sent=True)
+    return email_sent
+
 
 class RiskActionReminderService:
     """
@@ -21,22 +182,43 @@ class RiskActionReminderService:
     """
 
     @staticmethod
-    def send_individual_reminder(action, user, reminder_type, days_before_due=None):
+    def send_individual_reminder(
+        action,
+        user,
+        reminder_type,
+        days_before_due=None,
+        connection=None,
+        config=None,
+        sent_keys=None,
+        log_buffer=None,
+    ):
         """
         Send individual reminder for a specific risk action to a user.
 
         Args:
-            action: RiskAction instance
+            action: RiskAction instance, loaded via RiskAction.objects.for_notification()
+                so rendering does not query for its risk and owner
             user: User instance
             reminder_type: Type of reminder ('advance_warning', 'due_today', 'overdue')
             days_before_due: Days before due date (negative for overdue)
+            connection: Open mail connection to reuse across a batch (optional)
+            config: The user's preloaded RiskActionReminderConfiguration (optional)
+            sent_keys: Set from prefetch_sent_keys(user), checked instead of querying
+                the log and updated with this reminder (optional)
+            log_buffer: List to append the unsaved log entry to, for the caller to
+                write with RiskActionReminderLog.log_many() (optional)
 
         Returns:
             bool: True if email sent successfully, False otherwise
         """
+        if email_delivery_disabled():
+            return False
+
+        sent_key = (action.pk, reminder_type, days_before_due)
         try:
             # Get user's reminder configuration
-            config = RiskActionReminderConfiguration.get_or_create_for_user(user)
+            if config is None:
+                config = RiskActionReminderConfiguration.get_or_create_for_user(user)
 
             # Check if user wants reminders
             if not config.enable_reminders or not config.email_notifications:
@@ -50,12 +232,16 @@ class RiskActionReminderService:
                 return False
 
             # Skip if already sent this reminder
-            reminder_log_exists = RiskActionReminderLog.objects.filter(
-                action=action,
-                user=user,
-                reminder_type=reminder_type,
-                days_before_due=days_before_due,
-            ).exists()
+            if sent_keys is not None:
+                reminder_log_exists = sent_key in sent_keys
+            else:
+                reminder_log_exists = RiskActionReminderLog.objects.filter(
+                    action=action,
+                    user=user,
+                    reminder_type=reminder_type,
+                    days_before_due=days_before_due,
+                    sent_at__gte=RiskActionReminderService._sent_keys_window_start(),
+                ).exists()
 
             if reminder_log_exists:
                 logger.debug(
@@ -74,9 +260,7 @@ class RiskActionReminderService:
                 "reminder_type": reminder_type,
                 "days_before_due": days_before_due,
                 "urgency": urgency,
-                "site_domain": getattr(settings, "SITE_DOMAIN", "http://localhost:8000"),
-                "action_url": f"{getattr(settings, 'SITE_DOMAIN', 'http://localhost:8000')}/admin/risk/riskaction/{action.pk}/change/",
-                "risk_url": f"{getattr(settings, 'SITE_DOMAIN', 'http://localhost:8000')}/admin/risk/risk/{action.risk.pk}/change/",
+                **_action_urls(action),
             }
 
             # Generate subject based on reminder type
@@ -85,8 +269,7 @@ class RiskActionReminderService:
             )
 
             # Render email templates
-            html_message = render_to_string("emails/risk_action_reminder.html", context)
-            plain_message = render_to_string("emails/risk_action_reminder.txt", context)
+            html_message, plain_message = _render_email("risk_action_reminder", context)
 
             # Send email
             email_sent = send_mail(
@@ -96,10 +279,12 @@ class RiskActionReminderService:
                 recipient_list=[user.email],
                 html_message=html_message,
                 fail_silently=False,
+                connection=connection,
             )
 
             # Log the reminder
-            RiskActionReminderLog.objects.create(
+            RiskActionReminderService._log(
+                log_buffer,
                 action=action,
                 user=user,
                 reminder_type=reminder_type,
@@ -107,6 +292,8 @@ class RiskActionReminderService:
                 email_sent=bool(email_sent),
                 days_before_due=days_before_due,
             )
+            if sent_keys is not None:
+                sent_keys.add(sent_key)
 
             logger.info(f"Sent {reminder_type} reminder for {action.action_id} to {user.email}")
             return True
@@ -116,7 +303,8 @@ class RiskActionReminderService:
             logger.error(error_msg)
 
             # Log failed attempt
-            RiskActionReminderLog.objects.create(
+            RiskActionReminderService._log(
+                log_buffer,
                 action=action,
                 user=user,
                 reminder_type=reminder_type,
@@ -125,62 +313,166 @@ class RiskActionReminderService:
                 error_message=str(e),
                 days_before_due=days_before_due,
             )
+            if sent_keys is not None:
+                sent_keys.add(sent_key)
             return False
 
     @staticmethod
-    def send_weekly_digest(user, actions):
+    def _sent_keys_window_start():
+        # A key's days_before_due pins it to one day per due date, so only
+        # today's logs can repeat a reminder this sweep would send.
+        return timezone.localtime().replace(hour=0, minute=0, second=0, microsecond=0)
+
+    @staticmethod
+    def _log(log_buffer, **fields):
+        """Save a reminder log now, or buffer it for a batched insert."""
+        entry = RiskActionReminderLog(**fields)
+        if log_buffer is None:
+            RiskActionReminderLog.log_many([entry])
+        else:
+            log_buffer.append(entry)
+
+    @staticmethod
+    def prefetch_sent_keys(user):
+        """
+        Keys of the reminders already logged for ``user`` today, in one query.
+
+        Returns:
+            set: (action_id, reminder_type, days_before_due) tuples, as
+            send_individual_reminder's ``sent_keys`` expects
+        """
+        return RiskActionReminderService.prefetch_sent_keys_by_user([user])[user.pk]
+
+    @staticmethod
+    def prefetch_sent_keys_by_user(users):
+        """
+        prefetch_sent_keys() for several users at once, in one query.
+
+        Returns:
+            defaultdict: user_id -> set of sent keys (empty for users with none)
+        """
+        keys_by_user_id = defaultdict(set)
+        for user_id, *key in RiskActionReminderLog.objects.filter(
+            user__in=users, sent_at__gte=RiskActionReminderService._sent_keys_window_start()
+        ).values_list("user_id", "action_id", "reminder_type", "days_before_due"):
+            keys_by_user_id[user_id].add(tuple(key))
+        return keys_by_user_id
+
+    @staticmethod
+    def prefetch_last_overdue_sent(user):
+        """
+        When each of ``user``'s actions last had an overdue reminder emailed, in one query.
+
+        Returns:
+            dict: action_id -> sent_at of the latest sent overdue reminder
+        """
+        return RiskActionReminderService.prefetch_last_overdue_sent_by_user([user])[user.pk]
+
+    @staticmethod
+    def prefetch_last_overdue_sent_by_user(users):
+        """
+        prefetch_last_overdue_sent() for several users at once, in one query.
+
+        Returns:
+            defaultdict: user_id -> {action_id: sent_at} (empty for users with none)
+        """
+        last_sent_by_user_id = defaultdict(dict)
+        for user_id, action_id, last_sent_at in (
+            RiskActionReminderLog.objects.filter(
+                user__in=users, reminder_type="overdue", email_sent=True
+            )
+            .values("user_id", "action_id")
+            .annotate(last_sent_at=Max("sent_at"))
+            .values_list("user_id", "action_id", "last_sent_at")
+        ):
+            last_sent_by_user_id[user_id][action_id] = last_sent_at
+        return last_sent_by_user_id
+
+    @staticmethod
+    def _digest_window_start():
+        return timezone.now().date() - timedelta(days=7)
+
+    @staticmethod
+    def prefetch_recent_digest_user_ids():
+        """IDs of users sent a weekly digest within the last week, in one query."""
+        return set(
+            RiskActionReminderLog.objects.filter(
+                reminder_type="weekly_digest",
+                sent_at__date__gte=RiskActionReminderService._digest_window_start(),
+            ).values_list("user_id", flat=True)
+        )
+
+    @staticmethod
+    def send_weekly_digest(
+        user, actions, connection=None, config=None, recent_digest_user_ids=None
+    ):
         """
         Send weekly digest of risk actions to user.
 
         Args:
             user: User instance
-            actions: QuerySet of RiskAction instances
+            actions: QuerySet of RiskAction instances, evaluated once, or a
+                list of actions already loaded with for_notification()
+            connection: Open mail connection to reuse across a batch (optional)
+            config: The user's preloaded RiskActionReminderConfiguration (optional)
+            recent_digest_user_ids: Set from prefetch_recent_digest_user_ids(),
+                checked instead of querying the log (optional)
 
         Returns:
             bool: True if email sent successfully, False otherwise
         """
+        if email_delivery_disabled():
+            return False
+
         try:
-            config = RiskActionReminderConfiguration.get_or_create_for_user(user)
+            if config is None:
+                config = RiskActionReminderConfiguration.get_or_create_for_user(user)
 
             if not config.weekly_digest_enabled or not config.email_notifications:
                 return False
 
             # Check if digest already sent this week
-            week_start = timezone.now().date() - timedelta(days=7)
-            digest_sent_this_week = RiskActionReminderLog.objects.filter(
-                user=user, reminder_type="weekly_digest", sent_at__date__gte=week_start
-            ).exists()
+            if recent_digest_user_ids is not None:
+                digest_sent_this_week = user.pk in recent_digest_user_ids
+            else:
+                digest_sent_this_week = RiskActionReminderLog.objects.filter(
+                    user=user,
+                    reminder_type="weekly_digest",
+                    sent_at__date__gte=RiskActionReminderService._digest_window_start(),
+                ).exists()
 
             if digest_sent_this_week:
                 return False
 
-            if not actions.exists():
+            # Fetch once and partition in Python rather than querying per section
+            if isinstance(actions, QuerySet):
+                actions = actions.for_notification()
+            actions = list(actions)
+            if not actions:
                 return False
 
+            now = timezone.now()
+            today = now.date()
+            next_week = today + timedelta(days=7)
+            open_actions = [a for a in actions if a.status in ("pending", "in_progress")]
+
             # Organize actions by status and priority
             context = {
                 "user": user,
                 "actions": actions,
-                "overdue_actions": actions.filter(
-                    due_date__lt=timezone.now().date(), status__in=["pending", "in_progress"]
-                ),
-                "due_soon_actions": actions.filter(
-                    due_date__gte=timezone.now().date(),
-                    due_date__lte=timezone.now().date() + timedelta(days=7),
-                    status__in=["pending", "in_progress"],
-                ),
-                "in_progress_actions": actions.filter(status="in_progress"),
-                "high_priority_actions": actions.filter(
-                    priority__in=["high", "critical"], status__in=["pending", "in_progress"]
-                ),
-                "site_domain": getattr(settings, "SITE_DOMAIN", "http://localhost:8000"),
-                "week_ending": timezone.now().date(),
+                "overdue_actions": [a for a in open_actions if a.due_date < today],
+                "due_soon_actions": [a for a in open_actions if today <= a.due_date <= next_week],
+                "in_progress_actions": [a for a in actions if a.status == "in_progress"],
+                "high_priority_actions": [
+                    a for a in open_actions if a.priority in ("high", "critical")
+                ],
+                "site_domain": _site_domain(),
+                "week_ending": today,
             }
 
-            subject = f"Weekly Risk Action Digest - {timezone.now().strftime('%B %d, %Y')}"
+            subject = f"Weekly Risk Action Digest - {now:%B %d, %Y}"
 
-            html_message = render_to_string("emails/risk_action_weekly_digest.html", context)
-            plain_message = render_to_string("emails/risk_action_weekly_digest.txt", context)
+            html_message, plain_message = _render_email("risk_action_weekly_digest", context)
 
             email_sent = send_mail(
                 subject=subject,
@@ -189,19 +481,20 @@ class RiskActionReminderService:
                 recipient_list=[user.email],
                 html_message=html_message,
                 fail_silently=False,
+                connection=connection,
             )
 
-            # Log the digest (use first action for logging purposes)
-            if actions.exists():
-                RiskActionReminderLog.objects.create(
-                    action=actions.first(),
-                    user=user,
-                    reminder_type="weekly_digest",
-                    subject=subject,
-                    email_sent=bool(email_sent),
-                )
+            # Log the digest (use first action for logging purposes); the early
+            # return above already guarantees there is one.
+            RiskActionReminderLog.objects.create(
+                action=actions[0],
+                user=user,
+                reminder_type="weekly_digest",
+                subject=subject,
+                email_sent=bool(email_sent),
+            )
 
-            logger.info(f"Sent weekly digest to {user.email} with {actions.count()} actions")
+            logger.info(f"Sent weekly digest to {user.email} with {len(actions)} actions")
             return True
 
         except Exception as e:
@@ -211,7 +504,7 @@ class RiskActionReminderService:
     @staticmethod
     def send_assignment_notification(action, assigned_user, assigner=None):
         """
-        Send notification when a risk action is assigned to a user.
+        Queue notification when a risk action is assigned to a user.
 
         Args:
             action: RiskAction instance
@@ -219,8 +512,11 @@ class RiskActionReminderService:
             assigner: User instance who assigned the action (optional)
 
         Returns:
-            bool: True if email sent successfully, False otherwise
+            bool: True if email was queued, False otherwise
         """
+        if email_delivery_disabled():
+            return False
+
         try:
             config = RiskActionReminderConfiguration.get_or_create_for_user(assigned_user)
 
@@ -232,36 +528,28 @@ class RiskActionReminderService:
                 "action": action,
                 "risk": action.risk,
                 "assigner": assigner,
-                "site_domain": getattr(settings, "SITE_DOMAIN", "http://localhost:8000"),
-                "action_url": f"{getattr(settings, 'SITE_DOMAIN', 'http://localhost:8000')}/admin/risk/riskaction/{action.pk}/change/",
-                "risk_url": f"{getattr(settings, 'SITE_DOMAIN', 'http://localhost:8000')}/admin/risk/risk/{action.risk.pk}/change/",
+                **_action_urls(action),
             }
 
             subject = f"Risk Action Assigned: {action.title} ({action.action_id})"
 
-            html_message = render_to_string("emails/risk_action_assignment.html", context)
-            plain_message = render_to_string("emails/risk_action_assignment.txt", context)
-
-            email_sent = send_mail(
-                subject=subject,
-                message=plain_message,
-                from_email=settings.DEFAULT_FROM_EMAIL,
-                recipient_list=[assigned_user.email],
-                html_message=html_message,
-                fail_silently=False,
-            )
+            html_message, plain_message = _render_email("risk_action_assignment", context)
 
-            # Log the assignment notification
-            RiskActionReminderLog.objects.create(
+            # Log the assignment notification; the worker marks it sent
+            log = RiskActionReminderLog.objects.create(
                 action=action,
                 user=assigned_user,
                 reminder_type="assignment",
                 subject=subject,
-                email_sent=bool(email_sent),
+                email_sent=False,
+            )
+
+            _queue_notification_email(
+                subject, plain_message, html_message, [assigned_user.email], log_id=log.pk
             )
 
             logger.info(
-                f"Sent assignment notification for {action.action_id} to {assigned_user.email}"
+                f"Queued assignment notification for {action.action_id} to {assigned_user.email}"
             )
             return True
 
@@ -272,31 +560,21 @@ class RiskActionReminderService:
     @staticmethod
     def _determine_urgency(action, days_before_due):
         """Determine urgency level based on action priority and days until due."""
-        if days_before_due is not None and days_before_due < 0:
+        if days_before_due is None:
+            return action.priority if action.priority in LEVEL_TO_BITS else "low"
+        if days_before_due < 0:
             return "critical"  # Overdue
-        elif action.priority == "critical":
-            return "critical"
-        elif action.priority == "high" or (days_before_due is not None and days_before_due <= 1):
-            return "high"
-        elif action.priority == "medium" or (days_before_due is not None and days_before_due <= 3):
-            return "medium"
-        else:
-            return "low"
+        days = min(days_before_due, len(_DAYS_URGENCY) - 1)
+        return _URGENCY_BY_DAYS.get((action.priority, days), _DAYS_URGENCY[days])
 
     @staticmethod
     def _generate_subject(action, reminder_type, days_before_due):
         """Generate email subject based on reminder type and context."""
-        if reminder_type == "overdue":
-            return f"⚠️ OVERDUE: Risk Action {action.action_id} - {action.title}"
-        elif reminder_type == "due_today":
-            return f"📅 DUE TODAY: Risk Action {action.action_id} - {action.title}"
-        elif reminder_type == "advance_warning":
-            if days_before_due == 1:
-                return f"⏰ Due Tomorrow: Risk Action {action.action_id} - {action.title}"
-            else:
-                return f"📋 Due in {days_before_due} days: Risk Action {action.action_id} - {action.title}"
-        else:
-            return f"Risk Action Reminder: {action.action_id} - {action.title}"
+        if reminder_type == "advance_warning" and days_before_due == 1:
+            reminder_type = "due_tomorrow"
+        return _SUBJECT_FORMATS.get(reminder_type, _DEFAULT_SUBJECT_FORMAT).format(
+            action_id=action.action_id, title=action.title, days=days_before_due
+        )
 
 
 class RiskActionNotificationService:
@@ -315,82 +593,43 @@ class RiskActionNotificationService:
             new_status: New status
             changed_by: User who changed the status (optional)
         """
-        try:
-            # Notify assigned user if different from the person making the change
-            if action.assigned_to and action.assigned_to != changed_by:
-                config = RiskActionReminderConfiguration.get_or_create_for_user(action.assigned_to)
-
-                if config.email_notifications:
-                    context = {
-                        "user": action.assigned_to,
-                        "action": action,
-                        "risk": action.risk,
-                        "old_status": old_status,
-                        "new_status": new_status,
-                        "changed_by": changed_by,
-                        "site_domain": getattr(settings, "SITE_DOMAIN", "http://localhost:8000"),
-                        "action_url": f"{getattr(settings, 'SITE_DOMAIN', 'http://localhost:8000')}/admin/risk/riskaction/{action.pk}/change/",
-                    }
+        if email_delivery_disabled():
+            return
 
-                    subject = (
-                        f"Risk Action Status Update: {action.action_id} - Now {new_status.title()}"
-                    )
+        try:
+            # Notify the assignee and the risk owner, skipping whoever made the change
+            recipients = []
+            for user in (action.assigned_to, action.risk.risk_owner):
+                if user and user != changed_by and user not in recipients:
+                    recipients.append(user)
+            if not recipients:
+                return
 
-                    html_message = render_to_string(
-                        "emails/risk_action_status_change.html", context
-                    )
-                    plain_message = render_to_string(
-                        "emails/risk_action_status_change.txt", context
-                    )
+            opted_out = _email_opted_out_user_ids(recipients)
 
-                    send_mail(
-                        subject=subject,
-                        message=plain_message,
-                        from_email=settings.DEFAULT_FROM_EMAIL,
-                        recipient_list=[action.assigned_to.email],
-                        html_message=html_message,
-                        fail_silently=True,
-                    )
+            context = {
+                "action": action,
+                "risk": action.risk,
+                "old_status": old_status,
+                "new_status": new_status,
+                "changed_by": changed_by,
+                **_action_urls(action),
+            }
+            subject = f"Risk Action Status Update: {action.action_id} - Now {new_status.title()}"
 
-                    logger.info(
-                        f"Sent status change notification for {action.action_id} to {action.assigned_to.email}"
-                    )
+            for user in recipients:
+                if user.pk in opted_out:
+                    continue
 
-            # Also notify risk owner if different from assigned user and changer
-            if (
-                action.risk.risk_owner
-                and action.risk.risk_owner != action.assigned_to
-                and action.risk.risk_owner != changed_by
-            ):
-                context = {
-                    "user": action.risk.risk_owner,
-                    "action": action,
-                    "risk": action.risk,
-                    "old_status": old_status,
-                    "new_status": new_status,
-                    "changed_by": changed_by,
-                    "site_domain": getattr(settings, "SITE_DOMAIN", "http://localhost:8000"),
-                    "action_url": f"{getattr(settings, 'SITE_DOMAIN', 'http://localhost:8000')}/admin/risk/riskaction/{action.pk}/change/",
-                }
-
-                subject = (
-                    f"Risk Action Status Update: {action.action_id} - Now {new_status.title()}"
+                # The greeting is personalised, so each recipient gets their own render
+                html_message, plain_message = _render_email(
+                    "risk_action_status_change", {**context, "user": user}
                 )
 
-                html_message = render_to_string("emails/risk_action_status_change.html", context)
-                plain_message = render_to_string("emails/risk_action_status_change.txt", context)
-
-                send_mail(
-                    subject=subject,
-                    message=plain_message,
-                    from_email=settings.DEFAULT_FROM_EMAIL,
-                    recipient_list=[action.risk.risk_owner.email],
-                    html_message=html_message,
-                    fail_silently=True,
-                )
+                _queue_notification_email(subject, plain_message, html_message, [user.email])
 
                 logger.info(
-                    f"Sent status change notification for {action.action_id} to risk owner {action.risk.risk_owner.email}"
+                    f"Queued status change notification for {action.action_id} to {user.email}"
                 )
 
         except Exception as e:
@@ -405,44 +644,36 @@ class RiskActionNotificationService:
             evidence: RiskActionEvidence instance
             uploader: User who uploaded the evidence (optional)
         """
+        if email_delivery_disabled():
+            return
+
         try:
             action = evidence.action
 
             # Notify assigned user if different from uploader
             if action.assigned_to and action.assigned_to != uploader:
-                config = RiskActionReminderConfiguration.get_or_create_for_user(action.assigned_to)
-
-                if config.email_notifications:
+                if action.assigned_to_id not in _email_opted_out_user_ids([action.assigned_to]):
                     context = {
                         "user": action.assigned_to,
                         "action": action,
                         "risk": action.risk,
                         "evidence": evidence,
                         "uploader": uploader,
-                        "site_domain": getattr(settings, "SITE_DOMAIN", "http://localhost:8000"),
-                        "action_url": f"{getattr(settings, 'SITE_DOMAIN', 'http://localhost:8000')}/admin/risk/riskaction/{action.pk}/change/",
+                        **_action_urls(action),
                     }
 
                     subject = f"New Evidence Uploaded: {action.action_id} - {evidence.title}"
 
-                    html_message = render_to_string(
-                        "emails/risk_action_evidence_uploaded.html", context
-                    )
-                    plain_message = render_to_string(
-                        "emails/risk_action_evidence_uploaded.txt", context
+                    html_message, plain_message = _render_email(
+                        "risk_action_evidence_uploaded", context
                     )
 
-                    send_mail(
-                        subject=subject,
-                        message=plain_message,
-                        from_email=settings.DEFAULT_FROM_EMAIL,
-                        recipient_list=[action.assigned_to.email],
-                        html_message=html_message,
-                        fail_silently=True,
+                    _queue_notification_email(
+                        subject, plain_message, html_message, [action.assigned_to.email]
                     )
 
                     logger.info(
-                        f"Sent evidence upload notification for {action.action_id} to {action.assigned_to.email}"
+                        f"Queued evidence upload notification for {action.action_id} to {action.assigned_to.email}"
                     )
 
         except Exception as e:
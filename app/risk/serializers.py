@@ -1,11 +1,16 @@
 import logging
+from datetime import datetime
+from functools import cached_property, partial
 
 from django.conf import settings
 from rest_framework import serializers
 from drf_spectacular.utils import extend_schema_field
 from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import Count, Prefetch
 from django.utils import timezone
 from .models import (
+    LEVEL_TO_BITS,
     Risk,
     RiskCategory,
     RiskMatrix,
@@ -15,10 +20,16 @@ from .models import (
     RiskActionEvidence,
     RiskActionReminderConfiguration,
 )
+from .notifications import RiskActionNotificationService, RiskActionReminderService
 
 User = get_user_model()
 logger = logging.getLogger(__name__)
 
+# Risk statuses that only make sense once a treatment strategy is chosen.
+_STATUSES_REQUIRING_TREATMENT = frozenset(
+    {"treatment_planned", "treatment_in_progress", "mitigated"}
+)
+
 
 class RiskCategorySerializer(serializers.ModelSerializer):
     """Serializer for Risk Categories."""
@@ -31,8 +42,9 @@ class RiskCategorySerializer(serializers.ModelSerializer):
         read_only_fields = ["created_at", "updated_at"]
 
     def get_risk_count(self, obj) -> int:
-        """Get count of risks in this category."""
-        return obj.risks.count()
+        """Get count of risks in this category, from the ``risk_count`` annotation if present."""
+        risk_count = getattr(obj, "risk_count", None)
+        return obj.risks.count() if risk_count is None else risk_count
 
 
 class RiskMatrixSerializer(serializers.ModelSerializer):
@@ -57,6 +69,13 @@ class RiskMatrixSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ["created_at", "updated_at", "created_by"]
 
+    def update(self, instance, validated_data):
+        """Write only the submitted columns, so renames don't rewrite matrix_config."""
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+        instance.save(update_fields=[*validated_data, "updated_at"])
+        return instance
+
     def validate_matrix_config(self, value):
         """Validate matrix configuration structure."""
         if not isinstance(value, dict):
@@ -65,23 +84,27 @@ class RiskMatrixSerializer(serializers.ModelSerializer):
         impact_levels = self.initial_data.get("impact_levels", 5)
         likelihood_levels = self.initial_data.get("likelihood_levels", 5)
 
+        impact_keys = [str(impact) for impact in range(1, impact_levels + 1)]
+        likelihood_keys = [str(likelihood) for likelihood in range(1, likelihood_levels + 1)]
+
         # Validate structure
-        for impact in range(1, impact_levels + 1):
-            impact_str = str(impact)
-            if impact_str not in value:
+        missing = set(impact_keys).difference(value)
+        if missing:
+            raise serializers.ValidationError(
+                f"Missing impact level {min(missing, key=int)} in matrix configuration"
+            )
+
+        for impact in impact_keys:
+            row = value[impact]
+            missing = set(likelihood_keys).difference(row if isinstance(row, dict) else ())
+            if missing:
                 raise serializers.ValidationError(
-                    f"Missing impact level {impact} in matrix configuration"
+                    f"Missing likelihood level {min(missing, key=int)} for impact {impact}"
                 )
 
-            for likelihood in range(1, likelihood_levels + 1):
-                likelihood_str = str(likelihood)
-                if likelihood_str not in value[impact_str]:
-                    raise serializers.ValidationError(
-                        f"Missing likelihood level {likelihood} for impact {impact}"
-                    )
-
-                level = value[impact_str][likelihood_str]
-                if level not in ["low", "medium", "high", "critical"]:
+            for likelihood in likelihood_keys:
+                level = row[likelihood]
+                if not isinstance(level, str) or level not in LEVEL_TO_BITS:
                     raise serializers.ValidationError(
                         f"Invalid risk level '{level}' at impact {impact}, likelihood {likelihood}"
                     )
@@ -89,6 +112,15 @@ class RiskMatrixSerializer(serializers.ModelSerializer):
         return value
 
 
+class NestedRiskMatrixSerializer(serializers.ModelSerializer):
+    """Identifies a risk's matrix without its level grid."""
+
+    class Meta:
+        model = RiskMatrix
+        fields = ["id", "name", "is_default"]
+        read_only_fields = fields
+
+
 class UserBasicSerializer(serializers.ModelSerializer):
     """Basic user serializer for risk ownership."""
 
@@ -154,19 +186,34 @@ class RiskListSerializer(serializers.ModelSerializer):
             "created_at",
             "updated_at",
         ]
-        read_only_fields = [
-            "risk_id",
-            "risk_level",
-            "risk_score",
-            "is_overdue_for_review",
-            "days_until_review",
-            "is_active",
-            "created_at",
-            "updated_at",
-        ]
+        # Output-only: list, summary and bulk-create responses never write
+        # through it, so no field needs a queryset or validators built.
+        read_only_fields = fields
+
+    # Unbounded text columns this serializer never renders.
+    UNRENDERED_TEXT_FIELDS = (
+        "treatment_description",
+        "potential_impact_description",
+        "current_controls",
+    )
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Join the relations rendered for each risk and leave unrendered text unread."""
+        return queryset.select_related("category", "risk_owner").defer(*cls.UNRENDERED_TEXT_FIELDS)
+
+
+class SparseFieldsMixin:
+    """Accept ``fields=[...]`` to render only the named fields; unknown names are ignored."""
 
+    def __init__(self, *args, fields=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in self.fields.keys() - set(fields):
+                self.fields.pop(name)
 
-class RiskDetailSerializer(serializers.ModelSerializer):
+
+class RiskDetailSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """Detailed Risk serializer with all fields and related data."""
 
     risk_level_display = serializers.CharField(source="get_risk_level_display", read_only=True)
@@ -190,8 +237,8 @@ class RiskDetailSerializer(serializers.ModelSerializer):
     # Related data
     category = RiskCategorySerializer(read_only=True)
     risk_owner = UserBasicSerializer(read_only=True)
-    risk_matrix = RiskMatrixSerializer(read_only=True)
-    notes = RiskNoteSerializer(many=True, read_only=True)
+    risk_matrix = NestedRiskMatrixSerializer(read_only=True)
+    notes = RiskNoteSerializer(source="prefetched_notes", many=True, read_only=True)
 
     class Meta:
         model = Risk
@@ -246,6 +293,26 @@ class RiskDetailSerializer(serializers.ModelSerializer):
             "created_by",
         ]
 
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Join or prefetch every relation rendered for each risk."""
+        return queryset.select_related("risk_owner", "created_by", "risk_matrix").prefetch_related(
+            # Annotated so the nested category's risk_count needs no query of its own
+            Prefetch("category", queryset=RiskCategory.objects.annotate(risk_count=Count("risks"))),
+            # A plain list, newest first, so rendering skips the related manager
+            Prefetch(
+                "notes",
+                queryset=RiskNote.objects.select_related("created_by"),
+                to_attr="prefetched_notes",
+            ),
+        )
+
+    def to_representation(self, instance):
+        if "notes" in self.fields and not hasattr(instance, "prefetched_notes"):
+            # Not loaded through setup_eager_loading; fetch the notes directly.
+            instance.prefetched_notes = list(instance.notes.select_related("created_by"))
+        return super().to_representation(instance)
+
 
 class RiskCreateUpdateSerializer(serializers.ModelSerializer):
     """Serializer for creating and updating risks."""
@@ -287,10 +354,7 @@ class RiskCreateUpdateSerializer(serializers.ModelSerializer):
         status = data.get("status")
         treatment_strategy = data.get("treatment_strategy")
 
-        if (
-            status in ["treatment_planned", "treatment_in_progress", "mitigated"]
-            and not treatment_strategy
-        ):
+        if status in _STATUSES_REQUIRING_TREATMENT and not treatment_strategy:
             raise serializers.ValidationError(
                 {"treatment_strategy": "Treatment strategy is required for this status"}
             )
@@ -313,10 +377,7 @@ class RiskStatusUpdateSerializer(serializers.Serializer):
         treatment_strategy = data.get("treatment_strategy")
 
         # Require treatment strategy for certain statuses
-        if (
-            status in ["treatment_planned", "treatment_in_progress", "mitigated"]
-            and not treatment_strategy
-        ):
+        if status in _STATUSES_REQUIRING_TREATMENT and not treatment_strategy:
             raise serializers.ValidationError(
                 {"treatment_strategy": "Treatment strategy is required for this status"}
             )
@@ -325,8 +386,6 @@ class RiskStatusUpdateSerializer(serializers.Serializer):
 
     def update_risk_status(self, risk):
         """Update risk status and create note if provided."""
-        from django.db import transaction
-
         with transaction.atomic():
             # Update risk fields
             risk.status = self.validated_data["status"]
@@ -345,12 +404,15 @@ class RiskStatusUpdateSerializer(serializers.Serializer):
             # Create note if provided
             note_text = self.validated_data.get("note")
             if note_text:
-                RiskNote.objects.create(
+                note = RiskNote.objects.create(
                     risk=risk,
                     note=note_text,
                     note_type="status_change",
                     created_by=self.context["request"].user,
                 )
+                # Keep already-loaded notes (newest first) current for the response.
+                if hasattr(risk, "prefetched_notes"):
+                    risk.prefetched_notes.insert(0, note)
 
         return risk
 
@@ -379,74 +441,76 @@ class BulkRiskCreateSerializer(serializers.Serializer):
     )
 
     def validate_risks(self, value):
-        """Validate individual risk data."""
-        required_fields = ["title", "description"]
-
-        for i, risk_data in enumerate(value):
+        """
+        Validate individual risk data, so that creating the batch cannot fail
+        on any row's content.
+        """
+        title_max_length = Risk._meta.get_field("title").max_length
+        for i, risk_data in enumerate(value, start=1):
             # Check required fields
-            for field in required_fields:
-                if field not in risk_data or not risk_data[field].strip():
+            for field in ("title", "description"):
+                text = risk_data.get(field)
+                if not isinstance(text, str) or not text.strip():
                     raise serializers.ValidationError(
-                        f"Risk {i + 1}: '{field}' is required and cannot be empty"
+                        f"Risk {i}: '{field}' is required and cannot be empty"
                     )
 
-            # Validate optional impact/likelihood overrides
-            if "impact" in risk_data:
-                impact = risk_data["impact"]
-                if not isinstance(impact, int) or impact < 1 or impact > 5:
-                    raise serializers.ValidationError(
-                        f"Risk {i + 1}: 'impact' must be an integer between 1 and 5"
-                    )
+            for field in ("potential_impact_description", "current_controls"):
+                if field in risk_data and not isinstance(risk_data[field], str):
+                    raise serializers.ValidationError(f"Risk {i}: '{field}' must be text")
+            if len(risk_data["title"]) > title_max_length:
+                raise serializers.ValidationError(
+                    f"Risk {i}: 'title' must be at most {title_max_length} characters"
+                )
 
-            if "likelihood" in risk_data:
-                likelihood = risk_data["likelihood"]
-                if not isinstance(likelihood, int) or likelihood < 1 or likelihood > 5:
-                    raise serializers.ValidationError(
-                        f"Risk {i + 1}: 'likelihood' must be an integer between 1 and 5"
-                    )
+            # Validate optional impact/likelihood overrides; exact type so booleans fail
+            for field in ("impact", "likelihood"):
+                if field in risk_data:
+                    score = risk_data[field]
+                    if type(score) is not int or not 1 <= score <= 5:
+                        raise serializers.ValidationError(
+                            f"Risk {i}: '{field}' must be an integer between 1 and 5"
+                        )
 
         return value
 
     def create_bulk_risks(self):
-        """Create multiple risks in bulk."""
-        from django.db import transaction
-
-        created_risks = []
-        errors = []
-
-        with transaction.atomic():
-            for i, risk_data in enumerate(self.validated_data["risks"]):
-                try:
-                    risk = Risk.objects.create(
-                        title=risk_data["title"],
-                        description=risk_data["description"],
-                        category=self.validated_data.get("category"),
-                        risk_owner=self.validated_data.get("risk_owner"),
-                        risk_matrix=self.validated_data.get("risk_matrix"),
-                        impact=risk_data.get("impact", self.validated_data["default_impact"]),
-                        likelihood=risk_data.get(
-                            "likelihood", self.validated_data["default_likelihood"]
-                        ),
-                        next_review_date=self.validated_data.get("next_review_date"),
-                        potential_impact_description=risk_data.get(
-                            "potential_impact_description", ""
-                        ),
-                        current_controls=risk_data.get("current_controls", ""),
-                        created_by=self.context["request"].user,
-                    )
-                    created_risks.append(risk)
-
-                except Exception:
-                    logger.error("Bulk risk creation failed for one item", exc_info=settings.DEBUG)
-                    errors.append(
-                        {
-                            "index": i,
-                            "title": risk_data.get("title", ""),
-                            "error": "Unable to create risk.",
-                        }
-                    )
+        """
+        Create multiple risks in bulk, all or nothing. Every row is validated up
+        front, so a failure here is not caused by a row's content: the batch is
+        rolled back and every row reported.
+        """
+        rows = self.validated_data["risks"]
+        risks = [
+            Risk(
+                title=risk_data["title"],
+                description=risk_data["description"],
+                category=self.validated_data.get("category"),
+                risk_owner=self.validated_data.get("risk_owner"),
+                risk_matrix=self.validated_data.get("risk_matrix"),
+                impact=risk_data.get("impact", self.validated_data["default_impact"]),
+                likelihood=risk_data.get("likelihood", self.validated_data["default_likelihood"]),
+                next_review_date=self.validated_data.get("next_review_date"),
+                potential_impact_description=risk_data.get("potential_impact_description", ""),
+                current_controls=risk_data.get("current_controls", ""),
+                created_by=self.context["request"].user,
+            )
+            for risk_data in rows
+        ]
 
-        return created_risks, errors
+        try:
+            with transaction.atomic():
+                return Risk.create_many(risks), []
+        except Exception:
+            logger.error("Bulk risk creation failed", exc_info=settings.DEBUG)
+            return [], [
+                {
+                    "index": i,
+                    "title": risk_data.get("title", ""),
+                    "error": "Unable to create risk.",
+                }
+                for i, risk_data in enumerate(rows)
+            ]
 
 
 class RiskSummarySerializer(serializers.Serializer):
@@ -522,13 +586,21 @@ class RiskActionEvidenceSerializer(serializers.ModelSerializer):
             "validation_notes",
         ]
 
+    @cached_property
+    def _request_origin(self):
+        # Resolved on first use: nested serializers have no context at __init__.
+        request = self.context.get("request")
+        return request.build_absolute_uri("/").rstrip("/") if request else None
+
     @extend_schema_field(serializers.URLField(allow_null=True))
     def get_file_url(self, obj):
         """Get absolute URL for uploaded file."""
-        if obj.file:
-            request = self.context.get("request")
-            if request:
-                return request.build_absolute_uri(obj.file.url)
+        if obj.file and self._request_origin is not None:
+            url = obj.file.url
+            # Object storage backends already return absolute URLs.
+            if url.startswith("/") and not url.startswith("//"):
+                return f"{self._request_origin}{url}"
+            return self.context["request"].build_absolute_uri(url)
         return None
 
 
@@ -587,16 +659,34 @@ class RiskActionListSerializer(serializers.ModelSerializer):
             "completed_date",
         ]
 
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Join the relations rendered for each action."""
+        return queryset.select_related("risk", "assigned_to")
+
 
-class RiskActionRiskSummarySerializer(serializers.Serializer):
-    id = serializers.IntegerField()
-    risk_id = serializers.CharField()
-    title = serializers.CharField()
-    risk_level = serializers.CharField()
-    risk_level_display = serializers.CharField()
-    status = serializers.CharField()
-    status_display = serializers.CharField()
-    risk_owner = serializers.CharField(allow_null=True)
+class RiskActionRiskSummarySerializer(serializers.ModelSerializer):
+    """Summary of an action's risk, rendered from the joined risk and owner."""
+
+    risk_level_display = serializers.CharField(source="get_risk_level_display", read_only=True)
+    status_display = serializers.CharField(source="get_status_display", read_only=True)
+    risk_owner = serializers.CharField(
+        source="risk_owner.get_full_name", allow_null=True, read_only=True
+    )
+
+    class Meta:
+        model = Risk
+        fields = [
+            "id",
+            "risk_id",
+            "title",
+            "risk_level",
+            "risk_level_display",
+            "status",
+            "status_display",
+            "risk_owner",
+        ]
+        read_only_fields = fields
 
 
 class RiskActionDetailSerializer(serializers.ModelSerializer):
@@ -617,7 +707,7 @@ class RiskActionDetailSerializer(serializers.ModelSerializer):
     is_due_soon = serializers.BooleanField(read_only=True)
 
     # Related data
-    risk_summary = serializers.SerializerMethodField()
+    risk_summary = RiskActionRiskSummarySerializer(source="risk", read_only=True)
     assigned_to = UserBasicSerializer(read_only=True)
     notes = RiskActionNoteSerializer(many=True, read_only=True)
     evidence = RiskActionEvidenceSerializer(many=True, read_only=True)
@@ -672,19 +762,18 @@ class RiskActionDetailSerializer(serializers.ModelSerializer):
             "completed_date",
         ]
 
-    @extend_schema_field(RiskActionRiskSummarySerializer)
-    def get_risk_summary(self, obj):
-        """Get summary information about the related risk."""
-        return {
-            "id": obj.risk.id,
-            "risk_id": obj.risk.risk_id,
-            "title": obj.risk.title,
-            "risk_level": obj.risk.risk_level,
-            "risk_level_display": obj.risk.get_risk_level_display(),
-            "status": obj.risk.status,
-            "status_display": obj.risk.get_status_display(),
-            "risk_owner": obj.risk.risk_owner.get_full_name() if obj.risk.risk_owner else None,
-        }
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Join or prefetch every relation rendered for each action."""
+        return queryset.select_related(
+            "risk", "risk__risk_owner", "assigned_to", "created_by"
+        ).prefetch_related(
+            Prefetch("notes", queryset=RiskActionNote.objects.select_related("created_by")),
+            Prefetch(
+                "evidence",
+                queryset=RiskActionEvidence.objects.select_related("uploaded_by", "validated_by"),
+            ),
+        )
 
 
 class RiskActionCreateUpdateSerializer(serializers.ModelSerializer):
@@ -758,9 +847,6 @@ class RiskActionStatusUpdateSerializer(serializers.Serializer):
 
     def update_action_status(self, action):
         """Update action status and create note if provided."""
-        from django.db import transaction
-        from .notifications import RiskActionNotificationService
-
         old_status = action.status
 
         with transaction.atomic():
@@ -820,8 +906,6 @@ class RiskActionEvidenceCreateUpdateSerializer(serializers.ModelSerializer):
 
     def create(self, validated_data):
         """Create evidence with current user as uploader."""
-        from .notifications import RiskActionNotificationService
-
         validated_data["uploaded_by"] = self.context["request"].user
         validated_data["action"] = self.context["action"]
 
@@ -855,81 +939,124 @@ class RiskActionBulkCreateSerializer(serializers.Serializer):
     )
 
     def validate_actions(self, value):
-        """Validate individual action data."""
-        required_fields = ["title", "description", "due_date"]
+        """
+        Validate individual action data, resolving each row's assignee and
+        dates, so that creating the batch cannot fail on any row's content.
+        """
+        assignee_field = serializers.PrimaryKeyRelatedField(queryset=User.objects.all())
+        date_field = serializers.DateField()
+        title_max_length = RiskAction._meta.get_field("title").max_length
+        choices = {
+            "priority": {choice for choice, _label in RiskAction.PRIORITY_CHOICES},
+            "action_type": {choice for choice, _label in RiskAction.ACTION_TYPES},
+        }
+        assignees = {}
 
-        for i, action_data in enumerate(value):
+        for i, action_data in enumerate(value, start=1):
             # Check required fields
-            for field in required_fields:
+            for field in ("title", "description", "due_date"):
                 if field not in action_data or not str(action_data[field]).strip():
                     raise serializers.ValidationError(
-                        f"Action {i + 1}: '{field}' is required and cannot be empty"
+                        f"Action {i}: '{field}' is required and cannot be empty"
                     )
 
-            # Validate due_date format
-            try:
-                from datetime import datetime
-
-                if isinstance(action_data["due_date"], str):
-                    datetime.strptime(action_data["due_date"], "%Y-%m-%d")
-            except ValueError:
+            for field in ("title", "description", "success_criteria", "dependencies"):
+                if field in action_data and not isinstance(action_data[field], str):
+                    raise serializers.ValidationError(f"Action {i}: '{field}' must be text")
+            if len(action_data["title"]) > title_max_length:
                 raise serializers.ValidationError(
-                    f"Action {i + 1}: 'due_date' must be in YYYY-MM-DD format"
+                    f"Action {i}: 'title' must be at most {title_max_length} characters"
                 )
 
-        return value
-
-    def create_bulk_actions(self):
-        """Create multiple risk actions in bulk."""
-        from django.db import transaction
-        from .notifications import RiskActionReminderService
-
-        created_actions = []
-        errors = []
+            # Validate date formats
+            for field in ("due_date", "start_date"):
+                if action_data.get(field) is not None:
+                    try:
+                        action_data[field] = date_field.to_internal_value(action_data[field])
+                    except serializers.ValidationError:
+                        raise serializers.ValidationError(
+                            f"Action {i}: '{field}' must be in YYYY-MM-DD format"
+                        )
 
-        with transaction.atomic():
-            for i, action_data in enumerate(self.validated_data["actions"]):
-                try:
-                    action = RiskAction.objects.create(
-                        risk=self.validated_data["risk"],
-                        title=action_data["title"],
-                        description=action_data["description"],
-                        action_type=action_data.get(
-                            "action_type", self.validated_data["default_action_type"]
-                        ),
-                        assigned_to=action_data.get("assigned_to")
-                        or self.validated_data.get("assigned_to"),
-                        priority=action_data.get(
-                            "priority", self.validated_data["default_priority"]
-                        ),
-                        start_date=action_data.get("start_date"),
-                        due_date=action_data["due_date"],
-                        success_criteria=action_data.get("success_criteria", ""),
-                        dependencies=action_data.get("dependencies", ""),
-                        created_by=self.context["request"].user,
+            for field, allowed in choices.items():
+                if field in action_data and (
+                    not isinstance(action_data[field], str) or action_data[field] not in allowed
+                ):
+                    raise serializers.ValidationError(
+                        f"Action {i}: '{field}' must be one of {', '.join(sorted(allowed))}"
                     )
-                    created_actions.append(action)
 
-                    # Send assignment notification if user is assigned
-                    if action.assigned_to:
-                        RiskActionReminderService.send_assignment_notification(
-                            action, action.assigned_to, self.context["request"].user
+            # Resolve the assignee override, once per distinct value
+            if action_data.get("assigned_to") is not None:
+                key = str(action_data["assigned_to"])
+                if key not in assignees:
+                    try:
+                        assignees[key] = assignee_field.to_internal_value(
+                            action_data["assigned_to"]
+                        )
+                    except serializers.ValidationError as exc:
+                        raise serializers.ValidationError(
+                            f"Action {i}: 'assigned_to' {exc.detail[0]}"
                         )
+                action_data["assigned_to"] = assignees[key]
 
-                except Exception:
-                    logger.error(
-                        "Bulk risk action creation failed for one item",
-                        exc_info=settings.DEBUG,
-                    )
-                    errors.append(
-                        {
-                            "index": i,
-                            "title": action_data.get("title", ""),
-                            "error": "Unable to create risk action.",
-                        }
-                    )
+        return value
 
-        return created_actions, errors
+    def create_bulk_actions(self):
+        """
+        Create multiple risk actions in bulk, all or nothing.
+
+        Every row is validated up front, so a failure here is not caused by a
+        row's content: the batch is rolled back and every row reported.
+        """
+        rows = self.validated_data["actions"]
+        user = self.context["request"].user
+        actions = [
+            RiskAction(
+                risk=self.validated_data["risk"],
+                title=action_data["title"],
+                description=action_data["description"],
+                action_type=action_data.get(
+                    "action_type", self.validated_data["default_action_type"]
+                ),
+                assigned_to=action_data.get("assigned_to")
+                or self.validated_data.get("assigned_to"),
+                priority=action_data.get("priority", self.validated_data["default_priority"]),
+                start_date=action_data.get("start_date"),
+                due_date=action_data["due_date"],
+                success_criteria=action_data.get("success_criteria", ""),
+                dependencies=action_data.get("dependencies", ""),
+                created_by=user,
+            )
+            for action_data in rows
+        ]
+
+        try:
+            with transaction.atomic():
+                created_actions = RiskAction.create_many(actions)
+                # Assignment emails go out only once the actions are committed.
+                for action in created_actions:
+                    if action.assigned_to:
+                        transaction.on_commit(
+                            partial(
+                                RiskActionReminderService.send_assignment_notification,
+                                action,
+                                action.assigned_to,
+                                user,
+                            )
+                        )
+        except Exception:
+            logger.error("Bulk risk action creation failed", exc_info=settings.DEBUG)
+            return [], [
+                {
+                    "index": i,
+                    "title": action_data.get("title", ""),
+                    "error": "Unable to create risk action.",
+                }
+                for i, action_data in enumerate(rows)
+            ]
+
+        return created_actions, []
 
 
 class RiskActionSummarySerializer(serializers.Serializer):
@@ -0,0 +1,18 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Risk, RiskMatrix, invalidate_risk_level_pks
+
+
+@receiver(post_save, sender=Risk)
+@receiver(post_delete, sender=Risk)
+def clear_risk_level_pks(sender, **kwargs):
+    """Keep RiskActionFilter's cached risk PKs in step with risk levels."""
+    invalidate_risk_level_pks()
+
+
+@receiver(post_save, sender=RiskMatrix)
+@receiver(post_delete, sender=RiskMatrix)
+def clear_default_matrix(sender, **kwargs):
+    """Any matrix write may change which matrix is the default, or its config."""
+    RiskMatrix.invalidate_default()
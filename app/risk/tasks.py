@@ -1,8 +1,11 @@
-from celery import shared_task
+from celery import chord, shared_task
 from django.contrib.auth import get_user_model
+from django.core.mail import get_connection
+from django.db import connection
 from django.utils import timezone
-from django.db.models import Q
+from django.db.models import Exists, OuterRef, Q, Subquery
 import logging
+from collections import defaultdict
 from datetime import datetime, timedelta
 
 from .models import (
@@ -10,73 +13,217 @@ from .models import (
     RiskActionReminderConfiguration,
     RiskActionReminderLog,
 )
-from .notifications import RiskActionReminderService
+from .notifications import RiskActionReminderService, email_delivery_disabled, tenant_schema
 
 User = get_user_model()
 logger = logging.getLogger(__name__)
 
+# Action statuses that still generate reminders and digest entries
+OPEN_ACTION_STATUSES = ("pending", "in_progress", "deferred")
+
+# Users per subtask when the daily reminder run is sharded across workers
+REMINDER_CHUNK_SIZE = 100
+
+# Actions per subtask when a bulk reminder request is sharded across workers
+BULK_REMINDER_CHUNK_SIZE = 50
+
 
 @shared_task(bind=True, max_retries=3)
 def send_risk_action_due_reminders(self):
     """
     Daily task to send risk action reminders based on user configurations.
     Sends advance warnings, due today, and overdue notifications.
+
+    Runs with more candidate users than fit in one chunk are sharded across
+    workers, REMINDER_CHUNK_SIZE users per subtask, and totalled by a chord
+    callback; smaller runs are processed inline and return their totals.
     """
     logger.info("Starting daily risk action reminder processing")
 
+    if email_delivery_disabled():
+        logger.info("Email delivery is disabled; skipping daily risk action reminder processing")
+        return {"status": "skipped", "total_processed": 0, "total_sent": 0}
+
+    try:
+        user_ids = list(_reminder_candidate_users().values_list("pk", flat=True))
+        if len(user_ids) <= REMINDER_CHUNK_SIZE:
+            return _summarize_reminder_totals([_send_reminders_to_users(user_ids)])
+
+        chunks = [
+            user_ids[i : i + REMINDER_CHUNK_SIZE]
+            for i in range(0, len(user_ids), REMINDER_CHUNK_SIZE)
+        ]
+        chord(
+            process_risk_action_reminder_chunk.s(chunk, schema_name=connection.schema_name)
+            for chunk in chunks
+        )(summarize_risk_action_reminder_run.s())
+        logger.info(
+            "Dispatched risk action reminders for %s users in %s chunks", len(user_ids), len(chunks)
+        )
+        return {"status": "dispatched", "total_users": len(user_ids), "chunks": len(chunks)}
+
+    except Exception as exc:
+        logger.error("Error in send_risk_action_due_reminders: %s", exc)
+        raise self.retry(exc=exc, countdown=300)
+
+
+@shared_task(bind=True, max_retries=3)
+def process_risk_action_reminder_chunk(self, user_ids, schema_name=None):
+    """
+    Send due reminders for one chunk of a sharded daily reminder run, in the
+    tenant schema ``schema_name`` that dispatched it.
+    """
+    try:
+        with tenant_schema(schema_name):
+            return _send_reminders_to_users(user_ids)
+    except Exception as exc:
+        logger.error("Error in process_risk_action_reminder_chunk: %s", exc)
+        raise self.retry(exc=exc, countdown=300)
+
+
+@shared_task
+def summarize_risk_action_reminder_run(chunk_results):
+    """Chord callback totalling the chunks of a sharded daily reminder run."""
+    return _summarize_reminder_totals(chunk_results)
+
+
+def _summarize_reminder_totals(chunk_results):
+    total_processed = sum(result["total_processed"] for result in chunk_results)
+    total_sent = sum(result["total_sent"] for result in chunk_results)
+    logger.info(
+        "Risk action reminder processing complete: %s processed, %s sent",
+        total_processed,
+        total_sent,
+    )
+    return {"status": "success", "total_processed": total_processed, "total_sent": total_sent}
+
+
+def _reminder_candidate_users():
+    """
+    Users whose reminders are on and who have an open action their settings
+    could remind them about today; a user without a configuration gets the
+    defaults, which have reminders on.
+    """
+    return (
+        User.objects.filter(
+            Exists(
+                RiskAction.objects.filter(
+                    assigned_to=OuterRef("pk"), status__in=OPEN_ACTION_STATUSES
+                ).reminder_candidates_for_assignee()
+            )
+        )
+        .exclude(risk_action_reminder_config__enable_reminders=False)
+        .exclude(risk_action_reminder_config__email_notifications=False)
+    )
+
+
+def _send_reminders_to_users(user_ids):
+    """
+    Send due reminders to the given users and return the chunk's totals.
+
+    Reminder logs, sent or failed, are written in one batch even when the
+    caller is retried.
+    """
+    log_buffer = []
     try:
         total_processed = 0
         total_sent = 0
 
-        # Get all users with risk actions assigned
-        users_with_actions = User.objects.filter(assigned_risk_actions__isnull=False).distinct()
+        users = list(User.objects.filter(pk__in=user_ids))
+        configs_by_user_id = RiskActionReminderConfiguration.bulk_get_or_create(
+            user.pk for user in users
+        )
 
-        for user in users_with_actions:
-            try:
-                user_processed, user_sent = _process_user_reminders(user)
-                total_processed += user_processed
-                total_sent += user_sent
+        # Every candidate's open actions and reminder history, loaded up front
+        # in one query each rather than per user. Actions due further out than
+        # any user's reminder days are left in the database.
+        reminder_days = {
+            days for config in configs_by_user_id.values() for days in config.get_reminder_days()
+        }
+        actions_by_user_id = defaultdict(list)
+        for action in (
+            RiskAction.objects.for_notification()
+            .filter(assigned_to__in=users, status__in=OPEN_ACTION_STATUSES)
+            .reminder_candidates(reminder_days)
+        ):
+            actions_by_user_id[action.assigned_to_id].append(action)
+        sent_keys_by_user_id = RiskActionReminderService.prefetch_sent_keys_by_user(users)
+        last_overdue_sent_by_user_id = RiskActionReminderService.prefetch_last_overdue_sent_by_user(
+            users
+        )
 
-            except Exception as e:
-                logger.error(f"Error processing reminders for user {user.username}: {str(e)}")
-                continue
+        # One mail connection for the whole chunk rather than one per reminder
+        with get_connection() as mail_connection:
+            for user in users:
+                try:
+                    user_processed, user_sent = _process_user_reminders(
+                        user,
+                        mail_connection,
+                        configs_by_user_id[user.pk],
+                        log_buffer,
+                        actions=actions_by_user_id[user.pk],
+                        sent_keys=sent_keys_by_user_id[user.pk],
+                        last_overdue_sent=last_overdue_sent_by_user_id[user.pk],
+                    )
+                    total_processed += user_processed
+                    total_sent += user_sent
 
-        logger.info(
-            f"Risk action reminder processing complete: {total_processed} processed, {total_sent} sent"
-        )
-        return {"status": "success", "total_processed": total_processed, "total_sent": total_sent}
+                except Exception as e:
+                    logger.error("Error processing reminders for user %s: %s", user.username, e)
+                    continue
 
-    except Exception as exc:
-        logger.error(f"Error in send_risk_action_due_reminders: {str(exc)}")
-        raise self.retry(exc=exc, countdown=300)
+        return {"total_processed": total_processed, "total_sent": total_sent}
+    finally:
+        RiskActionReminderLog.log_many(log_buffer)
 
 
-def _process_user_reminders(user):
+def _process_user_reminders(
+    user,
+    mail_connection=None,
+    config=None,
+    log_buffer=None,
+    actions=None,
+    sent_keys=None,
+    last_overdue_sent=None,
+):
     """
-    Process reminders for a specific user.
+    Process reminders for a specific user, sending over ``mail_connection`` if given.
+
+    ``config`` is the user's preloaded reminder configuration; it is fetched
+    (or created) when omitted. Reminder logs are appended to ``log_buffer`` for
+    the caller to write; without one they are written before returning.
+    ``actions`` (the user's open actions), ``sent_keys`` and
+    ``last_overdue_sent`` may likewise be preloaded by a sweep over many users.
 
     Returns:
         tuple: (processed_count, sent_count)
     """
     try:
-        config = RiskActionReminderConfiguration.get_or_create_for_user(user)
+        if config is None:
+            config = RiskActionReminderConfiguration.get_or_create_for_user(user)
 
         if not config.enable_reminders or not config.email_notifications:
-            logger.debug(f"Reminders disabled for user {user.username}")
+            logger.debug("Reminders disabled for user %s", user.username)
             return 0, 0
 
-        # Get user's active risk actions
-        actions = RiskAction.objects.filter(
-            assigned_to=user, status__in=["pending", "in_progress", "deferred"]
-        )
-
-        if config.silence_completed:
-            actions = actions.exclude(status="completed")
-        if config.silence_cancelled:
-            actions = actions.exclude(status="cancelled")
+        # Get user's open risk actions; completed and cancelled actions are
+        # never open, so the silence settings need no extra filtering here
+        reminder_days = config.get_reminder_days()
+        if actions is None:
+            actions = (
+                RiskAction.objects.for_notification()
+                .filter(assigned_to=user, status__in=OPEN_ACTION_STATUSES)
+                .reminder_candidates(reminder_days)
+            )
 
         processed_count = 0
         sent_count = 0
+        now = timezone.now()
+        if sent_keys is None:
+            sent_keys = RiskActionReminderService.prefetch_sent_keys(user)
+        flush_logs = log_buffer is None
+        if flush_logs:
+            log_buffer = []
 
         for action in actions:
             try:
@@ -85,73 +232,100 @@ def _process_user_reminders(user):
 
                 # Send appropriate reminders
                 if days_until_due < 0 and config.overdue_reminders:
-                    # Overdue reminders
-                    if _should_send_overdue_reminder(action, user, config):
+                    # Overdue reminders; unless preloaded, the last-sent times are
+                    # read on the first overdue action, so users with none skip it
+                    if last_overdue_sent is None:
+                        last_overdue_sent = RiskActionReminderService.prefetch_last_overdue_sent(
+                            user
+                        )
+                    if _should_send_overdue_reminder(last_overdue_sent.get(action.pk), config, now):
                         if RiskActionReminderService.send_individual_reminder(
-                            action, user, "overdue", days_until_due
+                            action,
+                            user,
+                            "overdue",
+                            days_until_due,
+                            connection=mail_connection,
+                            config=config,
+                            sent_keys=sent_keys,
+                            log_buffer=log_buffer,
                         ):
                             sent_count += 1
 
                 elif days_until_due == 0:
                     # Due today
                     if RiskActionReminderService.send_individual_reminder(
-                        action, user, "due_today", days_until_due
+                        action,
+                        user,
+                        "due_today",
+                        days_until_due,
+                        connection=mail_connection,
+                        config=config,
+                        sent_keys=sent_keys,
+                        log_buffer=log_buffer,
                     ):
                         sent_count += 1
 
                 elif days_until_due > 0:
                     # Advance warnings based on user configuration
-                    reminder_days = config.get_reminder_days()
                     if days_until_due in reminder_days:
                         if RiskActionReminderService.send_individual_reminder(
-                            action, user, "advance_warning", days_until_due
+                            action,
+                            user,
+                            "advance_warning",
+                            days_until_due,
+                            connection=mail_connection,
+                            config=config,
+                            sent_keys=sent_keys,
+                            log_buffer=log_buffer,
                         ):
                             sent_count += 1
 
                 processed_count += 1
 
             except Exception as e:
-                logger.error(f"Error processing reminder for action {action.action_id}: {str(e)}")
+                logger.error("Error processing reminder for action %s: %s", action.action_id, e)
                 continue
 
-        logger.debug(f"User {user.username}: {processed_count} processed, {sent_count} sent")
+        if flush_logs:
+            # Write this user's reminder logs in one batched INSERT
+            RiskActionReminderLog.log_many(log_buffer)
+
+        logger.debug("User %s: %s processed, %s sent", user.username, processed_count, sent_count)
         return processed_count, sent_count
 
     except Exception as e:
-        logger.error(f"Error processing user reminders for {user.username}: {str(e)}")
+        logger.error("Error processing user reminders for %s: %s", user.username, e)
         return 0, 0
 
 
-def _should_send_overdue_reminder(action, user, config):
+def _should_send_overdue_reminder(last_sent_at, config, now=None):
     """
     Determine if an overdue reminder should be sent based on frequency settings.
+
+    ``last_sent_at`` is when the action's last overdue reminder was emailed, or
+    None if it never was. ``now`` lets a caller checking many actions compare
+    them all against the same moment.
     """
     try:
-        # Check when the last overdue reminder was sent
-        last_overdue = (
-            RiskActionReminderLog.objects.filter(
-                action=action, user=user, reminder_type="overdue", email_sent=True
-            )
-            .order_by("-sent_at")
-            .first()
-        )
-
-        if not last_overdue:
+        if not last_sent_at:
             return True  # Never sent overdue reminder
 
+        if now is None:
+            now = timezone.now()
+
         # Check frequency based on configuration
         if config.reminder_frequency == "daily":
             # Send daily overdue reminders
-            return last_overdue.sent_at.date() < timezone.now().date()
+            return last_sent_at.date() < now.date()
         elif config.reminder_frequency == "weekly":
             # Send weekly overdue reminders
-            return last_overdue.sent_at < timezone.now() - timedelta(days=7)
+            return last_sent_at < now - timedelta(days=7)
         else:  # custom
             # Use custom frequency for overdue (default to weekly if not specified)
-            return last_overdue.sent_at < timezone.now() - timedelta(days=7)
+            return last_sent_at < now - timedelta(days=7)
 
     except Exception as e:
-        logger.error(f"Error checking overdue reminder frequency: {str(e)}")
+        logger.error("Error checking overdue reminder frequency: %s", e)
         return False
 
 
@@ -162,46 +336,66 @@ def send_risk_action_weekly_digests(self):
     """
     logger.info("Starting weekly risk action digest processing")
 
+    if email_delivery_disabled():
+        logger.info("Email delivery is disabled; skipping weekly risk action digest processing")
+        return {"status": "skipped", "total_sent": 0}
+
     try:
         total_sent = 0
 
-        # Get all users with digest enabled
-        users_with_digest = User.objects.filter(
-            risk_action_reminder_config__weekly_digest_enabled=True,
-            risk_action_reminder_config__email_notifications=True,
-            assigned_risk_actions__isnull=False,
-        ).distinct()
+        # Users whose digest falls today, with their configuration
+        today_weekday = timezone.now().weekday()  # 0=Monday, 6=Sunday
+        users_with_digest = list(
+            User.objects.filter(
+                risk_action_reminder_config__weekly_digest_enabled=True,
+                risk_action_reminder_config__weekly_digest_day=today_weekday,
+                risk_action_reminder_config__email_notifications=True,
+                assigned_risk_actions__isnull=False,
+            )
+            .select_related("risk_action_reminder_config")
+            .distinct()
+        )
 
-        for user in users_with_digest:
-            try:
-                config = user.risk_action_reminder_config
+        # Every digest's actions in one query, bucketed by the users they are
+        # assigned to or whose risk they belong to
+        actions_by_user_id = defaultdict(list)
+        for action in (
+            RiskAction.objects.filter(
+                Q(assigned_to__in=users_with_digest) | Q(risk__risk_owner__in=users_with_digest)
+            )
+            .filter(status__in=OPEN_ACTION_STATUSES)
+            .for_notification()
+            .order_by("due_date", "-priority")
+        ):
+            for user_id in {action.assigned_to_id, action.risk.risk_owner_id}:
+                actions_by_user_id[user_id].append(action)
+
+        recent_digest_user_ids = RiskActionReminderService.prefetch_recent_digest_user_ids()
+
+        # One mail connection for every digest in this run
+        with get_connection() as mail_connection:
+            for user in users_with_digest:
+                try:
+                    actions = actions_by_user_id.get(user.pk)
+                    if actions:
+                        if RiskActionReminderService.send_weekly_digest(
+                            user,
+                            actions,
+                            connection=mail_connection,
+                            config=user.risk_action_reminder_config,
+                            recent_digest_user_ids=recent_digest_user_ids,
+                        ):
+                            total_sent += 1
 
-                # Check if today matches the user's preferred digest day
-                today_weekday = timezone.now().weekday()  # 0=Monday, 6=Sunday
-                if today_weekday != config.weekly_digest_day:
+                except Exception as e:
+                    logger.error("Error sending digest to user %s: %s", user.username, e)
                     continue
 
-                # Get user's risk actions for digest
-                actions = (
-                    RiskAction.objects.filter(Q(assigned_to=user) | Q(risk__risk_owner=user))
-                    .filter(status__in=["pending", "in_progress", "deferred"])
-                    .select_related("risk", "assigned_to")
-                    .order_by("due_date", "-priority")
-                )
-
-                if actions.exists():
-                    if RiskActionReminderService.send_weekly_digest(user, actions):
-                        total_sent += 1
-
-            except Exception as e:
-                logger.error(f"Error sending digest to user {user.username}: {str(e)}")
-                continue
-
-        logger.info(f"Weekly digest processing complete: {total_sent} digests sent")
+        logger.info("Weekly digest processing complete: %s digests sent", total_sent)
         return {"status": "success", "total_sent": total_sent}
 
     except Exception as exc:
-        logger.error(f"Error in send_risk_action_weekly_digests: {str(exc)}")
+        logger.error("Error in send_risk_action_weekly_digests: %s", exc)
         raise self.retry(exc=exc, countdown=300)
 
 
@@ -217,7 +411,7 @@ def send_immediate_risk_action_reminder(action_id, user_id, reminder_type="advan
         reminder_type: Type of reminder to send
     """
     try:
-        action = RiskAction.objects.get(id=action_id)
+        action = RiskAction.objects.for_notification().get(id=action_id)
         user = User.objects.get(id=user_id)
 
         days_until_due = action.days_until_due if hasattr(action, "days_until_due") else None
@@ -227,18 +421,21 @@ def send_immediate_risk_action_reminder(action_id, user_id, reminder_type="advan
         )
 
         logger.info(
-            f"Immediate reminder sent for action {action.action_id} to {user.username}: {success}"
+            "Immediate reminder sent for action %s to %s: %s",
+            action.action_id,
+            user.username,
+            success,
         )
         return {"status": "success", "sent": success}
 
     except RiskAction.DoesNotExist:
-        logger.error(f"RiskAction with id {action_id} does not exist")
+        logger.error("RiskAction with id %s does not exist", action_id)
         return {"status": "error", "message": "Action not found"}
     except User.DoesNotExist:
-        logger.error(f"User with id {user_id} does not exist")
+        logger.error("User with id %s does not exist", user_id)
         return {"status": "error", "message": "User not found"}
     except Exception as e:
-        logger.error(f"Error sending immediate reminder: {str(e)}")
+        logger.error("Error sending immediate reminder: %s", e)
         return {"status": "error", "message": str(e)}
 
 
@@ -247,23 +444,83 @@ def send_bulk_risk_action_reminders(action_ids, reminder_type="advance_warning")
     """
     Send reminders for multiple risk actions in bulk.
 
+    More actions than fit in one chunk are sharded across workers,
+    BULK_REMINDER_CHUNK_SIZE actions per subtask, and totalled by a chord
+    callback; smaller batches are sent inline and return their counts.
+
     Args:
         action_ids: List of RiskAction IDs
         reminder_type: Type of reminder to send
     """
     try:
-        sent_count = 0
-        error_count = 0
+        action_ids = list(action_ids)
+        if len(action_ids) <= BULK_REMINDER_CHUNK_SIZE:
+            return _summarize_bulk_reminder_counts(
+                [_send_action_reminders(action_ids, reminder_type)]
+            )
+
+        chunks = [
+            action_ids[i : i + BULK_REMINDER_CHUNK_SIZE]
+            for i in range(0, len(action_ids), BULK_REMINDER_CHUNK_SIZE)
+        ]
+        chord(
+            send_risk_action_reminder_chunk.s(
+                chunk, reminder_type, schema_name=connection.schema_name
+            )
+            for chunk in chunks
+        )(summarize_bulk_risk_action_reminders.s())
+        logger.info(
+            "Dispatched bulk reminders for %s actions in %s chunks", len(action_ids), len(chunks)
+        )
+        return {"status": "dispatched", "total_actions": len(action_ids), "chunks": len(chunks)}
+
+    except Exception as e:
+        logger.error("Error in bulk reminder processing: %s", e)
+        return {"status": "error", "message": str(e)}
+
+
+@shared_task
+def send_risk_action_reminder_chunk(action_ids, reminder_type="advance_warning", schema_name=None):
+    """
+    Send reminders for one chunk of a sharded bulk reminder request, in the
+    tenant schema ``schema_name`` that dispatched it.
+    """
+    with tenant_schema(schema_name):
+        return _send_action_reminders(action_ids, reminder_type)
+
 
-        actions = RiskAction.objects.filter(id__in=action_ids).select_related("assigned_to", "risk")
+@shared_task
+def summarize_bulk_risk_action_reminders(chunk_results):
+    """Chord callback totalling the chunks of a sharded bulk reminder request."""
+    return _summarize_bulk_reminder_counts(chunk_results)
+
+
+def _summarize_bulk_reminder_counts(chunk_results):
+    sent_count = sum(result["sent_count"] for result in chunk_results)
+    error_count = sum(result["error_count"] for result in chunk_results)
+    logger.info("Bulk reminder processing complete: %s sent, %s errors", sent_count, error_count)
+    return {"status": "success", "sent_count": sent_count, "error_count": error_count}
+
+
+def _send_action_reminders(action_ids, reminder_type):
+    """Send ``reminder_type`` reminders for the given actions over one mail connection."""
+    sent_count = 0
+    error_count = 0
+
+    actions = RiskAction.objects.for_notification().with_days_until_due().filter(id__in=action_ids)
 
+    with get_connection() as mail_connection:
         for action in actions:
             try:
                 if action.assigned_to:
                     days_until_due = action.days_until_due
 
                     success = RiskActionReminderService.send_individual_reminder(
-                        action, action.assigned_to, reminder_type, days_until_due
+                        action,
+                        action.assigned_to,
+                        reminder_type,
+                        days_until_due,
+                        connection=mail_connection,
                     )
 
                     if success:
@@ -272,36 +529,46 @@ def send_bulk_risk_action_reminders(action_ids, reminder_type="advance_warning")
                         error_count += 1
 
             except Exception as e:
-                logger.error(f"Error sending bulk reminder for action {action.action_id}: {str(e)}")
+                logger.error("Error sending bulk reminder for action %s: %s", action.action_id, e)
                 error_count += 1
                 continue
 
-        logger.info(f"Bulk reminder processing complete: {sent_count} sent, {error_count} errors")
-        return {"status": "success", "sent_count": sent_count, "error_count": error_count}
-
-    except Exception as e:
-        logger.error(f"Error in bulk reminder processing: {str(e)}")
-        return {"status": "error", "message": str(e)}
+    return {"sent_count": sent_count, "error_count": error_count}
 
 
 @shared_task
-def cleanup_old_risk_action_reminder_logs(days_to_keep=90):
+def cleanup_old_risk_action_reminder_logs(days_to_keep=90, batch_size=10000):
     """
     Clean up old reminder logs to prevent database bloat.
 
+    Logs are deleted in batches so each DELETE, and the locks it holds, stays
+    bounded however large the backlog. Nothing cascades from a log and the only
+    delete listener is django-tenants' catch-all for tenant models, so each
+    batch is a raw DELETE rather than loading the rows to send signals.
+
     Args:
         days_to_keep: Number of days of logs to keep (default 90)
+        batch_size: Maximum number of logs removed per DELETE (default 10000)
     """
     try:
         cutoff_date = timezone.now() - timedelta(days=days_to_keep)
+        old_logs = RiskActionReminderLog.objects.filter(sent_at__lt=cutoff_date)
 
-        deleted_count = RiskActionReminderLog.objects.filter(sent_at__lt=cutoff_date).delete()[0]
+        deleted_count = 0
+        while True:
+            batch = RiskActionReminderLog.objects.filter(
+                pk__in=Subquery(old_logs.values("pk")[:batch_size])
+            )
+            deleted = batch._raw_delete(batch.db)
+            deleted_count += deleted
+            if deleted < batch_size:
+                break
 
-        logger.info(f"Cleaned up {deleted_count} old risk action reminder logs")
+        logger.info("Cleaned up %s old risk action reminder logs", deleted_count)
         return {"status": "success", "deleted_count": deleted_count}
 
     except Exception as e:
-        logger.error(f"Error cleaning up reminder logs: {str(e)}")
+        logger.error("Error cleaning up reminder logs: %s", e)
         return {"status": "error", "message": str(e)}
 
 
@@ -314,11 +581,14 @@ def test_risk_action_reminder_configuration(user_id):
         user_id: ID of the User to test
     """
     try:
-        user = User.objects.get(id=user_id)
-        config = RiskActionReminderConfiguration.get_or_create_for_user(user)
+        user = User.objects.select_related("risk_action_reminder_config").get(id=user_id)
+        try:
+            config = user.risk_action_reminder_config
+        except RiskActionReminderConfiguration.DoesNotExist:
+            config = RiskActionReminderConfiguration.get_or_create_for_user(user)
 
         # Find a test action or create a mock one for testing
-        test_action = RiskAction.objects.filter(assigned_to=user).first()
+        test_action = RiskAction.objects.for_notification().filter(assigned_to=user).first()
 
         if not test_action:
             # No actions found, just return config status
@@ -340,6 +610,7 @@ def test_risk_action_reminder_configuration(user_id):
             user,
             "advance_warning",
             3,  # 3 days before due
+            config=config,
         )
 
         return {
@@ -358,5 +629,5 @@ def test_risk_action_reminder_configuration(user_id):
     except User.DoesNotExist:
         return {"status": "error", "message": "User not found"}
     except Exception as e:
-        logger.error(f"Error testing reminder configuration: {str(e)}")
+        logger.error("Error testing reminder configuration: %s", e)
         return {"status": "error", "message": str(e)}
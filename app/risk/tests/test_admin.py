@@ -1,6 +1,8 @@
 from datetime import date, timedelta
 from decimal import Decimal
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.contrib.admin.sites import AdminSite
 from django.contrib.auth import get_user_model
 from django.urls import reverse
@@ -42,39 +44,41 @@ class MockRequest:
 class RiskActionAdminTest(TestCase):
     """Test cases for RiskActionAdmin."""
 
-    def setUp(self):
-        self.site = AdminSite()
-        self.admin = RiskActionAdmin(RiskAction, self.site)
-
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             username="admin_user", email="admin@example.com", password="adminpass123", is_staff=True
         )
-        self.assignee = User.objects.create_user(
+        cls.assignee = User.objects.create_user(
             username="assignee", email="assignee@example.com", password="testpass123"
         )
 
-        self.category = RiskCategory.objects.create(name="Test Category")
-        self.risk = Risk.objects.create(
+        cls.category = RiskCategory.objects.create(name="Test Category")
+        cls.risk = Risk.objects.create(
             title="Test Risk",
-            category=self.category,
-            risk_owner=self.user,
+            category=cls.category,
+            risk_owner=cls.user,
             impact=4,
             likelihood=3,
             risk_level="high",
         )
 
-        self.action = RiskAction.objects.create(
-            risk=self.risk,
+        cls.action = RiskAction.objects.create(
+            risk=cls.risk,
             title="Test Action",
             description="Test action for admin testing",
             action_type="mitigation",
             priority="high",
-            assigned_to=self.assignee,
+            assigned_to=cls.assignee,
             due_date=date.today() + timedelta(days=14),
             status="in_progress",
             progress_percentage=35,
         )
 
+    def setUp(self):
+        self.site = AdminSite()
+        self.admin = RiskActionAdmin(RiskAction, self.site)
+
     def test_list_display_fields(self):
         """Test that list display includes all expected fields."""
         expected_fields = [
@@ -148,44 +152,44 @@ class RiskActionAdminTest(TestCase):
 
     def test_days_until_due_display_method(self):
         """Test the days_until_due_display method with different scenarios."""
-        # Future due date
-        future_action = RiskAction.objects.create(
-            risk=self.risk,
-            title="Future Action",
-            action_type="mitigation",
-            assigned_to=self.assignee,
-            due_date=date.today() + timedelta(days=7),
+        future_action, overdue_action, today_action = RiskAction.create_many(
+            [
+                RiskAction(
+                    risk=self.risk,
+                    title=title,
+                    action_type="mitigation",
+                    assigned_to=self.assignee,
+                    due_date=date.today() + timedelta(days=due_in),
+                )
+                for title, due_in in (
+                    ("Future Action", 7),
+                    ("Overdue Action", -3),
+                    ("Today Action", 0),
+                )
+            ]
         )
 
+        # Future due date
         display = self.admin.days_until_due_display(future_action)
         self.assertEqual(display, "7 days remaining")
 
         # Overdue action
-        overdue_action = RiskAction.objects.create(
-            risk=self.risk,
-            title="Overdue Action",
-            action_type="mitigation",
-            assigned_to=self.assignee,
-            due_date=date.today() - timedelta(days=3),
-        )
-
         display = self.admin.days_until_due_display(overdue_action)
         self.assertIn("3 days overdue", display)
         self.assertIn("color: #DC2626", display)  # Red for overdue
 
         # Due today
-        today_action = RiskAction.objects.create(
-            risk=self.risk,
-            title="Today Action",
-            action_type="mitigation",
-            assigned_to=self.assignee,
-            due_date=date.today(),
-        )
-
         display = self.admin.days_until_due_display(today_action)
         self.assertIn("Due today", display)
         self.assertIn("color: #F59E0B", display)  # Orange for due today
 
+    def test_queryset_annotates_days_until_due(self):
+        """Changelist rows carry days_until_due from SQL for the due-date columns."""
+        action = self.admin.get_queryset(MockRequest(self.user)).get(pk=self.action.pk)
+
+        self.assertEqual(action._annotated_days_until_due, 14)
+        self.assertEqual(self.admin.days_until_due_display(action), "14 days remaining")
+
     def test_get_status_display_method(self):
         """Test the get_status_display method returns colored status."""
         # Test different statuses
@@ -197,11 +201,12 @@ class RiskActionAdminTest(TestCase):
         ]
 
         for status, expected_color in test_cases:
-            self.action.status = status
-            status_html = self.admin.status_colored(self.action)
+            with self.subTest(status=status):
+                self.action.status = status
+                status_html = self.admin.status_colored(self.action)
 
-            self.assertIn(expected_color, status_html)
-            self.assertIn(status.replace("_", " ").title(), status_html)
+                self.assertIn(expected_color, status_html)
+                self.assertIn(status.replace("_", " ").title(), status_html)
 
     def test_get_priority_display_method(self):
         """Test the get_priority_display method returns colored priority."""
@@ -213,11 +218,12 @@ class RiskActionAdminTest(TestCase):
         ]
 
         for priority, expected_color in test_cases:
-            self.action.priority = priority
-            priority_html = self.admin.priority_colored(self.action)
+            with self.subTest(priority=priority):
+                self.action.priority = priority
+                priority_html = self.admin.priority_colored(self.action)
 
-            self.assertIn(expected_color, priority_html)
-            self.assertIn(priority.title(), priority_html)
+                self.assertIn(expected_color, priority_html)
+                self.assertIn(priority.title(), priority_html)
 
     def test_fieldsets_configuration(self):
         """Test that fieldsets are properly configured."""
@@ -308,30 +314,32 @@ class RiskActionAdminTest(TestCase):
 class RiskActionNoteAdminTest(TestCase):
     """Test cases for RiskActionNoteAdmin."""
 
-    def setUp(self):
-        self.site = AdminSite()
-        self.admin = RiskActionNoteAdmin(RiskActionNote, self.site)
-
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             username="test_user", email="test@example.com", password="testpass123"
         )
 
-        self.category = RiskCategory.objects.create(name="Test")
-        self.risk = Risk.objects.create(
-            title="Test Risk", category=self.category, risk_owner=self.user, impact=3, likelihood=3
+        cls.category = RiskCategory.objects.create(name="Test")
+        cls.risk = Risk.objects.create(
+            title="Test Risk", category=cls.category, risk_owner=cls.user, impact=3, likelihood=3
         )
-        self.action = RiskAction.objects.create(
-            risk=self.risk,
+        cls.action = RiskAction.objects.create(
+            risk=cls.risk,
             title="Test Action",
             action_type="mitigation",
-            assigned_to=self.user,
+            assigned_to=cls.user,
             due_date=date.today() + timedelta(days=30),
         )
 
-        self.note = RiskActionNote.objects.create(
-            action=self.action, note="Test note content", created_by=self.user
+        cls.note = RiskActionNote.objects.create(
+            action=cls.action, note="Test note content", created_by=cls.user
         )
 
+    def setUp(self):
+        self.site = AdminSite()
+        self.admin = RiskActionNoteAdmin(RiskActionNote, self.site)
+
     def test_list_display_fields(self):
         """Test list display configuration."""
         expected_fields = [
@@ -369,34 +377,36 @@ class RiskActionNoteAdminTest(TestCase):
 class RiskActionEvidenceAdminTest(TestCase):
     """Test cases for RiskActionEvidenceAdmin."""
 
-    def setUp(self):
-        self.site = AdminSite()
-        self.admin = RiskActionEvidenceAdmin(RiskActionEvidence, self.site)
-
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             username="test_user", email="test@example.com", password="testpass123"
         )
 
-        self.category = RiskCategory.objects.create(name="Test")
-        self.risk = Risk.objects.create(
-            title="Test Risk", category=self.category, risk_owner=self.user, impact=3, likelihood=3
+        cls.category = RiskCategory.objects.create(name="Test")
+        cls.risk = Risk.objects.create(
+            title="Test Risk", category=cls.category, risk_owner=cls.user, impact=3, likelihood=3
         )
-        self.action = RiskAction.objects.create(
-            risk=self.risk,
+        cls.action = RiskAction.objects.create(
+            risk=cls.risk,
             title="Test Action",
             action_type="mitigation",
-            assigned_to=self.user,
+            assigned_to=cls.user,
             due_date=date.today() + timedelta(days=30),
         )
 
-        self.evidence = RiskActionEvidence.objects.create(
-            action=self.action,
+        cls.evidence = RiskActionEvidence.objects.create(
+            action=cls.action,
             title="Test Evidence",
             evidence_type="document",
             description="Evidence description",
-            uploaded_by=self.user,
+            uploaded_by=cls.user,
         )
 
+    def setUp(self):
+        self.site = AdminSite()
+        self.admin = RiskActionEvidenceAdmin(RiskActionEvidence, self.site)
+
     def test_list_display_fields(self):
         """Test list display configuration."""
         expected_fields = [
@@ -428,18 +438,20 @@ class RiskActionEvidenceAdminTest(TestCase):
 class RiskActionReminderConfigurationAdminTest(TestCase):
     """Test cases for RiskActionReminderConfigurationAdmin."""
 
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username="test_user", email="test@example.com", password="testpass123"
+        )
+
+        cls.config = RiskActionReminderConfiguration.objects.create(user=cls.user)
+
     def setUp(self):
         self.site = AdminSite()
         self.admin = RiskActionReminderConfigurationAdmin(
             RiskActionReminderConfiguration, self.site
         )
 
-        self.user = User.objects.create_user(
-            username="test_user", email="test@example.com", password="testpass123"
-        )
-
-        self.config = RiskActionReminderConfiguration.objects.create(user=self.user)
-
     def test_list_display_fields(self):
         """Test list display configuration."""
         expected_fields = [
@@ -498,10 +510,29 @@ class AdminIntegrationTest(TenantTestCase):
             due_date=date.today() + timedelta(days=30),
         )
 
-        response = self.client.get(reverse("admin:risk_riskaction_changelist"))
+        with CaptureQueriesContext(connection) as single_row:
+            response = self.client.get(reverse("admin:risk_riskaction_changelist"))
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, "Test Action")
 
+        # Each row's risk and assignee come from the changelist query, not one
+        # query per row
+        RiskAction.create_many(
+            [
+                RiskAction(
+                    risk=self.risk,
+                    title=f"Bulk Action {i}",
+                    action_type="mitigation",
+                    assigned_to=self.user,
+                    due_date=date.today() + timedelta(days=30),
+                )
+                for i in range(25)
+            ]
+        )
+        with CaptureQueriesContext(connection) as many_rows:
+            self.client.get(reverse("admin:risk_riskaction_changelist"))
+        self.assertEqual(len(many_rows), len(single_row))
+
     def test_risk_action_admin_add_view(self):
         """Test that risk action add form loads successfully."""
         response = self.client.get(reverse("admin:risk_riskaction_add"))
@@ -520,7 +551,17 @@ class AdminIntegrationTest(TenantTestCase):
             due_date=date.today() + timedelta(days=30),
         )
 
-        response = self.client.get(reverse("admin:risk_riskaction_change", args=[action.id]))
+        url = reverse("admin:risk_riskaction_change", args=[action.id])
+        RiskActionNote.objects.create(action=action, note="First note", created_by=self.user)
+        with CaptureQueriesContext(connection) as one_note:
+            response = self.client.get(url)
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, "Test Action")
         self.assertContains(response, action.action_id)
+
+        # Inline rows do not add queries of their own
+        for i in range(5):
+            RiskActionNote.objects.create(action=action, note=f"Note {i}", created_by=self.user)
+        with CaptureQueriesContext(connection) as many_notes:
+            self.client.get(url)
+        self.assertEqual(len(many_notes), len(one_note))
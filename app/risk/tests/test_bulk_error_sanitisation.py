@@ -45,7 +45,7 @@ class BulkErrorSanitisationTests(TestCase):
         )
         self.assertTrue(serializer.is_valid(), serializer.errors)
 
-        with patch.object(Risk.objects, "create", side_effect=RuntimeError("password=secret")):
+        with patch.object(Risk.objects, "bulk_create", side_effect=RuntimeError("password=secret")):
             created_risks, errors = serializer.create_bulk_risks()
 
         self.assertEqual(created_risks, [])
@@ -78,7 +78,7 @@ class BulkErrorSanitisationTests(TestCase):
 
         with patch.object(
             RiskAction.objects,
-            "create",
+            "bulk_create",
             side_effect=RuntimeError("api_key=secret"),
         ):
             created_actions, errors = serializer.create_bulk_actions()
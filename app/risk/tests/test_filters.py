@@ -0,0 +1,214 @@
+from datetime import date, timedelta
+from unittest.mock import MagicMock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+
+from ..filters import RiskActionFilter, RiskFilter
+from ..models import Risk, RiskAction, RiskCategory, RiskMatrix
+
+User = get_user_model()
+
+
+class RiskFilterTest(TestCase):
+    """Test cases for risk filtering."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username="filteruser", email="filter@example.com", password="testpass123"
+        )
+        cls.category = RiskCategory.objects.create(name="Filter Category")
+        cls.risk = Risk.objects.create(
+            title="Filtered Risk",
+            description="Risk used by filter tests",
+            category=cls.category,
+            risk_owner=cls.user,
+            impact=4,
+            likelihood=3,
+            treatment_strategy="mitigate",
+            current_controls="Firewall rules",
+        )
+
+    def setUp(self):
+        self.request = MagicMock()
+        self.request.user = self.user
+
+    def test_risk_score_range_filters(self):
+        """Score bounds compare against impact * likelihood."""
+        low_risk = Risk.objects.create(title="Low Score", description="", impact=1, likelihood=2)
+
+        at_least_ten = RiskFilter(
+            data={"risk_score_min": 10}, queryset=Risk.objects.all(), request=self.request
+        ).qs
+        at_most_five = RiskFilter(
+            data={"risk_score_max": 5}, queryset=Risk.objects.all(), request=self.request
+        ).qs
+
+        self.assertEqual(list(at_least_ten), [self.risk])
+        self.assertEqual(list(at_most_five), [low_risk])
+
+    def test_choice_filters_accept_comma_separated_values(self):
+        """Multi-valued choice filters take a comma-separated list."""
+        Risk.objects.create(
+            title="Closed Risk", description="", impact=1, likelihood=1, status="closed"
+        )
+
+        filterset = RiskFilter(
+            data={"status": "identified,assessed"},
+            queryset=Risk.objects.all(),
+            request=self.request,
+        )
+
+        self.assertTrue(filterset.is_valid())
+        self.assertEqual(list(filterset.qs), [self.risk])
+
+    def test_choice_filters_reject_unknown_values(self):
+        """Unknown choice values fail form validation instead of matching nothing."""
+        filterset = RiskFilter(
+            data={"risk_level": "high,severe"}, queryset=Risk.objects.all(), request=self.request
+        )
+
+        self.assertFalse(filterset.is_valid())
+        self.assertIn("risk_level", filterset.errors)
+
+    def test_cursor_walks_keyset_ordering(self):
+        """Each cursor resumes strictly after the row it was encoded from."""
+        Risk.objects.create(title="Same Level A", description="", impact=4, likelihood=3)
+        Risk.objects.create(title="Lower Score", description="", impact=1, likelihood=1)
+        expected = list(Risk.objects.order_by(*RiskFilter.KEYSET_ORDERING))
+
+        seen = []
+        cursor = ""
+        for _ in expected:
+            page = RiskFilter(
+                data={"cursor": cursor}, queryset=Risk.objects.all(), request=self.request
+            ).qs[:1]
+            seen.extend(page)
+            cursor = RiskFilter.encode_cursor(page[0])
+
+        self.assertEqual(seen, expected)
+        self.assertFalse(
+            RiskFilter(
+                data={"cursor": cursor}, queryset=Risk.objects.all(), request=self.request
+            ).qs.exists()
+        )
+
+    def test_cursor_rejects_malformed_values(self):
+        """Cursors that do not decode to a keyset position fail validation."""
+        filterset = RiskFilter(
+            data={"cursor": "not-a-cursor"}, queryset=Risk.objects.all(), request=self.request
+        )
+
+        self.assertFalse(filterset.is_valid())
+        self.assertIn("cursor", filterset.errors)
+
+    def test_search_short_circuits_exact_risk_id(self):
+        """A full risk ID returns just that risk, even when others mention it."""
+        Risk.objects.create(
+            title="Related Risk",
+            description=f"Follow-up to {self.risk.risk_id}",
+            impact=2,
+            likelihood=2,
+        )
+
+        filterset = RiskFilter(
+            data={"search": self.risk.risk_id.lower()},
+            queryset=Risk.objects.all(),
+            request=self.request,
+        )
+
+        self.assertEqual(list(filterset.qs), [self.risk])
+
+    def test_search_falls_back_when_risk_id_unknown(self):
+        """An ID-shaped term with no exact match still searches the text columns."""
+        mention = Risk.objects.create(
+            title="Mentions Missing", description="See RISK-1999-0001", impact=2, likelihood=2
+        )
+
+        filterset = RiskFilter(
+            data={"search": "RISK-1999-0001"}, queryset=Risk.objects.all(), request=self.request
+        )
+
+        self.assertEqual(list(filterset.qs), [mention])
+
+    def test_has_treatment_filter(self):
+        """has_treatment splits risks on whether a strategy has been chosen."""
+        untreated = Risk.objects.create(title="Untreated", description="", impact=1, likelihood=1)
+
+        treated = RiskFilter(
+            data={"has_treatment": True}, queryset=Risk.objects.all(), request=self.request
+        ).qs
+        not_treated = RiskFilter(
+            data={"has_treatment": False}, queryset=Risk.objects.all(), request=self.request
+        ).qs
+
+        self.assertEqual(list(treated), [self.risk])
+        self.assertEqual(list(not_treated), [untreated])
+
+
+class RiskActionFilterTest(TestCase):
+    """Test cases for risk action filtering."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username="actionfilteruser", email="actionfilter@example.com", password="testpass123"
+        )
+        cls.risk = Risk.objects.create(
+            title="Critical Risk", description="", impact=5, likelihood=5
+        )
+        cls.action = RiskAction.objects.create(
+            risk=cls.risk,
+            title="Contain",
+            description="",
+            action_type="mitigation",
+            assigned_to=cls.user,
+            due_date=date.today() + timedelta(days=30),
+        )
+
+    def setUp(self):
+        # Test rollbacks bypass the invalidation signals.
+        cache.clear()
+        self.request = MagicMock()
+        self.request.user = self.user
+
+    def filter_by_level(self, levels):
+        return RiskActionFilter(
+            data={"risk_level": levels}, queryset=RiskAction.objects.all(), request=self.request
+        ).qs
+
+    def test_risk_level_filter_avoids_join(self):
+        """Risk level is resolved to risk PKs, not a join against risk_risk."""
+        queryset = self.filter_by_level(self.risk.risk_level)
+
+        self.assertNotIn("JOIN", str(queryset.query))
+        self.assertEqual(list(queryset), [self.action])
+
+    def test_risk_level_cache_follows_risk_changes(self):
+        """Changing a risk's level invalidates the cached PKs."""
+        level = self.risk.risk_level
+        self.assertEqual(list(self.filter_by_level(level)), [self.action])
+
+        self.risk.impact = 1
+        self.risk.likelihood = 1
+        self.risk.save()
+
+        self.assertNotEqual(self.risk.risk_level, level)
+        self.assertEqual(list(self.filter_by_level(level)), [])
+        self.assertEqual(list(self.filter_by_level(self.risk.risk_level)), [self.action])
+
+    def test_risk_level_cache_follows_matrix_recalculation(self):
+        """Recalculating a matrix's risks with a bulk UPDATE invalidates the cached PKs."""
+        matrix = RiskMatrix.objects.create(name="Regraded", is_default=True)
+        self.risk.refresh_from_db()
+        level = self.risk.risk_level
+        self.assertEqual(list(self.filter_by_level(level)), [self.action])
+
+        matrix.matrix_config["5"]["5"] = "low"
+        RiskMatrix.objects.filter(pk=matrix.pk).update(matrix_config=matrix.matrix_config)
+        RiskMatrix.objects.get(pk=matrix.pk).recalculate_risks()
+
+        self.assertEqual(list(self.filter_by_level(level)), [])
+        self.assertEqual(list(self.filter_by_level("low")), [self.action])
@@ -0,0 +1,544 @@
+from datetime import date, timedelta
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.db import IntegrityError, connection, transaction
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from ..models import (
+    Risk,
+    RiskAction,
+    RiskActionReminderConfiguration,
+    RiskActionReminderLog,
+    RiskIdSequence,
+    RiskMatrix,
+    RiskNote,
+)
+
+User = get_user_model()
+
+
+class RiskModelTest(TestCase):
+    """Test cases for Risk model behaviour."""
+
+    def setUp(self):
+        self.risk = Risk.objects.create(
+            title="Model Risk", description="Risk used by model tests", impact=2, likelihood=2
+        )
+        self.stale_date = date.today() - timedelta(days=30)
+        Risk.objects.filter(pk=self.risk.pk).update(last_assessed_date=self.stale_date)
+
+    def test_save_without_assessment_change_skips_lookup(self):
+        """Saving a loaded risk compares against the values it was loaded with."""
+        risk = Risk.objects.get(pk=self.risk.pk)
+        risk.title = "Renamed"
+
+        with CaptureQueriesContext(connection) as ctx:
+            risk.save()
+
+        self.assertFalse(
+            [query for query in ctx.captured_queries if 'FROM "risk_risk"' in query["sql"]]
+        )
+
+        risk.refresh_from_db()
+        self.assertEqual(risk.last_assessed_date, self.stale_date)
+
+    def test_save_with_assessment_change_updates_assessed_date(self):
+        """Changing impact or likelihood stamps a new assessment date."""
+        risk = Risk.objects.get(pk=self.risk.pk)
+        risk.impact = 5
+        risk.save()
+
+        risk.refresh_from_db()
+        self.assertEqual(risk.last_assessed_date, date.today())
+
+    def test_partial_save_writes_derived_fields(self):
+        """update_fields saves also persist the risk level and assessment date."""
+        risk = Risk.objects.get(pk=self.risk.pk)
+        risk.impact = 5
+        risk.likelihood = 5
+        risk.save(update_fields=["impact", "likelihood"])
+
+        risk.refresh_from_db()
+        self.assertEqual(risk.risk_level, "critical")
+        self.assertEqual(risk.last_assessed_date, date.today())
+
+    def test_save_with_default_matrix_skips_matrix_lookup(self):
+        """A risk graded by the default matrix reuses the cached copy."""
+        self.addCleanup(RiskMatrix.invalidate_default)
+        matrix = RiskMatrix.objects.create(name="Default", is_default=True)
+        Risk.objects.filter(pk=self.risk.pk).update(risk_matrix=matrix)
+        RiskMatrix.get_default()
+        risk = Risk.objects.get(pk=self.risk.pk)
+        risk.impact = 4
+
+        with CaptureQueriesContext(connection) as ctx:
+            risk.save()
+
+        self.assertFalse(
+            [query for query in ctx.captured_queries if '"risk_riskmatrix"' in query["sql"]]
+        )
+
+    def test_save_of_unloaded_instance_checks_database(self):
+        """Instances built by hand still detect assessment changes."""
+        risk = Risk.objects.get(pk=self.risk.pk)
+        risk._loaded_assessment = (None, None)
+        risk.likelihood = 4
+        risk.save()
+
+        risk.refresh_from_db()
+        self.assertEqual(risk.last_assessed_date, date.today())
+
+    def test_overdue_for_review_queryset(self):
+        """overdue_for_review matches the is_overdue_for_review property in SQL."""
+        Risk.objects.filter(pk=self.risk.pk).update(next_review_date=date.today() - timedelta(1))
+        Risk.objects.create(
+            title="Upcoming",
+            description="",
+            impact=1,
+            likelihood=1,
+            next_review_date=date.today() + timedelta(days=3),
+        )
+
+        self.assertEqual(list(Risk.objects.overdue_for_review()), [self.risk])
+
+    def test_for_dashboard_loads_relations_in_one_query(self):
+        """Dashboard rows carry category and owner names without extra queries."""
+        owner = User.objects.create_user(
+            username="dashowner", email="dash@example.com", password="testpass123"
+        )
+        Risk.objects.filter(pk=self.risk.pk).update(risk_owner=owner)
+
+        with self.assertNumQueries(1):
+            rows = [
+                (risk.risk_id, risk.risk_level, risk.category, risk.risk_owner.username)
+                for risk in Risk.objects.for_dashboard()
+            ]
+
+        self.assertEqual(rows, [(self.risk.risk_id, self.risk.risk_level, None, "dashowner")])
+        self.assertIn("description", Risk.objects.for_dashboard().get().get_deferred_fields())
+
+    def test_days_until_review_annotation(self):
+        """The annotated day count is used in place of Python date math."""
+        Risk.objects.filter(pk=self.risk.pk).update(
+            next_review_date=date.today() + timedelta(days=5)
+        )
+
+        risk = Risk.objects.with_days_until_review().get(pk=self.risk.pk)
+
+        self.assertEqual(risk._annotated_days_until_review, 5)
+        self.assertEqual(risk.days_until_review, 5)
+
+
+class RiskNoteStrTest(TestCase):
+    """Test cases for __str__ on related-object rows."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username="noteuser", email="note@example.com", password="testpass123"
+        )
+        cls.risk = Risk.objects.create(title="Noted", description="", impact=1, likelihood=1)
+        cls.note = RiskNote.objects.create(risk=cls.risk, note="Checked", created_by=cls.user)
+
+    def test_str_uses_loaded_relations(self):
+        note = RiskNote.objects.select_related("risk", "created_by").get(pk=self.note.pk)
+
+        self.assertEqual(str(note), f"Note for {self.risk.risk_id} by noteuser")
+
+    def test_str_does_not_query_for_relations(self):
+        note = RiskNote.objects.get(pk=self.note.pk)
+
+        with self.assertNumQueries(0):
+            label = str(note)
+
+        self.assertEqual(label, f"Note for #{self.risk.pk} by #{self.user.pk}")
+
+
+class RiskActionQuerySetTest(TestCase):
+    """Test cases for RiskAction due-date querysets."""
+
+    @classmethod
+    def setUpTestData(cls):
+        user = User.objects.create_user(
+            username="querysetuser", email="queryset@example.com", password="testpass123"
+        )
+        risk = Risk.objects.create(title="Action Risk", description="", impact=2, likelihood=2)
+        today = date.today()
+
+        def action(title, due_in, status="pending"):
+            return RiskAction.objects.create(
+                risk=risk,
+                title=title,
+                action_type="mitigation",
+                assigned_to=user,
+                due_date=today + timedelta(days=due_in),
+                status=status,
+            )
+
+        cls.overdue = action("Overdue", -2)
+        cls.done_late = action("Done Late", -2, status="completed")
+        cls.due_soon = action("Due Soon", 3)
+        cls.later = action("Later", 30)
+
+    def test_overdue_excludes_closed_actions(self):
+        self.assertEqual(list(RiskAction.objects.overdue()), [self.overdue])
+
+    def test_due_soon_window(self):
+        self.assertEqual(list(RiskAction.objects.due_soon(days=7)), [self.due_soon])
+        self.assertEqual(set(RiskAction.objects.due_soon(days=30)), {self.due_soon, self.later})
+
+    def test_for_dashboard_loads_relations_in_one_query(self):
+        with self.assertNumQueries(1):
+            rows = {
+                (action.title, action.risk.risk_id, action.assigned_to.username)
+                for action in RiskAction.objects.for_dashboard()
+            }
+
+        self.assertIn(("Overdue", self.overdue.risk.risk_id, "querysetuser"), rows)
+
+    def test_for_notification_joins_rendered_relations(self):
+        with self.assertNumQueries(1):
+            action = RiskAction.objects.for_notification().get(pk=self.overdue.pk)
+            self.assertIsNone(action.risk.risk_owner)
+            self.assertEqual(action.assigned_to.username, "querysetuser")
+        self.assertIn("current_controls", action.risk.get_deferred_fields())
+
+    def test_due_within_matches_queryset(self):
+        actions = [self.overdue, self.due_soon, self.later]
+
+        self.assertEqual([a for a in actions if a.is_due_soon], [self.due_soon])
+        self.assertEqual([a for a in actions if a.due_within(30)], [self.due_soon, self.later])
+
+    def test_days_until_due_annotation(self):
+        actions = {a.pk: a.days_until_due for a in RiskAction.objects.with_days_until_due()}
+
+        self.assertEqual(actions[self.overdue.pk], -2)
+        self.assertEqual(actions[self.later.pk], 30)
+
+    def test_reminder_candidates_skip_actions_between_reminder_days(self):
+        candidates = {a.pk: a.days_until_due for a in RiskAction.objects.reminder_candidates([3])}
+
+        self.assertEqual(
+            candidates, {self.overdue.pk: -2, self.done_late.pk: -2, self.due_soon.pk: 3}
+        )
+
+    def test_reminder_candidates_for_assignee_follow_their_settings(self):
+        def candidates():
+            return set(RiskAction.objects.reminder_candidates_for_assignee())
+
+        # Without a configuration the default seven-day daily window applies
+        self.assertEqual(candidates(), {self.overdue, self.done_late, self.due_soon})
+
+        RiskActionReminderConfiguration.objects.create(
+            user=self.overdue.assigned_to, reminder_frequency="weekly"
+        )
+        self.assertEqual(candidates(), {self.overdue, self.done_late})
+
+
+class RiskIdSequenceTest(TestCase):
+    """Test cases for sequence-backed identifier generation."""
+
+    def test_risk_ids_increment_from_sequence(self):
+        """Consecutive risks draw consecutive numbers without scanning risk IDs."""
+        year = timezone.now().year
+        first = Risk.objects.create(title="First", description="", impact=1, likelihood=1)
+        second = Risk.objects.create(title="Second", description="", impact=1, likelihood=1)
+
+        self.assertEqual(first.risk_id, f"RISK-{year}-0001")
+        self.assertEqual(second.risk_id, f"RISK-{year}-0002")
+        self.assertEqual(
+            RiskIdSequence.objects.get(kind=RiskIdSequence.KIND_RISK, year=year).counter, 2
+        )
+
+    def test_sequence_seeds_from_existing_identifiers(self):
+        """A new year's counter continues after identifiers that already exist."""
+        year = timezone.now().year
+        Risk.objects.create(
+            risk_id=f"RISK-{year}-0041", title="Imported", description="", impact=1, likelihood=1
+        )
+
+        risk = Risk.objects.create(title="Next", description="", impact=1, likelihood=1)
+
+        self.assertEqual(risk.risk_id, f"RISK-{year}-0042")
+
+    def test_create_many_reserves_ids_and_inserts_once(self):
+        """Bulk-created risks get consecutive IDs, derived fields and post_save."""
+        year = timezone.now().year
+        Risk.objects.create(title="Existing", description="", impact=1, likelihood=1)
+        risks = [
+            Risk(title="Bulk Low", description="", impact=1, likelihood=1),
+            Risk(title="Bulk Critical", description="", impact=5, likelihood=5),
+        ]
+
+        with (
+            CaptureQueriesContext(connection) as ctx,
+            patch("risk.signals.invalidate_risk_level_pks") as mock_invalidate,
+        ):
+            created = Risk.create_many(risks)
+
+        inserts = [
+            q for q in ctx.captured_queries if q["sql"].startswith('INSERT INTO "risk_risk"')
+        ]
+        self.assertEqual(len(inserts), 1)
+        self.assertEqual(mock_invalidate.call_count, 2)
+        self.assertEqual(
+            [risk.risk_id for risk in created], [f"RISK-{year}-0002", f"RISK-{year}-0003"]
+        )
+        stored_levels = Risk.objects.filter(pk__in=[risk.pk for risk in created]).order_by(
+            "risk_id"
+        )
+        self.assertEqual(
+            [risk.risk_level for risk in stored_levels],
+            [Risk.objects.get(title="Existing").risk_level, "critical"],
+        )
+        self.assertEqual(created[1].last_assessed_date, timezone.now().date())
+
+    def test_action_create_many_reserves_ids_and_sets_completion(self):
+        """Bulk-created actions get consecutive IDs and save()'s completion fields."""
+        year = timezone.now().year
+        risk = Risk.objects.create(title="Parent", description="", impact=1, likelihood=1)
+        due = date.today() + timedelta(days=7)
+        actions = [
+            RiskAction(risk=risk, title="Open", action_type="other", due_date=due),
+            RiskAction(
+                risk=risk, title="Done", action_type="other", due_date=due, status="completed"
+            ),
+        ]
+
+        with CaptureQueriesContext(connection) as ctx:
+            created = RiskAction.create_many(actions)
+
+        inserts = [
+            q for q in ctx.captured_queries if q["sql"].startswith('INSERT INTO "risk_riskaction"')
+        ]
+        self.assertEqual(len(inserts), 1)
+
+        self.assertEqual(
+            [action.action_id for action in created], [f"RA-{year}-0001", f"RA-{year}-0002"]
+        )
+        done = RiskAction.objects.get(pk=created[1].pk)
+        self.assertEqual(done.completed_date, timezone.now().date())
+        self.assertEqual(done.progress_percentage, 100)
+        self.assertIsNone(RiskAction.objects.get(pk=created[0].pk).completed_date)
+
+
+class RiskMatrixTest(TestCase):
+    """Test cases for risk matrix level calculation."""
+
+    def setUp(self):
+        # The default matrix is cached per process; don't leak rolled-back rows.
+        self.addCleanup(RiskMatrix.invalidate_default)
+
+    def test_default_matrix_levels(self):
+        """The generated default matrix grades by impact + likelihood."""
+        matrix = RiskMatrix.objects.create(name="Default 5x5")
+
+        self.assertEqual(matrix.matrix_config["1"]["2"], "low")
+        self.assertEqual(matrix.calculate_risk_level(2, 3), "medium")
+        self.assertEqual(matrix.calculate_risk_level(3, 4), "high")
+        self.assertEqual(matrix.calculate_risk_level(5, 5), "critical")
+        # Out-of-range ratings clamp to the matrix edges.
+        self.assertEqual(matrix.calculate_risk_level(9, 0), matrix.calculate_risk_level(5, 1))
+
+    def test_packed_lookup_matches_config(self):
+        """Every cell of the largest matrix reads back the level it was configured with."""
+        matrix = RiskMatrix.objects.create(name="7x7", impact_levels=7, likelihood_levels=7)
+
+        for impact in range(1, 8):
+            for likelihood in range(1, 8):
+                self.assertEqual(
+                    matrix.calculate_risk_level(impact, likelihood),
+                    matrix.matrix_config[str(impact)][str(likelihood)],
+                )
+
+    def test_packed_lookup_outside_configured_levels(self):
+        """Level counts outside the validated 3-7 range still read back every cell."""
+        matrix = RiskMatrix(name="9x8", impact_levels=9, likelihood_levels=8)
+        matrix.matrix_config = matrix._generate_default_matrix()
+
+        for impact in range(1, 10):
+            for likelihood in range(1, 9):
+                self.assertEqual(
+                    matrix.calculate_risk_level(impact, likelihood),
+                    matrix.matrix_config[str(impact)][str(likelihood)],
+                )
+
+    def test_unknown_level_labels_still_resolve(self):
+        """Labels outside the low-critical scale are returned as configured."""
+        matrix = RiskMatrix.objects.create(name="Custom Labels")
+        matrix.matrix_config["2"]["3"] = "severe"
+        matrix.save()
+
+        self.assertEqual(matrix.calculate_risk_level(2, 3), "severe")
+        self.assertEqual(matrix.calculate_risk_level(5, 5), "critical")
+
+    def test_generated_configs_are_independent(self):
+        """Editing one matrix's generated config never leaks into another."""
+        first = RiskMatrix.objects.create(name="First")
+        first.matrix_config["1"]["1"] = "critical"
+        first.save()
+
+        second = RiskMatrix.objects.create(name="Second")
+
+        self.assertEqual(first.calculate_risk_level(1, 1), "critical")
+        self.assertEqual(second.calculate_risk_level(1, 1), "low")
+
+    def test_default_matrix_is_cached_until_matrices_change(self):
+        """Risk saves reuse the cached default matrix; saving a matrix refreshes it."""
+        matrix = RiskMatrix.objects.create(name="Strict", is_default=True)
+        matrix.matrix_config["1"]["1"] = "high"
+        matrix.save()
+        Risk.objects.create(title="Warm Cache", description="", impact=1, likelihood=1)
+
+        with CaptureQueriesContext(connection) as ctx:
+            risk = Risk.objects.create(title="Cached", description="", impact=1, likelihood=1)
+
+        self.assertEqual(risk.risk_level, "high")
+        self.assertFalse(
+            [query for query in ctx.captured_queries if "risk_riskmatrix" in query["sql"]]
+        )
+
+        matrix.matrix_config["1"]["1"] = "critical"
+        matrix.save()
+        risk.save()
+        self.assertEqual(risk.risk_level, "critical")
+
+    def test_config_change_recalculates_linked_risks(self):
+        """Editing a matrix regrades its risks in a single UPDATE."""
+        matrix = RiskMatrix.objects.create(name="Linked")
+        risk = Risk.objects.create(
+            title="Linked Risk", description="", impact=1, likelihood=1, risk_matrix=matrix
+        )
+        unlinked = Risk.objects.create(title="Unlinked", description="", impact=1, likelihood=1)
+        self.assertEqual(risk.risk_level, "low")
+
+        matrix = RiskMatrix.objects.get(pk=matrix.pk)
+        matrix.matrix_config["1"]["1"] = "critical"
+        with CaptureQueriesContext(connection) as ctx:
+            matrix.save()
+
+        updates = [query for query in ctx.captured_queries if 'UPDATE "risk_risk"' in query["sql"]]
+        self.assertEqual(len(updates), 1)
+        risk.refresh_from_db()
+        unlinked.refresh_from_db()
+        self.assertEqual(risk.risk_level, "critical")
+        self.assertEqual(unlinked.risk_level, "low")
+
+    def test_unchanged_matrix_save_skips_recalculation(self):
+        """Saving a matrix without grading changes leaves risks alone."""
+        matrix = RiskMatrix.objects.create(name="Stable")
+        matrix = RiskMatrix.objects.get(pk=matrix.pk)
+        matrix.description = "Renamed only"
+
+        with CaptureQueriesContext(connection) as ctx:
+            matrix.save()
+
+        self.assertFalse([query for query in ctx.captured_queries if '"risk_risk"' in query["sql"]])
+
+
+class RiskActionReminderLogTest(TestCase):
+    """Test cases for reminder log deduplication."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username="reminderloguser", email="reminderlog@example.com", password="testpass123"
+        )
+        risk = Risk.objects.create(title="Logged Risk", description="", impact=2, likelihood=2)
+        cls.action = RiskAction.objects.create(
+            risk=risk,
+            title="Logged Action",
+            action_type="mitigation",
+            assigned_to=cls.user,
+            due_date=date.today(),
+        )
+
+    def log(self, reminder_type, days_before_due=None):
+        return RiskActionReminderLog.objects.create(
+            action=self.action,
+            user=self.user,
+            reminder_type=reminder_type,
+            subject=reminder_type,
+            days_before_due=days_before_due,
+        )
+
+    def test_scheduled_reminders_are_unique(self):
+        """A scheduled reminder is logged once, with or without a day offset."""
+        for days_before_due in (0, None):
+            self.log("due_today", days_before_due)
+            with self.assertRaises(IntegrityError), transaction.atomic():
+                self.log("due_today", days_before_due)
+
+    def test_digests_may_repeat(self):
+        """Digests and assignment notices carry no day offset and can recur."""
+        for reminder_type in ("weekly_digest", "assignment"):
+            self.log(reminder_type)
+            self.log(reminder_type)
+
+        self.assertEqual(RiskActionReminderLog.objects.count(), 4)
+
+    def test_log_many_skips_already_logged_reminders(self):
+        """Bulk logging inserts new entries and ignores duplicates."""
+        self.log("overdue", -1)
+
+        RiskActionReminderLog.log_many(
+            [
+                RiskActionReminderLog(
+                    action=self.action,
+                    user=self.user,
+                    reminder_type="overdue",
+                    subject="overdue",
+                    days_before_due=days_before_due,
+                )
+                for days_before_due in (-1, -2)
+            ]
+        )
+
+        logged = RiskActionReminderLog.objects.filter(reminder_type="overdue")
+        self.assertEqual(sorted(logged.values_list("days_before_due", flat=True)), [-2, -1])
+        self.assertTrue(all(log.sent_at for log in logged))
+
+
+class RiskActionReminderConfigurationTest(TestCase):
+    """Test cases for reminder schedule settings."""
+
+    def test_get_reminder_days_by_frequency(self):
+        user = User.objects.create_user(
+            username="scheduleuser", email="schedule@example.com", password="testpass123"
+        )
+        config = RiskActionReminderConfiguration.get_or_create_for_user(user)
+        config.advance_warning_days = 3
+
+        config.reminder_frequency = "daily"
+        self.assertEqual(config.get_reminder_days(), (1, 2, 3))
+        config.reminder_frequency = "weekly"
+        self.assertEqual(config.get_reminder_days(), (7,))
+        config.reminder_frequency = "custom"
+        config.custom_reminder_days = [1, 14, 3]
+        self.assertEqual(config.get_reminder_days(), (14, 3, 1))
+        config.custom_reminder_days.append(30)
+        self.assertEqual(config.get_reminder_days(), (30, 14, 3, 1))
+
+    def test_bulk_get_or_create_fills_missing_configs(self):
+        configured, unconfigured = (
+            User.objects.create_user(username=name, email=f"{name}@example.com", password="pw")
+            for name in ("bulkconfigured", "bulkunconfigured")
+        )
+        existing = RiskActionReminderConfiguration.objects.create(
+            user=configured, enable_reminders=False
+        )
+
+        with self.assertNumQueries(3):
+            configs = RiskActionReminderConfiguration.bulk_get_or_create(
+                [configured.pk, unconfigured.pk]
+            )
+
+        self.assertEqual(configs[configured.pk], existing)
+        self.assertFalse(configs[configured.pk].enable_reminders)
+        self.assertTrue(configs[unconfigured.pk].enable_reminders)
+        self.assertEqual(RiskActionReminderConfiguration.objects.count(), 2)
+        with self.assertNumQueries(1):
+            RiskActionReminderConfiguration.bulk_get_or_create([configured.pk, unconfigured.pk])
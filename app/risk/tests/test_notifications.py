@@ -1,9 +1,11 @@
 import json
 from datetime import date, timedelta
+from smtplib import SMTPException
 from unittest.mock import patch, MagicMock, call
 from django.test import TestCase, override_settings
 from django.contrib.auth import get_user_model
 from django.core import mail
+from django.db import connection
 from django.utils import timezone
 from django.template.loader import render_to_string
 
@@ -16,7 +18,11 @@ from ..models import (
     RiskActionReminderConfiguration,
     RiskActionReminderLog,
 )
-from ..notifications import RiskActionReminderService, RiskActionNotificationService
+from ..notifications import (
+    RiskActionNotificationService,
+    RiskActionReminderService,
+    send_notification_email,
+)
 
 User = get_user_model()
 
@@ -612,3 +618,265 @@ class RiskActionReminderLogTest(TestCase):
         self.assertEqual(total_logs, 3)
         self.assertEqual(successful_logs, 2)
         self.assertEqual(failed_logs, 1)
+
+
+@override_settings(EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend")
+class NotificationDeliveryTest(TestCase):
+    """Test cases for queued and batched notification delivery."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="queueduser", email="queued@example.com", password="testpass123"
+        )
+        risk = Risk.objects.create(title="Queued Risk", description="", impact=2, likelihood=2)
+        self.action = RiskAction.objects.create(
+            risk=risk,
+            title="Queued Action",
+            action_type="mitigation",
+            assigned_to=self.user,
+            due_date=date.today() + timedelta(days=5),
+        )
+
+    def test_task_sends_email_and_marks_log_sent(self):
+        log = RiskActionReminderLog.objects.create(
+            action=self.action, user=self.user, reminder_type="assignment", subject="Assigned"
+        )
+
+        send_notification_email.apply(
+            args=["Assigned", "plain body", "<p>html body</p>", [self.user.email]],
+            kwargs={"log_id": log.pk},
+        )
+
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, [self.user.email])
+        self.assertEqual(mail.outbox[0].alternatives[0][0], "<p>html body</p>")
+        log.refresh_from_db()
+        self.assertTrue(log.email_sent)
+
+    @patch("risk.notifications.send_mail", side_effect=SMTPException("mailbox unavailable"))
+    def test_task_records_error_when_retries_run_out(self, mock_send_mail):
+        """A send that fails its last retry leaves the error on the reminder log."""
+        log = RiskActionReminderLog.objects.create(
+            action=self.action, user=self.user, reminder_type="assignment", subject="Assigned"
+        )
+
+        with self.assertRaises(SMTPException):
+            send_notification_email.apply(
+                args=["Assigned", "plain body", "<p>html body</p>", [self.user.email]],
+                kwargs={"log_id": log.pk},
+                retries=send_notification_email.max_retries,
+            )
+
+        log.refresh_from_db()
+        self.assertFalse(log.email_sent)
+        self.assertEqual(log.error_message, "mailbox unavailable")
+
+    @patch("risk.notifications._render_email", return_value=("<p>Assigned</p>", "Assigned"))
+    @patch("risk.notifications.send_notification_email.delay")
+    def test_assignment_email_queued_on_commit_with_schema(self, mock_delay, mock_render):
+        """The worker is only handed the email once the reminder log has committed."""
+        with self.captureOnCommitCallbacks() as callbacks:
+            queued = RiskActionReminderService.send_assignment_notification(self.action, self.user)
+            mock_delay.assert_not_called()
+
+        self.assertTrue(queued)
+        self.assertEqual(len(callbacks), 1)
+        callbacks[0]()
+        log = RiskActionReminderLog.objects.get(action=self.action, reminder_type="assignment")
+        self.assertEqual(mock_delay.call_args.kwargs["log_id"], log.pk)
+        self.assertEqual(mock_delay.call_args.kwargs["schema_name"], connection.schema_name)
+
+    def test_prefetched_sent_keys_skip_logged_reminders(self):
+        RiskActionReminderLog.objects.create(
+            action=self.action,
+            user=self.user,
+            reminder_type="advance_warning",
+            subject="Due soon",
+            days_before_due=5,
+        )
+        sent_keys = RiskActionReminderService.prefetch_sent_keys(self.user)
+
+        self.assertEqual(sent_keys, {(self.action.pk, "advance_warning", 5)})
+        with patch.object(RiskActionReminderLog.objects, "filter") as mock_filter:
+            sent = RiskActionReminderService.send_individual_reminder(
+                self.action, self.user, "advance_warning", 5, sent_keys=sent_keys
+            )
+
+        self.assertFalse(sent)
+        mock_filter.assert_not_called()
+        self.assertEqual(mail.outbox, [])
+
+    def test_prefetched_sent_keys_cover_today_only(self):
+        earlier = RiskActionReminderLog.objects.create(
+            action=self.action,
+            user=self.user,
+            reminder_type="advance_warning",
+            subject="Due soon",
+            days_before_due=7,
+        )
+        RiskActionReminderLog.objects.filter(pk=earlier.pk).update(
+            sent_at=timezone.now() - timedelta(days=2)
+        )
+        RiskActionReminderLog.objects.create(
+            action=self.action,
+            user=self.user,
+            reminder_type="advance_warning",
+            subject="Due soon",
+            days_before_due=5,
+        )
+
+        sent_keys = RiskActionReminderService.prefetch_sent_keys(self.user)
+
+        self.assertEqual(sent_keys, {(self.action.pk, "advance_warning", 5)})
+
+    @patch("risk.notifications._render_email", return_value=("<p>Due</p>", "Due"))
+    def test_repeated_key_after_due_date_moves_replaces_log(self, mock_render):
+        """A key logged on an earlier day is sent again and its log replaced."""
+        for log_buffer in (None, []):
+            with self.subTest(buffered=log_buffer is not None):
+                earlier = RiskActionReminderLog.objects.create(
+                    action=self.action,
+                    user=self.user,
+                    reminder_type="advance_warning",
+                    subject="Due soon",
+                    days_before_due=5,
+                )
+                RiskActionReminderLog.objects.filter(pk=earlier.pk).update(
+                    sent_at=timezone.now() - timedelta(days=3)
+                )
+
+                sent = RiskActionReminderService.send_individual_reminder(
+                    self.action, self.user, "advance_warning", 5, log_buffer=log_buffer
+                )
+                if log_buffer is not None:
+                    RiskActionReminderLog.log_many(log_buffer)
+
+                self.assertTrue(sent)
+                log = RiskActionReminderLog.objects.get()
+                self.assertNotEqual(log.pk, earlier.pk)
+                self.assertTrue(log.email_sent)
+                log.delete()
+
+    @patch("risk.notifications._render_email", return_value=("<p>Due</p>", "Due"))
+    def test_log_buffer_defers_reminder_logs(self, mock_render):
+        log_buffer = []
+
+        sent = RiskActionReminderService.send_individual_reminder(
+            self.action, self.user, "advance_warning", 5, log_buffer=log_buffer
+        )
+
+        self.assertTrue(sent)
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertFalse(RiskActionReminderLog.objects.exists())
+        RiskActionReminderLog.log_many(log_buffer)
+        log = RiskActionReminderLog.objects.get()
+        self.assertEqual((log.reminder_type, log.days_before_due), ("advance_warning", 5))
+        self.assertTrue(log.email_sent)
+
+    @patch("risk.notifications._render_email", return_value=("<p>Digest</p>", "Digest"))
+    def test_weekly_digest_partitions_one_fetch(self, mock_render):
+        overdue = RiskAction.objects.create(
+            risk=self.action.risk,
+            title="Late Action",
+            action_type="mitigation",
+            assigned_to=self.user,
+            due_date=date.today() - timedelta(days=1),
+            priority="high",
+            status="in_progress",
+        )
+
+        sent = RiskActionReminderService.send_weekly_digest(
+            self.user, RiskAction.objects.filter(assigned_to=self.user).order_by("due_date")
+        )
+
+        self.assertTrue(sent)
+        context = mock_render.call_args[0][1]
+        self.assertEqual(context["actions"], [overdue, self.action])
+        self.assertEqual(context["overdue_actions"], [overdue])
+        self.assertEqual(context["due_soon_actions"], [self.action])
+        self.assertEqual(context["in_progress_actions"], [overdue])
+        self.assertEqual(context["high_priority_actions"], [overdue])
+        self.assertEqual(context["week_ending"], timezone.now().date())
+        log = RiskActionReminderLog.objects.get(reminder_type="weekly_digest")
+        self.assertEqual(log.action, overdue)
+
+    @patch("risk.notifications._render_email", return_value=("<p>Status</p>", "Status"))
+    def test_status_change_skips_changer_and_opted_out_users(self, mock_render):
+        owner = User.objects.create_user(
+            username="queuedowner", email="owner@example.com", password="testpass123"
+        )
+        self.action.risk.risk_owner = owner
+        self.action.risk.save()
+        RiskActionReminderConfiguration.objects.create(user=owner, email_notifications=False)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            RiskActionNotificationService.notify_status_change(
+                self.action, "pending", "in_progress", changed_by=owner
+            )
+            RiskActionNotificationService.notify_status_change(
+                self.action, "in_progress", "completed", changed_by=self.user
+            )
+
+        self.assertEqual([email.to for email in mail.outbox], [[self.user.email]])
+        self.assertEqual(mock_render.call_args[0][1]["user"], self.user)
+
+    def test_generate_subject_by_reminder_type(self):
+        self.action.title = "Rotate {keys}"
+        subject = RiskActionReminderService._generate_subject
+        suffix = f"Risk Action {self.action.action_id} - Rotate {{keys}}"
+
+        self.assertEqual(subject(self.action, "overdue", -2), f"⚠️ OVERDUE: {suffix}")
+        self.assertEqual(subject(self.action, "advance_warning", 1), f"⏰ Due Tomorrow: {suffix}")
+        self.assertEqual(subject(self.action, "advance_warning", 5), f"📋 Due in 5 days: {suffix}")
+        self.assertEqual(
+            subject(self.action, "custom", None),
+            f"Risk Action Reminder: {self.action.action_id} - Rotate {{keys}}",
+        )
+
+    def test_determine_urgency_combines_priority_and_days(self):
+        urgency = RiskActionReminderService._determine_urgency
+        cases = [
+            ("low", -1, "critical"),
+            ("low", None, "low"),
+            ("high", None, "high"),
+            ("low", 0, "high"),
+            ("low", 1, "high"),
+            ("low", 3, "medium"),
+            ("low", 30, "low"),
+            ("medium", 30, "medium"),
+            ("critical", 30, "critical"),
+            ("medium", 1, "high"),
+        ]
+        for priority, days, expected in cases:
+            self.action.priority = priority
+            with self.subTest(priority=priority, days=days):
+                self.assertEqual(urgency(self.action, days), expected)
+
+    @patch("risk.notifications._render_email", return_value=("<p>Evidence</p>", "Evidence"))
+    def test_evidence_upload_checks_opt_out_without_creating_config(self, mock_render):
+        evidence = RiskActionEvidence.objects.create(
+            action=self.action, title="Scan report", evidence_type="document"
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            with self.assertNumQueries(1):
+                RiskActionNotificationService.notify_evidence_uploaded(evidence)
+
+        self.assertEqual([email.to for email in mail.outbox], [[self.user.email]])
+        self.assertFalse(RiskActionReminderConfiguration.objects.exists())
+
+        RiskActionReminderConfiguration.objects.create(user=self.user, email_notifications=False)
+        with self.captureOnCommitCallbacks(execute=True):
+            RiskActionNotificationService.notify_evidence_uploaded(evidence)
+
+        self.assertEqual(len(mail.outbox), 1)
+
+    @override_settings(DEFAULT_FROM_EMAIL="")
+    @patch("risk.notifications._render_email")
+    def test_assignment_skipped_without_sender_address(self, mock_render):
+        with self.assertNumQueries(0):
+            queued = RiskActionReminderService.send_assignment_notification(self.action, self.user)
+
+        self.assertFalse(queued)
+        mock_render.assert_not_called()
+        self.assertEqual(mail.outbox, [])
@@ -197,6 +197,38 @@ class RiskActionEvidenceModelTest(TestCase):
         self.assertEqual(evidence.uploaded_by, self.user)
         self.assertIsNotNone(evidence.created_at)
 
+    def test_validate_evidence(self):
+        """Validating evidence writes only the validation columns."""
+        evidence = RiskActionEvidence.objects.create(
+            action=self.action, title="Test Evidence", uploaded_by=self.user
+        )
+
+        with self.assertNumQueries(1):
+            evidence.validate_evidence(self.user, "Looks good")
+
+        evidence.refresh_from_db()
+        self.assertTrue(evidence.is_validated)
+        self.assertEqual(evidence.validated_by, self.user)
+        self.assertEqual(evidence.validation_notes, "Looks good")
+
+    def test_bulk_validate(self):
+        """bulk_validate marks a whole queryset in one UPDATE and keeps existing notes."""
+        for title in ("First", "Second"):
+            RiskActionEvidence.objects.create(
+                action=self.action, title=title, validation_notes="Reviewed"
+            )
+
+        with self.assertNumQueries(1):
+            count = RiskActionEvidence.bulk_validate(RiskActionEvidence.objects.all(), self.user)
+
+        self.assertEqual(count, 2)
+        self.assertEqual(
+            RiskActionEvidence.objects.filter(
+                is_validated=True, validated_by=self.user, validation_notes="Reviewed"
+            ).count(),
+            2,
+        )
+
 
 class RiskActionReminderConfigurationModelTest(TestCase):
     """Test cases for RiskActionReminderConfiguration model."""
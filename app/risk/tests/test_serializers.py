@@ -0,0 +1,349 @@
+from datetime import date, timedelta
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.files.storage import FileSystemStorage
+from django.db import connection
+from django.db.models import Count
+from django.test import RequestFactory, TestCase
+from django.test.utils import CaptureQueriesContext
+
+from ..models import (
+    Risk,
+    RiskAction,
+    RiskActionEvidence,
+    RiskActionNote,
+    RiskCategory,
+    RiskMatrix,
+    RiskNote,
+)
+from ..serializers import (
+    BulkRiskCreateSerializer,
+    RiskActionBulkCreateSerializer,
+    RiskActionDetailSerializer,
+    RiskActionEvidenceSerializer,
+    RiskCategorySerializer,
+    RiskDetailSerializer,
+    RiskListSerializer,
+    RiskMatrixSerializer,
+)
+
+User = get_user_model()
+
+
+class RiskMatrixSerializerTest(TestCase):
+    """Test cases for RiskMatrixSerializer."""
+
+    def setUp(self):
+        self.addCleanup(RiskMatrix.invalidate_default)
+        self.matrix = RiskMatrix.objects.create(name="Serializer Matrix")
+
+    def test_partial_update_writes_only_submitted_fields(self):
+        """Renaming a matrix leaves the matrix_config column out of the UPDATE."""
+        serializer = RiskMatrixSerializer(self.matrix, data={"name": "Renamed"}, partial=True)
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+
+        with CaptureQueriesContext(connection) as ctx:
+            serializer.save()
+
+        updates = [q["sql"] for q in ctx.captured_queries if q["sql"].startswith("UPDATE")]
+        self.assertEqual(len(updates), 1)
+        self.assertNotIn("matrix_config", updates[0])
+        self.matrix.refresh_from_db()
+        self.assertEqual(self.matrix.name, "Renamed")
+        self.assertEqual(self.matrix.calculate_risk_level(5, 5), "critical")
+
+    def test_matrix_config_validation(self):
+        """Each missing or invalid cell is reported by its position."""
+        grid = {str(i): {str(j): "medium" for j in range(1, 4)} for i in range(1, 4)}
+        cases = {
+            "valid": (grid, None),
+            "missing impact": (
+                {"1": grid["1"], "3": grid["3"]},
+                "Missing impact level 2 in matrix configuration",
+            ),
+            "missing likelihood": (
+                {**grid, "2": {"1": "high", "3": "high"}},
+                "Missing likelihood level 2 for impact 2",
+            ),
+            "invalid level": (
+                {**grid, "1": {**grid["1"], "2": "severe"}},
+                "Invalid risk level 'severe' at impact 1, likelihood 2",
+            ),
+        }
+        for name, (config, error) in cases.items():
+            with self.subTest(name):
+                serializer = RiskMatrixSerializer(
+                    data={
+                        "name": f"Matrix {name}",
+                        "impact_levels": 3,
+                        "likelihood_levels": 3,
+                        "matrix_config": config,
+                    }
+                )
+                if error is None:
+                    self.assertTrue(serializer.is_valid(), serializer.errors)
+                else:
+                    self.assertFalse(serializer.is_valid())
+                    self.assertEqual(serializer.errors["matrix_config"], [error])
+
+
+class BulkRiskCreateSerializerTest(TestCase):
+    """Test cases for BulkRiskCreateSerializer row validation."""
+
+    def test_invalid_rows_are_reported_by_position(self):
+        valid = {"title": "Valid", "description": "Fine"}
+        cases = {
+            "blank title": ({**valid, "title": "  "}, "Risk 2: 'title' is required"),
+            "non-string description": (
+                {**valid, "description": 7},
+                "Risk 2: 'description' is required",
+            ),
+            "boolean impact": ({**valid, "impact": True}, "Risk 2: 'impact' must be an integer"),
+            "likelihood out of range": (
+                {**valid, "likelihood": 6},
+                "Risk 2: 'likelihood' must be an integer",
+            ),
+            "long title": ({**valid, "title": "x" * 201}, "Risk 2: 'title' must be at most"),
+            "non-text controls": (
+                {**valid, "current_controls": ["firewall"]},
+                "Risk 2: 'current_controls' must be text",
+            ),
+        }
+        for name, (row, error) in cases.items():
+            with self.subTest(name):
+                serializer = BulkRiskCreateSerializer(data={"risks": [valid, row]})
+
+                self.assertFalse(serializer.is_valid())
+                self.assertTrue(str(serializer.errors["risks"][0]).startswith(error))
+
+
+class RiskActionBulkCreateSerializerTest(TestCase):
+    """Test cases for RiskActionBulkCreateSerializer row validation."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="bulkassignee", email="bulk@example.com", password="testpass123"
+        )
+        self.risk = Risk.objects.create(title="Bulk Risk", description="", impact=1, likelihood=1)
+        self.valid = {
+            "title": "Valid",
+            "description": "Fine",
+            "due_date": (date.today() + timedelta(days=7)).isoformat(),
+        }
+
+    def test_rows_resolve_assignee_and_dates(self):
+        row = {**self.valid, "assigned_to": self.user.pk, "start_date": "2026-01-05"}
+        serializer = RiskActionBulkCreateSerializer(data={"risk": self.risk.pk, "actions": [row]})
+
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        action_data = serializer.validated_data["actions"][0]
+        self.assertEqual(action_data["assigned_to"], self.user)
+        self.assertEqual(action_data["start_date"], date(2026, 1, 5))
+
+    def test_invalid_rows_are_reported_by_position(self):
+        valid = self.valid
+        cases = {
+            "unknown assignee": ({**valid, "assigned_to": 999999}, "Action 2: 'assigned_to'"),
+            "malformed assignee": ({**valid, "assigned_to": {"id": 1}}, "Action 2: 'assigned_to'"),
+            "unknown priority": ({**valid, "priority": "urgent"}, "Action 2: 'priority'"),
+            "unknown action type": ({**valid, "action_type": 3}, "Action 2: 'action_type'"),
+            "bad start date": ({**valid, "start_date": "05/01/2026"}, "Action 2: 'start_date'"),
+            "long title": ({**valid, "title": "x" * 201}, "Action 2: 'title' must be at most"),
+            "non-text criteria": ({**valid, "success_criteria": ["a"]}, "Action 2: 'success"),
+        }
+        for name, (row, error) in cases.items():
+            with self.subTest(name):
+                serializer = RiskActionBulkCreateSerializer(
+                    data={"risk": self.risk.pk, "actions": [valid, row]}
+                )
+
+                self.assertFalse(serializer.is_valid())
+                self.assertTrue(str(serializer.errors["actions"][0]).startswith(error))
+
+
+class RiskCategorySerializerTest(TestCase):
+    """Test cases for RiskCategorySerializer."""
+
+    def setUp(self):
+        self.category = RiskCategory.objects.create(name="Counted Category")
+        for title in ("First", "Second"):
+            Risk.objects.create(
+                title=title, description="", category=self.category, impact=1, likelihood=1
+            )
+
+    def test_risk_count_uses_annotation(self):
+        """An annotated queryset serializes without a COUNT per category."""
+        RiskCategory.objects.create(name="Empty Category")
+        categories = RiskCategory.objects.annotate(risk_count=Count("risks")).order_by("name")
+
+        with self.assertNumQueries(1):
+            data = RiskCategorySerializer(categories, many=True).data
+
+        self.assertEqual([row["risk_count"] for row in data], [2, 0])
+
+    def test_risk_count_falls_back_to_query(self):
+        """Categories loaded without the annotation, e.g. nested in a risk, still count."""
+        self.assertEqual(RiskCategorySerializer(self.category).data["risk_count"], 2)
+
+
+class RiskSerializerEagerLoadingTest(TestCase):
+    """Test cases for the risk serializers' eager-loading hooks."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="eageruser", email="eager@example.com", password="testpass123"
+        )
+        category = RiskCategory.objects.create(name="Eager Category")
+        for title in ("First", "Second", "Third"):
+            risk = Risk.objects.create(
+                title=title,
+                description="",
+                category=category,
+                risk_owner=self.user,
+                created_by=self.user,
+                impact=2,
+                likelihood=2,
+            )
+            RiskNote.objects.create(risk=risk, note="Reviewed", created_by=self.user)
+
+    def test_list_serializer_renders_from_one_query(self):
+        queryset = RiskListSerializer.setup_eager_loading(Risk.objects.all())
+
+        with self.assertNumQueries(1):
+            data = RiskListSerializer(queryset, many=True).data
+
+        self.assertEqual({row["category_name"] for row in data}, {"Eager Category"})
+        self.assertLessEqual(
+            set(RiskListSerializer.UNRENDERED_TEXT_FIELDS), queryset[0].get_deferred_fields()
+        )
+
+    def test_list_serializer_is_read_only(self):
+        fields = RiskListSerializer().fields
+
+        self.assertEqual([name for name, field in fields.items() if not field.read_only], [])
+
+    def test_detail_serializer_query_count_is_constant(self):
+        queryset = RiskDetailSerializer.setup_eager_loading(Risk.objects.all())
+
+        # Risks, annotated categories and notes with their authors
+        with self.assertNumQueries(3):
+            data = RiskDetailSerializer(queryset, many=True).data
+
+        self.assertEqual([row["category"]["risk_count"] for row in data], [3, 3, 3])
+        self.assertEqual(len(data[0]["notes"]), 1)
+
+    def test_detail_serializer_renders_requested_fields_only(self):
+        risk = Risk.objects.get(title="First")
+
+        with CaptureQueriesContext(connection) as ctx:
+            data = RiskDetailSerializer(risk, fields=["risk_id", "closed_date", "unknown"]).data
+
+        self.assertEqual(data, {"risk_id": risk.risk_id, "closed_date": None})
+        self.assertEqual(ctx.captured_queries, [])
+
+    def test_detail_serializer_loads_notes_without_eager_loading(self):
+        risk = Risk.objects.get(title="First")
+        RiskNote.objects.create(risk=risk, note="Escalated", created_by=self.user)
+
+        with CaptureQueriesContext(connection) as ctx:
+            notes = RiskDetailSerializer(risk).data["notes"]
+
+        note_queries = [q for q in ctx.captured_queries if '"risk_risknote"' in q["sql"]]
+        self.assertEqual(len(note_queries), 1)
+        self.assertEqual([note["note"] for note in notes], ["Escalated", "Reviewed"])
+
+    def test_detail_serializer_nests_matrix_without_config(self):
+        matrix = RiskMatrix.objects.create(name="Nested Matrix", created_by=self.user)
+        Risk.objects.filter(title="First").update(risk_matrix=matrix)
+
+        data = RiskDetailSerializer(Risk.objects.get(title="First")).data
+
+        self.assertEqual(
+            data["risk_matrix"], {"id": matrix.pk, "name": "Nested Matrix", "is_default": False}
+        )
+
+    def test_action_detail_serializer_query_count_is_constant(self):
+        for risk in Risk.objects.all():
+            action = RiskAction.objects.create(
+                risk=risk,
+                title=f"Treat {risk.title}",
+                action_type="mitigation",
+                assigned_to=self.user,
+                created_by=self.user,
+                due_date=date.today() + timedelta(days=10),
+            )
+            RiskActionNote.objects.create(action=action, note="Started", created_by=self.user)
+            RiskActionEvidence.objects.create(
+                action=action,
+                title="Plan",
+                evidence_type="document",
+                uploaded_by=self.user,
+                validated_by=self.user,
+            )
+        queryset = RiskActionDetailSerializer.setup_eager_loading(RiskAction.objects.all())
+
+        # Actions with their risk and people, notes with authors, evidence with uploaders
+        with self.assertNumQueries(3):
+            data = RiskActionDetailSerializer(queryset, many=True).data
+
+        self.assertEqual(len(data), 3)
+        self.assertEqual(len(data[0]["evidence"]), 1)
+        self.assertEqual(data[0]["risk_summary"]["risk_owner"], self.user.get_full_name())
+
+    def test_action_risk_summary_without_owner(self):
+        risk = Risk.objects.create(title="Ownerless", description="", impact=1, likelihood=1)
+        action = RiskAction.objects.create(
+            risk=risk,
+            title="Unowned risk action",
+            action_type="mitigation",
+            due_date=date.today() + timedelta(days=10),
+        )
+
+        summary = RiskActionDetailSerializer(action).data["risk_summary"]
+
+        self.assertEqual(summary["risk_id"], risk.risk_id)
+        self.assertEqual(summary["risk_level_display"], risk.get_risk_level_display())
+        self.assertEqual(summary["status_display"], risk.get_status_display())
+        self.assertIsNone(summary["risk_owner"])
+
+    def test_evidence_file_urls_resolve_request_origin_once(self):
+        request = RequestFactory().get("/api/risk/actions/")
+        evidence = [
+            RiskActionEvidence(title=name, file=f"risk_action_evidence/{name}")
+            for name in ("a.pdf", "b.pdf")
+        ]
+        field = RiskActionEvidence._meta.get_field("file")
+
+        with (
+            patch.object(field, "storage", FileSystemStorage(base_url="/media/")),
+            patch.object(
+                request, "build_absolute_uri", wraps=request.build_absolute_uri
+            ) as build_absolute_uri,
+        ):
+            data = RiskActionEvidenceSerializer(
+                evidence, many=True, context={"request": request}
+            ).data
+
+        # DRF's own ``file`` field builds one URL per row; file_url adds only the origin.
+        self.assertEqual(build_absolute_uri.call_count, len(evidence) + 1)
+        build_absolute_uri.assert_any_call("/")
+        self.assertEqual(
+            [row["file_url"] for row in data],
+            [
+                "http://testserver/media/risk_action_evidence/a.pdf",
+                "http://testserver/media/risk_action_evidence/b.pdf",
+            ],
+        )
+
+    def test_evidence_file_url_keeps_absolute_storage_urls(self):
+        request = RequestFactory().get("/api/risk/actions/")
+        evidence = RiskActionEvidence(title="Remote", file="risk_action_evidence/c.pdf")
+        field = RiskActionEvidence._meta.get_field("file")
+
+        with patch.object(
+            field, "storage", FileSystemStorage(base_url="https://files.example.com/")
+        ):
+            data = RiskActionEvidenceSerializer(evidence, context={"request": request}).data
+
+        self.assertEqual(data["file_url"], "https://files.example.com/risk_action_evidence/c.pdf")
@@ -1,6 +1,9 @@
 from datetime import date, timedelta
+from smtplib import SMTPException
 from unittest.mock import patch, MagicMock
+from django.db import connection
 from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.contrib.auth import get_user_model
 from django.utils import timezone
 from celery.exceptions import Retry
@@ -13,10 +16,17 @@ from ..models import (
     RiskActionReminderLog,
 )
 from ..tasks import (
+    _process_user_reminders,
+    process_risk_action_reminder_chunk,
     send_risk_action_due_reminders,
+    summarize_risk_action_reminder_run,
     send_risk_action_weekly_digests,
     send_immediate_risk_action_reminder,
+    send_bulk_risk_action_reminders,
+    send_risk_action_reminder_chunk,
+    summarize_bulk_risk_action_reminders,
     cleanup_old_risk_action_reminder_logs,
+    test_risk_action_reminder_configuration as check_reminder_configuration,
 )
 
 User = get_user_model()
@@ -187,6 +197,113 @@ class RiskActionTaskTest(TestCase):
         # Should only send reminder for user1
         self.assertEqual(mock_send_reminder.call_count, 1)
 
+    @patch("risk.tasks._process_user_reminders", return_value=(0, 0))
+    def test_send_due_reminders_selects_candidates_in_sql(self, mock_process):
+        """Only users with open actions and reminders on reach per-user processing."""
+        unconfigured = User.objects.create_user(
+            username="user3", email="user3@example.com", password="testpass123"
+        )
+        closed_only = User.objects.create_user(
+            username="user4", email="user4@example.com", password="testpass123"
+        )
+        RiskActionReminderConfiguration.objects.filter(user=self.user2).update(
+            email_notifications=False
+        )
+        for user, status in (
+            (self.user1, "pending"),
+            (self.user2, "pending"),
+            (unconfigured, "in_progress"),
+            (closed_only, "completed"),
+        ):
+            RiskAction.objects.create(
+                risk=self.risk,
+                title=f"Action for {user.username}",
+                action_type="mitigation",
+                assigned_to=user,
+                due_date=date.today(),
+                status=status,
+            )
+
+        result = send_risk_action_due_reminders.apply()
+
+        self.assertTrue(result.successful())
+        processed = {call.args[0] for call in mock_process.call_args_list}
+        self.assertEqual(processed, {self.user1, unconfigured})
+        self.assertTrue(RiskActionReminderConfiguration.objects.filter(user=unconfigured).exists())
+        self.assertFalse(RiskActionReminderConfiguration.objects.filter(user=closed_only).exists())
+
+    @patch("risk.notifications.RiskActionReminderService.send_individual_reminder")
+    def test_send_due_reminders_loads_actions_and_logs_once(self, mock_send_reminder):
+        """Actions and reminder logs are read once for the sweep, not once per user."""
+        mock_send_reminder.return_value = True
+        for user in (self.user1, self.user2):
+            for due_in in (-2, 0):
+                RiskAction.objects.create(
+                    risk=self.risk,
+                    title=f"Action for {user.username}",
+                    action_type="mitigation",
+                    assigned_to=user,
+                    due_date=date.today() + timedelta(days=due_in),
+                    status="pending",
+                )
+
+        with CaptureQueriesContext(connection) as ctx:
+            result = send_risk_action_due_reminders.apply()
+
+        self.assertEqual(result.result["total_sent"], 4)
+        selects = [q["sql"] for q in ctx.captured_queries if q["sql"].startswith("SELECT")]
+        self.assertEqual(sum(sql.startswith('SELECT "risk_riskaction".') for sql in selects), 1)
+        self.assertEqual(sum('FROM "risk_riskactionreminderlog"' in sql for sql in selects), 2)
+
+    @patch("risk.tasks.chord")
+    @patch("risk.tasks.REMINDER_CHUNK_SIZE", 1)
+    @patch("risk.notifications.RiskActionReminderService.send_individual_reminder")
+    def test_send_due_reminders_shards_users_across_chunks(self, mock_send_reminder, mock_chord):
+        """Runs larger than one chunk fan out per chunk and are totalled by a callback."""
+        mock_send_reminder.return_value = True
+        for user in (self.user1, self.user2):
+            RiskAction.objects.create(
+                risk=self.risk,
+                title=f"Action for {user.username}",
+                action_type="mitigation",
+                assigned_to=user,
+                due_date=date.today(),
+                status="pending",
+            )
+
+        result = send_risk_action_due_reminders.apply()
+
+        self.assertEqual(result.result["status"], "dispatched")
+        self.assertEqual(result.result["chunks"], 2)
+        header = list(mock_chord.call_args.args[0])
+        self.assertEqual(sorted(sig.args[0] for sig in header), [[self.user1.pk], [self.user2.pk]])
+        self.assertEqual({sig.kwargs["schema_name"] for sig in header}, {connection.schema_name})
+        mock_send_reminder.assert_not_called()
+
+        chunk_results = [
+            process_risk_action_reminder_chunk.apply(sig.args, sig.kwargs).result for sig in header
+        ]
+        summary = summarize_risk_action_reminder_run.apply((chunk_results,)).result
+        self.assertEqual(summary["total_sent"], 2)
+        self.assertEqual(summary["total_processed"], 2)
+
+    @patch("risk.tasks._send_reminders_to_users")
+    @patch("risk.tasks.tenant_schema")
+    def test_reminder_chunk_runs_in_dispatching_schema(self, mock_tenant_schema, mock_send):
+        """Chunk workers switch to the schema of the run that dispatched them."""
+        mock_send.side_effect = lambda user_ids: (
+            mock_tenant_schema.return_value.__enter__.assert_called_once()
+            or {"total_processed": 1, "total_sent": 1}
+        )
+
+        result = process_risk_action_reminder_chunk.apply(
+            ([self.user1.pk],), {"schema_name": "acme"}
+        )
+
+        self.assertEqual(result.result, {"total_processed": 1, "total_sent": 1})
+        mock_tenant_schema.assert_called_once_with("acme")
+        mock_send.assert_called_once_with([self.user1.pk])
+
     @patch("risk.notifications.RiskActionReminderService.send_individual_reminder")
     def test_send_due_reminders_handles_exceptions(self, mock_send_reminder):
         """Test that task handles exceptions gracefully."""
@@ -210,6 +327,50 @@ class RiskActionTaskTest(TestCase):
         # Should attempt all reminders despite one failing
         self.assertEqual(mock_send_reminder.call_count, 3)
 
+    @patch("risk.notifications._render_email", return_value=("<p>Due</p>", "Due"))
+    @patch("risk.notifications.send_mail", side_effect=SMTPException("Connection refused"))
+    def test_send_due_reminders_writes_failure_logs_in_one_batch(self, mock_send, mock_render):
+        """Failed sends across users are logged with a single batched insert."""
+        for user in (self.user1, self.user2):
+            RiskAction.objects.create(
+                risk=self.risk,
+                title=f"Action for {user.username}",
+                action_type="mitigation",
+                assigned_to=user,
+                due_date=date.today(),
+                status="pending",
+            )
+
+        with patch.object(
+            RiskActionReminderLog, "log_many", wraps=RiskActionReminderLog.log_many
+        ) as mock_log_many:
+            result = send_risk_action_due_reminders.apply()
+
+        self.assertTrue(result.successful())
+        mock_log_many.assert_called_once()
+        logs = RiskActionReminderLog.objects.filter(reminder_type="due_today")
+        self.assertEqual({log.user for log in logs}, {self.user1, self.user2})
+        self.assertFalse(any(log.email_sent for log in logs))
+        self.assertEqual({log.error_message for log in logs}, {"Connection refused"})
+
+    @override_settings(EMAIL_BACKEND="django.core.mail.backends.dummy.EmailBackend")
+    @patch("risk.tasks._process_user_reminders")
+    def test_send_due_reminders_skips_when_email_disabled(self, mock_process):
+        """A dummy email backend turns the sweep into a no-op."""
+        RiskAction.objects.create(
+            risk=self.risk,
+            title="Due today",
+            action_type="mitigation",
+            assigned_to=self.user1,
+            due_date=date.today(),
+            status="pending",
+        )
+
+        result = send_risk_action_due_reminders.apply()
+
+        self.assertEqual(result.result["status"], "skipped")
+        mock_process.assert_not_called()
+
     def test_send_due_reminders_prevents_duplicate_daily_reminders(self):
         """Test that duplicate reminders are not sent on same day."""
         action = RiskAction.objects.create(
@@ -276,6 +437,34 @@ class RiskActionTaskTest(TestCase):
         self.assertIn(self.user1, called_users)
         self.assertIn(self.user2, called_users)
 
+    @patch("risk.notifications.RiskActionReminderService.send_weekly_digest")
+    def test_weekly_digest_loads_actions_once(self, mock_send_digest):
+        """Digest actions are read in one query and shared with the risk owner."""
+        mock_send_digest.return_value = True
+        action = RiskAction.objects.create(
+            risk=self.risk,
+            title="User2 Action",
+            action_type="mitigation",
+            assigned_to=self.user2,
+            due_date=date.today() + timedelta(days=5),
+        )
+        own_action = RiskAction.objects.create(
+            risk=self.risk,
+            title="User1 Action",
+            action_type="mitigation",
+            assigned_to=self.user1,
+            due_date=date.today() + timedelta(days=10),
+        )
+
+        with CaptureQueriesContext(connection) as ctx:
+            send_risk_action_weekly_digests.apply()
+
+        selects = [q["sql"] for q in ctx.captured_queries if q["sql"].startswith("SELECT")]
+        self.assertEqual(sum('FROM "risk_riskaction" ' in sql for sql in selects), 1)
+        actions_by_user = {call.args[0]: call.args[1] for call in mock_send_digest.call_args_list}
+        # user1 owns the risk, so sees the action assigned to user2 as well
+        self.assertEqual(actions_by_user, {self.user1: [action, own_action], self.user2: [action]})
+
     @patch("risk.notifications.RiskActionReminderService.send_weekly_digest")
     def test_weekly_digest_respects_user_preferences(self, mock_send_digest):
         """Test that weekly digest respects user preferences."""
@@ -380,6 +569,71 @@ class RiskActionTaskTest(TestCase):
         self.assertEqual(result.result["status"], "error")
         self.assertIn("Temporary failure", result.result["message"])
 
+    @patch("risk.tasks.chord")
+    @patch("risk.tasks.BULK_REMINDER_CHUNK_SIZE", 1)
+    @patch("risk.notifications.RiskActionReminderService.send_individual_reminder")
+    def test_bulk_reminders_shard_actions_across_chunks(self, mock_send_reminder, mock_chord):
+        """Bulk requests larger than one chunk fan out and are totalled by a callback."""
+        mock_send_reminder.side_effect = [True, False]
+        actions = [
+            RiskAction.objects.create(
+                risk=self.risk,
+                title=f"Bulk Action {i}",
+                action_type="mitigation",
+                assigned_to=self.user1,
+                due_date=date.today() + timedelta(days=3),
+            )
+            for i in range(2)
+        ]
+
+        result = send_bulk_risk_action_reminders.apply(([action.pk for action in actions],))
+
+        self.assertEqual(result.result["chunks"], 2)
+        mock_send_reminder.assert_not_called()
+        header = list(mock_chord.call_args.args[0])
+        self.assertEqual({sig.kwargs["schema_name"] for sig in header}, {connection.schema_name})
+        chunk_results = [
+            send_risk_action_reminder_chunk.apply(sig.args, sig.kwargs).result for sig in header
+        ]
+        summary = summarize_bulk_risk_action_reminders.apply((chunk_results,)).result
+        self.assertEqual(summary, {"status": "success", "sent_count": 1, "error_count": 1})
+
+    @patch("risk.tasks._send_action_reminders")
+    @patch("risk.tasks.tenant_schema")
+    def test_bulk_reminder_chunk_runs_in_dispatching_schema(self, mock_tenant_schema, mock_send):
+        """Bulk chunk workers switch to the schema of the request that dispatched them."""
+        mock_send.side_effect = lambda action_ids, reminder_type: (
+            mock_tenant_schema.return_value.__enter__.assert_called_once()
+            or {"sent_count": 1, "error_count": 0}
+        )
+
+        result = send_risk_action_reminder_chunk.apply(([1], "due_today"), {"schema_name": "acme"})
+
+        self.assertEqual(result.result, {"sent_count": 1, "error_count": 0})
+        mock_tenant_schema.assert_called_once_with("acme")
+        mock_send.assert_called_once_with([1], "due_today")
+
+    @patch("risk.notifications.RiskActionReminderService.send_individual_reminder")
+    def test_configuration_test_email_loads_config_with_user(self, mock_send_reminder):
+        """The test email reads the user and their configuration in one query."""
+        mock_send_reminder.return_value = True
+        action = RiskAction.objects.create(
+            risk=self.risk,
+            title="Configuration Test Action",
+            action_type="mitigation",
+            assigned_to=self.user1,
+            due_date=date.today() + timedelta(days=3),
+        )
+
+        with self.assertNumQueries(2):
+            result = check_reminder_configuration.apply((self.user1.pk,)).result
+
+        self.assertEqual(result["action_tested"], action.action_id)
+        self.assertEqual(
+            mock_send_reminder.call_args.kwargs["config"],
+            RiskActionReminderConfiguration.objects.get(user=self.user1),
+        )
+
     def test_cleanup_old_reminder_logs_task(self):
         """Test cleanup of old reminder logs."""
         action = RiskAction.objects.create(
@@ -432,6 +686,30 @@ class RiskActionTaskTest(TestCase):
         remaining_log = RiskActionReminderLog.objects.first()
         self.assertEqual(remaining_log.reminder_type, "due_today")
 
+    def test_cleanup_old_reminder_logs_deletes_in_batches(self):
+        """Old logs are removed a batch per DELETE without loading the rows."""
+        action = RiskAction.objects.create(
+            risk=self.risk,
+            title="Cleanup Batch Action",
+            action_type="mitigation",
+            assigned_to=self.user1,
+            due_date=date.today() + timedelta(days=30),
+        )
+        for reminder_type in ("advance_warning", "due_today", "overdue"):
+            RiskActionReminderLog.objects.create(
+                action=action, user=self.user1, reminder_type=reminder_type, subject="Old"
+            )
+        RiskActionReminderLog.objects.update(sent_at=timezone.now() - timedelta(days=100))
+
+        with CaptureQueriesContext(connection) as ctx:
+            result = cleanup_old_risk_action_reminder_logs.apply(kwargs={"batch_size": 2})
+
+        self.assertEqual(result.result["deleted_count"], 3)
+        self.assertFalse(RiskActionReminderLog.objects.exists())
+        deletes = [q["sql"] for q in ctx.captured_queries if q["sql"].startswith("DELETE")]
+        self.assertEqual(len(deletes), 2)
+        self.assertEqual(len(ctx.captured_queries), 2)
+
     @patch("risk.tasks.logger")
     def test_task_error_logging(self, mock_logger):
         """Test that task errors are properly logged."""
@@ -472,6 +750,47 @@ class RiskActionTaskTest(TestCase):
             self.assertEqual(stats["total_processed"], 3)
             self.assertEqual(stats["total_sent"], 3)
 
+    @patch("risk.notifications.RiskActionReminderService.send_individual_reminder")
+    def test_overdue_frequency_read_in_one_query(self, mock_send_reminder):
+        """Daily overdue reminders skip actions already reminded today, in one log query."""
+        mock_send_reminder.return_value = True
+        actions = {}
+        for title, last_sent_days_ago in (
+            ("Reminded today", 0),
+            ("Reminded before", 2),
+            ("New", None),
+        ):
+            action = RiskAction.objects.create(
+                risk=self.risk,
+                title=title,
+                action_type="mitigation",
+                assigned_to=self.user1,
+                due_date=date.today() - timedelta(days=3),
+                status="pending",
+            )
+            actions[title] = action
+            if last_sent_days_ago is not None:
+                log = RiskActionReminderLog.objects.create(
+                    action=action,
+                    user=self.user1,
+                    reminder_type="overdue",
+                    days_before_due=-1,
+                    email_sent=True,
+                )
+                RiskActionReminderLog.objects.filter(pk=log.pk).update(
+                    sent_at=timezone.now() - timedelta(days=last_sent_days_ago)
+                )
+
+        with CaptureQueriesContext(connection) as ctx:
+            _process_user_reminders(self.user1)
+
+        overdue_queries = [q for q in ctx.captured_queries if "'overdue'" in q["sql"]]
+        self.assertEqual(len(overdue_queries), 1)
+        self.assertEqual(
+            {call.args[0] for call in mock_send_reminder.call_args_list},
+            {actions["Reminded before"], actions["New"]},
+        )
+
     def test_reminder_frequency_control(self):
         """Test that reminder frequency is controlled properly."""
         action = RiskAction.objects.create(
@@ -1,6 +1,7 @@
 import logging
 from rest_framework import viewsets, status, filters, permissions
 from rest_framework.decorators import action
+from rest_framework.renderers import BrowsableAPIRenderer
 from rest_framework.response import Response
 from django.conf import settings
 from django_filters.rest_framework import DjangoFilterBackend
@@ -49,6 +50,7 @@ from .serializers import (
     RiskActionSummarySerializer,
     RiskActionReminderConfigurationSerializer,
 )
+from core.renderers import ORJSONRenderer
 from .filters import RiskFilter, RiskActionFilter
 from .analytics import RiskAnalyticsService, RiskReportGenerator
 from .audit import (
@@ -65,11 +67,53 @@ from .audit import (
 
 logger = logging.getLogger(__name__)
 
+# Dashboard actions return large nested risk lists; encode them with orjson.
+DASHBOARD_RENDERERS = [ORJSONRenderer, BrowsableAPIRenderer]
+
 
 def _log_api_error(message: str, *args: object) -> None:
     logger.error(message, *args, exc_info=settings.DEBUG)
 
 
+class KeysetListMixin:
+    """
+    Serve ``?cursor=`` list requests as keyset pages.
+
+    Pages follow the filterset's ``KEYSET_ORDERING`` rather than ``?ordering=``.
+    An empty ``cursor`` requests the first page; the response carries the next
+    page's cursor in ``X-Next-Cursor`` while more rows remain.
+    """
+
+    cursor_query_param = "cursor"
+    cursor_page_size = 50
+    max_cursor_page_size = 100
+
+    def get_cursor_page_size(self):
+        try:
+            page_size = int(self.request.query_params.get("page_size", self.cursor_page_size))
+        except ValueError:
+            return self.cursor_page_size
+        return max(1, min(page_size, self.max_cursor_page_size))
+
+    def list(self, request, *args, **kwargs):
+        if self.cursor_query_param not in request.query_params:
+            return super().list(request, *args, **kwargs)
+
+        filterset_class = self.filterset_class
+        queryset = self.filter_queryset(self.get_queryset()).order_by(
+            *filterset_class.KEYSET_ORDERING
+        )
+        page_size = self.get_cursor_page_size()
+        # One extra row tells us whether another page exists without a COUNT.
+        rows = list(queryset[: page_size + 1])
+        page = rows[:page_size]
+
+        response = Response(self.get_serializer(page, many=True).data)
+        if len(rows) > page_size:
+            response["X-Next-Cursor"] = filterset_class.encode_cursor(page[-1])
+        return response
+
+
 @extend_schema_view(
     list=extend_schema(
         summary="List risks",
@@ -123,6 +167,18 @@ def _log_api_error(message: str, *args: object) -> None:
                 location=OpenApiParameter.QUERY,
                 description="Search across risk_id, title, description",
             ),
+            OpenApiParameter(
+                name="cursor",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description="Keyset pagination cursor (empty for the first page); the next cursor is returned in the X-Next-Cursor header",
+            ),
+            OpenApiParameter(
+                name="page_size",
+                type=OpenApiTypes.INT,
+                location=OpenApiParameter.QUERY,
+                description="Rows per cursor page (default 50, max 100)",
+            ),
             OpenApiParameter(
                 name="ordering",
                 type=OpenApiTypes.STR,
@@ -148,6 +204,14 @@ def _log_api_error(message: str, *args: object) -> None:
     retrieve=extend_schema(
         summary="Get risk details",
         description="Retrieve detailed information about a specific risk including notes and history.",
+        parameters=[
+            OpenApiParameter(
+                name="fields",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description="Comma-separated fields to include (default: all)",
+            ),
+        ],
         tags=["Risk Management"],
     ),
     update=extend_schema(
@@ -166,7 +230,7 @@ def _log_api_error(message: str, *args: object) -> None:
         tags=["Risk Management"],
     ),
 )
-class RiskViewSet(viewsets.ModelViewSet):
+class RiskViewSet(KeysetListMixin, viewsets.ModelViewSet):
     """
     **Risk Management**
 
@@ -215,19 +279,24 @@ class RiskViewSet(viewsets.ModelViewSet):
     ]
     ordering = ["-risk_level", "-risk_score", "title"]
 
+    # Actions whose responses render risks with RiskListSerializer
+    list_actions = ("list", "summary", "by_category")
+
     def get_queryset(self):
-        """Return risks for the current tenant with optimized queries."""
-        queryset = (
-            Risk.objects.select_related("category", "risk_owner", "risk_matrix", "created_by")
-            .prefetch_related("notes")
-            .alias(risk_score=F("impact") * F("likelihood"))
-        )
+        """Return risks for the current tenant, eager-loading what the response renders."""
+        queryset = Risk.objects.alias(risk_score=F("impact") * F("likelihood"))
+        if self.action in self.list_actions:
+            # List rows skip the matrix join, its matrix_config decode and notes
+            queryset = RiskListSerializer.setup_eager_loading(queryset)
+        elif self.action not in ("create", "update", "partial_update", "destroy"):
+            queryset = RiskDetailSerializer.setup_eager_loading(queryset)
+        if self.action in ("list", "retrieve"):
+            # Serialized per row; aggregate actions must not group by it.
+            queryset = queryset.with_days_until_review()
 
         # Apply common filters
         if self.request.query_params.get("overdue_review"):
-            queryset = queryset.filter(next_review_date__lt=timezone.now().date()).exclude(
-                next_review_date__isnull=True
-            )
+            queryset = queryset.overdue_for_review()
 
         if self.request.query_params.get("active_only"):
             queryset = queryset.filter(
@@ -246,6 +315,13 @@ class RiskViewSet(viewsets.ModelViewSet):
 
         return queryset
 
+    def get_serializer(self, *args, **kwargs):
+        """Render only the ``?fields=`` requested on risk detail responses."""
+        fields = self.request.query_params.get("fields") if self.request else None
+        if self.action == "retrieve" and fields:
+            kwargs["fields"] = [name.strip() for name in fields.split(",")]
+        return super().get_serializer(*args, **kwargs)
+
     def get_serializer_class(self):
         """Return appropriate serializer based on action."""
         if self.action == "list":
@@ -384,7 +460,12 @@ class RiskViewSet(viewsets.ModelViewSet):
 
     @extend_schema(
         summary="Bulk create risks",
-        description="Create multiple risks in a single operation with common defaults and individual overrides.",
+        description=(
+            "Create multiple risks in a single operation with common defaults and individual "
+            "overrides. Every row is validated first, and invalid rows are reported by "
+            "position with a 400. The batch is then created all or nothing: if the insert "
+            "fails, no risk is created and every row is listed in errors."
+        ),
         request=BulkRiskCreateSerializer,
         responses={
             201: OpenApiResponse(
@@ -459,7 +540,7 @@ class RiskViewSet(viewsets.ModelViewSet):
         },
         tags=["Risk Management"],
     )
-    @action(detail=False, methods=["get"])
+    @action(detail=False, methods=["get"], renderer_classes=DASHBOARD_RENDERERS)
     def summary(self, request):
         """Get risk summary and analytics."""
         queryset = self.get_queryset()
@@ -579,7 +660,7 @@ class RiskViewSet(viewsets.ModelViewSet):
         },
         tags=["Risk Management"],
     )
-    @action(detail=False, methods=["get"])
+    @action(detail=False, methods=["get"], renderer_classes=DASHBOARD_RENDERERS)
     def by_category(self, request):
         """Get risks grouped by category."""
         queryset = self.get_queryset()
@@ -665,7 +746,8 @@ class RiskCategoryViewSet(viewsets.ModelViewSet):
     Categories help in grouping related risks and generating targeted reports.
     """
 
-    queryset = RiskCategory.objects.all()
+    # Counted in one GROUP BY rather than a COUNT per serialized category
+    queryset = RiskCategory.objects.annotate(risk_count=Count("risks"))
     serializer_class = RiskCategorySerializer
     permission_classes = [permissions.IsAuthenticated]
     ordering = ["name"]
@@ -769,6 +851,18 @@ class RiskMatrixViewSet(viewsets.ModelViewSet):
                 location=OpenApiParameter.QUERY,
                 description="Search across action_id, title, description, risk details",
             ),
+            OpenApiParameter(
+                name="cursor",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description="Keyset pagination cursor (empty for the first page); the next cursor is returned in the X-Next-Cursor header",
+            ),
+            OpenApiParameter(
+                name="page_size",
+                type=OpenApiTypes.INT,
+                location=OpenApiParameter.QUERY,
+                description="Rows per cursor page (default 50, max 100)",
+            ),
             OpenApiParameter(
                 name="ordering",
                 type=OpenApiTypes.STR,
@@ -804,7 +898,7 @@ class RiskMatrixViewSet(viewsets.ModelViewSet):
         tags=["Risk Actions"],
     ),
 )
-class RiskActionViewSet(viewsets.ModelViewSet):
+class RiskActionViewSet(KeysetListMixin, viewsets.ModelViewSet):
     """
     **Risk Action Management**
 
@@ -853,27 +947,26 @@ class RiskActionViewSet(viewsets.ModelViewSet):
     ]
     ordering = ["due_date", "-priority", "title"]
 
+    # Actions whose responses render actions with RiskActionListSerializer
+    list_actions = ("list", "summary", "by_risk")
+
     def get_queryset(self):
-        """Return risk actions for the current tenant with optimized queries."""
-        queryset = RiskAction.objects.select_related(
-            "risk", "risk__category", "assigned_to", "created_by"
-        ).prefetch_related("notes", "evidence")
+        """Return risk actions for the current tenant, eager-loading what the response renders."""
+        queryset = RiskAction.objects.all()
+        if self.action in self.list_actions:
+            queryset = RiskActionListSerializer.setup_eager_loading(queryset)
+        elif self.action not in ("create", "update", "partial_update", "destroy"):
+            queryset = RiskActionDetailSerializer.setup_eager_loading(queryset)
+        if self.action in ("list", "retrieve"):
+            # Serialized per row; aggregate actions must not group by it.
+            queryset = queryset.with_days_until_due()
 
         # Apply common filters
         if self.request.query_params.get("overdue"):
-            queryset = queryset.filter(
-                due_date__lt=timezone.now().date(),
-                status__in=["pending", "in_progress", "deferred"],
-            )
+            queryset = queryset.overdue()
 
         if self.request.query_params.get("due_soon"):
-            today = timezone.now().date()
-            week_from_now = today + timedelta(days=7)
-            queryset = queryset.filter(
-                due_date__gte=today,
-                due_date__lte=week_from_now,
-                status__in=["pending", "in_progress", "deferred"],
-            )
+            queryset = queryset.due_soon()
 
         if self.request.query_params.get("active_only"):
             queryset = queryset.filter(status__in=["pending", "in_progress", "deferred"])
@@ -1071,7 +1164,12 @@ class RiskActionViewSet(viewsets.ModelViewSet):
 
     @extend_schema(
         summary="Bulk create risk actions",
-        description="Create multiple risk actions in a single operation for efficiency.",
+        description=(
+            "Create multiple risk actions in a single operation for efficiency. Every row "
+            "is validated first, and invalid rows are reported by position with a 400. "
+            "The batch is then created all or nothing: if the insert fails, no action "
+            "is created and every row is listed in errors."
+        ),
         request=RiskActionBulkCreateSerializer,
         responses={
             201: OpenApiResponse(
@@ -1082,7 +1180,7 @@ class RiskActionViewSet(viewsets.ModelViewSet):
                         summary="Successful bulk creation with results",
                         value={
                             "created_count": 8,
-                            "error_count": 2,
+                            "error_count": 0,
                             "created_actions": [],
                             "errors": [],
                         },